@@ -0,0 +1,226 @@
+# backfill.py
+"""
+게시판의 과거 공지 전체를 검색 보관소(archive.db)로 가져오기 (봇과 별개로 실행)
+
+    python backfill.py              # boards.json 의 모든 게시판
+    python backfill.py school dept  # 일부 게시판만 (key)
+    python backfill.py --restart    # 저장된 진행 상황 무시하고 처음부터
+
+중간에 끊겨도 다시 실행하면 마지막으로 저장된 페이지부터 이어서 진행.
+본문을 못 받은 공지는 보관하지 않고 진행 상황에 남겨뒀다가 다음 실행 때 다시 받음.
+"""
+import argparse
+import asyncio
+import time
+from dataclasses import asdict
+
+from config import (
+    BACKFILL_PAGE_SIZE,
+    BACKFILL_PAGE_CONCURRENCY,
+    BACKFILL_DETAIL_CONCURRENCY,
+    BACKFILL_RETRIES,
+    PARSE_EXECUTOR,
+)
+from crawler.notice_detail import fetch_notice_detail_async
+from crawler.notices import fetch_notice_page
+from models.board import BoardConfig
+from models.notice import Notice
+from services.board_registry import load_boards
+from services.notice_archive import NoticeArchive, get_notice_archive
+from services.state_store import NS_BACKFILL, StateStore, get_state_store
+from utils.http_client import init_http
+from utils.process_pool import warm_process_pool
+
+
+async def _retry(func, *args, **kwargs):
+    for attempt in range(BACKFILL_RETRIES + 1):
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            if attempt == BACKFILL_RETRIES:
+                raise
+            await asyncio.sleep(2**attempt)
+
+
+class Backfill:
+    """
+    목록 페이지는 page_concurrency 개씩 묶어서 동시에, 상세는 detail_sem 안에서 동시에 받고
+    묶음 단위로 보관소에 한 번에 저장한 뒤 진행 상황(다음 페이지)을 기록
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        archive: NoticeArchive,
+        *,
+        page_size: int = BACKFILL_PAGE_SIZE,
+        page_concurrency: int = BACKFILL_PAGE_CONCURRENCY,
+        detail_concurrency: int = BACKFILL_DETAIL_CONCURRENCY,
+        max_pages: int | None = None,
+    ):
+        self.store = store
+        self.archive = archive
+        self.page_size = page_size
+        self.page_concurrency = page_concurrency
+        self.detail_sem = asyncio.Semaphore(detail_concurrency)
+        self.max_pages = max_pages
+
+    def _start_page(self, progress: dict, page_size: int) -> int:
+        page = progress.get("next_page", 1)
+        old_size = progress.get("page_size") or page_size
+        if old_size != page_size:
+            # 페이지 크기가 바뀌었으면 이미 지난 글 수 기준으로 환산 (겹치는 글은 보관소에서 무시됨)
+            page = (page - 1) * old_size // page_size + 1
+        return page
+
+    async def _page_size(self, board: BoardConfig, progress: dict) -> int:
+        """
+        서버가 요청한 페이지 크기를 따르는지 확인.
+        크기를 무시하고 기본 개수만 주는 서버에 큰 크기로 offset 을 넘기면 그 사이 글을 건너뛰므로
+        1페이지가 덜 찼으면 받은 개수 기준 2페이지를 받아봄 → 새 글이 있으면 그 개수를 페이지 크기로 사용
+        """
+        if progress.get("server_page_size"):
+            return progress["server_page_size"]
+        first = await _retry(fetch_notice_page, board.url, 1, self.page_size)
+        n = len(first)
+        if n == 0 or n >= self.page_size:
+            return self.page_size
+
+        second = await _retry(fetch_notice_page, board.url, 2, n)
+        first_ids = {x.notice_id for x in first}
+        if any(x.notice_id not in first_ids for x in second):
+            print(f"[{board.key}] 서버가 페이지 크기 {self.page_size} 를 무시함 → {n}개씩 진행")
+            return n
+        return self.page_size
+
+    async def _detail_text(self, n: Notice) -> str | None:
+        async with self.detail_sem:
+            try:
+                # 보관소에는 본문만 필요 → 이미지 디코딩/첨부 링크 수집 생략
+                detail = await _retry(fetch_notice_detail_async, n.url, fields={"text"})
+            except Exception:
+                return None
+        return detail.get("text") or ""
+
+    async def _import(self, board: BoardConfig, notices: list[Notice]) -> tuple[int, list[Notice]]:
+        """
+        본문을 받아 보관 → (저장 개수, 본문을 못 받은 공지). 못 받은 공지는 보관하지 않음
+        (빈 본문으로 저장하면 다음 실행에서 이미 있는 글로 보고 다시 받지 않으므로)
+        """
+        texts = await asyncio.gather(*(self._detail_text(n) for n in notices))
+        imported = await self.archive.aadd_many(
+            [(board.key, board.label, n, t) for n, t in zip(notices, texts) if t is not None]
+        )
+        return imported, [n for n, t in zip(notices, texts) if t is None]
+
+    async def run_board(self, board: BoardConfig, *, restart: bool = False) -> None:
+        progress = {} if restart else self.store.get(NS_BACKFILL, board.key) or {}
+        imported = progress.get("imported", 0)
+        retry = [Notice(**d) for d in progress.get("retry", [])]
+
+        # 지난 실행에서 본문을 못 받은 공지 먼저 다시
+        if retry:
+            count, retry = await self._import(board, retry)
+            imported += count
+            progress = {**progress, "imported": imported, "retry": [asdict(n) for n in retry]}
+            await self.store.aset(NS_BACKFILL, board.key, progress)
+
+        if progress.get("done"):
+            print(
+                f"[{board.key}] 이미 완료, 본문 실패 {len(retry)}건 남음 (다시 하려면 --restart)"
+            )
+            return
+
+        page_size = await self._page_size(board, progress)
+        page = self._start_page(progress, page_size)
+        seen: set[str] = set()  # 모든 페이지 상단에 고정된 공지 중복 제거
+        started = time.perf_counter()
+        done = False
+
+        while not done:
+            pages = [page + i for i in range(self.page_concurrency)]
+            if self.max_pages is not None:
+                pages = [p for p in pages if p <= self.max_pages]
+                if not pages:
+                    break
+
+            results = await asyncio.gather(
+                *(_retry(fetch_notice_page, board.url, p, page_size) for p in pages)
+            )
+
+            notices: list[Notice] = []
+            used = 0
+            for items in results:
+                fresh = [n for n in items if n.notice_id not in seen]
+                if not fresh:
+                    done = True  # 빈 페이지(또는 고정 공지뿐) = 마지막 페이지 다음
+                    break
+                seen.update(n.notice_id for n in fresh)
+                notices.extend(fresh)
+                used += 1
+
+            known = await self.archive.known_ids(board.key, [n.notice_id for n in notices])
+            count, failed = await self._import(
+                board, [n for n in notices if n.notice_id not in known]
+            )
+            imported += count
+            retry.extend(failed)
+
+            page += used
+            await self.store.aset(
+                NS_BACKFILL,
+                board.key,
+                {
+                    "next_page": page,
+                    "page_size": page_size,
+                    "server_page_size": page_size if page_size != self.page_size else None,
+                    "imported": imported,
+                    "failed": len(retry),
+                    "retry": [asdict(n) for n in retry],
+                    "done": done,
+                },
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"[{board.key}] ~{page - 1}페이지, 저장 {imported}건"
+                f" (본문 실패 {len(retry)}), {elapsed:.0f}초"
+            )
+
+        print(
+            f"[{board.key}] 끝: 저장 {imported}건, 본문 실패 {len(retry)}건 (다음 실행 때 다시 시도)"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    boards = load_boards()
+    if args.boards:
+        boards = [b for b in boards if b.key in args.boards]
+        missing = set(args.boards) - {b.key for b in boards}
+        if missing:
+            raise SystemExit(f"boards.json 에 없는 게시판: {', '.join(sorted(missing))}")
+
+    backfill = Backfill(
+        get_state_store(),
+        get_notice_archive(),
+        page_size=args.page_size,
+        page_concurrency=args.page_concurrency,
+        detail_concurrency=args.detail_concurrency,
+        max_pages=args.max_pages,
+    )
+    # 같은 서버에 부담 주지 않도록 게시판은 하나씩
+    for board in boards:
+        await backfill.run_board(board, restart=args.restart)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="과거 공지를 검색 보관소로 가져오기")
+    parser.add_argument("boards", nargs="*", help="게시판 key (생략하면 전부)")
+    parser.add_argument("--restart", action="store_true", help="처음부터 다시")
+    parser.add_argument("--page-size", type=int, default=BACKFILL_PAGE_SIZE)
+    parser.add_argument("--page-concurrency", type=int, default=BACKFILL_PAGE_CONCURRENCY)
+    parser.add_argument("--detail-concurrency", type=int, default=BACKFILL_DETAIL_CONCURRENCY)
+    parser.add_argument("--max-pages", type=int, default=None)
+    init_http()
+    if PARSE_EXECUTOR == "process":
+        warm_process_pool()  # 상세 페이지 파싱이 대부분이라 코어 수만큼 병렬로
+    asyncio.run(main(parser.parse_args()))
@@ -1,8 +1,20 @@
 # bot/commands.py
+import asyncio
+import io
+import time
+
 import discord
 from discord.ext import commands
 
+from services.notice_archive import get_notice_archive
+from services.notice_scheduler import NoticeScheduler
 from services.role_watcher import create_role_watcher
+from services.subscriptions import (
+    MODE_DM,
+    MODE_MENTION,
+    SubscriptionError,
+    get_subscriptions,
+)
 
 # 인사
 # def setup_commands(bot: commands.Bot) -> None:
@@ -37,3 +49,99 @@ def setup_role_commands(bot: commands.Bot):
         await ctx.send(
             f"완료! 역할 선택 메시지를 생성/갱신했습니다. (message_id={msg.id})"
         )
+
+
+def setup_subscription_commands(bot: commands.Bot):
+    subs = get_subscriptions()
+
+    @bot.command(name="구독", help="키워드 구독 (예: ?구독 장학금)")
+    async def subscribe(ctx: commands.Context, *, keyword: str):
+        try:
+            kw = await subs.subscribe(ctx.author.id, keyword)
+        except SubscriptionError as e:
+            await ctx.send(str(e))
+            return
+        await ctx.send(f"'{kw}' 키워드를 구독했습니다.")
+
+    @bot.command(name="구독취소", help="키워드 구독 취소 (예: ?구독취소 장학금)")
+    async def unsubscribe(ctx: commands.Context, *, keyword: str):
+        if await subs.unsubscribe(ctx.author.id, keyword):
+            await ctx.send(f"'{keyword.strip()}' 구독을 취소했습니다.")
+        else:
+            await ctx.send("구독 중인 키워드가 아닙니다.")
+
+    @bot.command(name="구독목록", help="내 구독 키워드 보기")
+    async def subscriptions(ctx: commands.Context):
+        keywords = subs.keywords(ctx.author.id)
+        if not keywords:
+            await ctx.send("구독 중인 키워드가 없습니다. (?구독 키워드)")
+            return
+        how = "DM" if subs.mode(ctx.author.id) == MODE_DM else "멘션"
+        await ctx.send(f"구독 키워드 ({how}): " + ", ".join(keywords))
+
+    @bot.command(name="구독알림", help="알림 방식 변경 (?구독알림 멘션 / ?구독알림 DM)")
+    async def subscription_mode(ctx: commands.Context, mode: str):
+        value = {"멘션": MODE_MENTION, "dm": MODE_DM}.get(mode.strip().lower())
+        if value is None:
+            await ctx.send("'멘션' 또는 'DM' 으로 입력하세요.")
+            return
+        await subs.set_mode(ctx.author.id, value)
+        await ctx.send(f"알림 방식을 {mode.strip()}(으)로 바꿨습니다.")
+
+
+def setup_search_commands(bot: commands.Bot):
+    archive = get_notice_archive()
+
+    @bot.command(name="검색", help="지난 공지 검색 (예: ?검색 장학금)")
+    async def search(ctx: commands.Context, *, query: str):
+        results = await archive.search(query)
+        if not results:
+            await ctx.send(f"'{query}' 검색 결과가 없습니다.")
+            return
+
+        lines = [f"🔎 '{query}' 검색 결과"]
+        for r in results:
+            lines.append(f"- [{r.label}] **{r.title}** ({r.date or '-'})\n  <{r.url}>")
+        await ctx.send("\n".join(lines)[:2000])
+
+
+PROFILE_TIMEOUT_SECONDS = 600  # 다음 사이클을 기다리는 최대 시간
+
+
+def setup_profile_commands(bot: commands.Bot, scheduler: NoticeScheduler | None):
+    """
+    scheduler: 이 프로세스에서 크롤링 중일 때만 (RUN_MODE=bot/split 이면 워커 프로세스라 None)
+    """
+
+    @bot.command(name="profile", help="게시판 다음 사이클 프로파일링 (관리자 전용, 예: ?profile school)")
+    async def profile(ctx: commands.Context, key: str):
+        if not ctx.author.guild_permissions.administrator:
+            await ctx.send("관리자만 사용할 수 있습니다.")
+            return
+
+        if scheduler is None:
+            await ctx.send("크롤링이 별도 워커 프로세스에서 실행 중이라 프로파일링할 수 없습니다. (RUN_MODE=all 에서 사용)")
+            return
+
+        try:
+            fut = scheduler.profile_next(key)
+        except KeyError:
+            keys = ", ".join(w.key for w in scheduler.watchers)
+            await ctx.send(f"없는 게시판입니다. ({keys})")
+            return
+
+        await ctx.send(f"'{key}' 다음 사이클을 프로파일링합니다...")
+        try:
+            report = await asyncio.wait_for(asyncio.shield(fut), timeout=PROFILE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            await ctx.send("시간 안에 사이클이 끝나지 않았습니다. 끝나면 다시 시도하세요.")
+            return
+        except Exception as e:
+            await ctx.send(f"프로파일링하지 못했습니다: {e!r}")
+            return
+
+        filename = f"profile_{key}_{time.strftime('%Y%m%d_%H%M%S')}.txt"
+        await ctx.send(
+            f"'{key}' 사이클 프로파일 결과",
+            file=discord.File(io.BytesIO(report.encode("utf-8")), filename=filename),
+        )
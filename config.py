@@ -19,15 +19,74 @@ ROLE_LEAVE = 1366421630510698509
 
 ROLE_CHANNEL_ID = ""
 ROLE_MESSAGE_ID_FILE = "role_message_id.txt"
+ROLE_STATE_FILE = "role_state.json"  # (구버전) 최초 실행 시 state.db 로 가져옴
 
 
 # 공지 ( 갱신 시간, 마지막 공지 ID저장 파일)
-CHECK_INTERVAL_SECONDS = 3600 * 3
-STATE_FILE = "state.json"
-# 학교 공지
-SCHOOL_NOTICE_URL = "https://www.yc.ac.kr/www/yc-notice.do"
-SCHOOL_NOTICE_CHANNEL_ID = 1454852316556689548
-
-# 학과 공지
-DEPT_NOTICE_URL = "https://www.yc.ac.kr/smartsw/notice.do"
-DEPT_NOTICE_CHANNEL_ID = 1454852468088508662
+# 목록은 조건부 요청/본문 해시로 바뀐 경우에만 파싱하므로 짧게 잡아도 부담 적음
+CHECK_INTERVAL_SECONDS = 60 * 5
+STATE_FILE = "state.json"  # (구버전) 최초 실행 시 state.db 로 가져옴
+STATE_DB_FILE = "state.db"  # 공지 커서/역할 메시지 등 상태 저장 (SQLite WAL)
+NOTICE_FETCH_CONCURRENCY = 4  # 한 사이클 안에서 상세/이미지 동시 요청 수
+POSTED_RETENTION_DAYS = 30  # 올린 공지(message_id) 기록 보관 기간
+POSTED_RECHECK_LIMIT = 5  # 매 사이클 수정 여부를 다시 확인할 최근 공지 수
+LIST_CACHE_FILE = "list_cache.json"  # (구버전) 목록 페이지 ETag/해시, state.db 로 가져옴
+# 상세 페이지 파싱 결과 캐시 (폴더, 최대 용량)
+DETAIL_CACHE_DIR = "cache/detail"
+DETAIL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DETAIL_MAX_TEXT = 8000  # 상세 본문 최대 길이 (넘으면 자르고 남은 표는 렌더링 생략)
+# 첨부 이미지 전처리 (Discord 업로드 한도 고려: 공지 1개당 최대 2장)
+IMAGE_MAX_BYTES = 4 * 1024 * 1024
+IMAGE_MAX_DIMENSION = 2048
+INLINE_IMAGE_MAX_BYTES = 20 * 1024 * 1024  # 본문 data:image 디코딩 최대 크기 (넘으면 건너뜀)
+# 이미지 저장소 (원본/변환본, SHA-256 기준 중복 제거)
+IMAGE_STORE_DIR = "cache/images"
+IMAGE_STORE_MAX_BYTES = 256 * 1024 * 1024
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", "2"))  # CPU 작업용 프로세스 풀 크기 (0이면 CPU 수)
+# 목록/상세 HTML 파싱 위치: "thread"(기본) / "process"(프로세스 풀, 코어 수만큼 병렬)
+PARSE_EXECUTOR = os.getenv("PARSE_EXECUTOR", "thread")
+# HTML 파서 엔진: "auto"(lxml 있으면 lxml) / "lxml" / "html.parser"
+HTML_PARSER = os.getenv("HTML_PARSER", "auto")
+# 게시판 목록 (URL/채널/라벨/멘션 역할/간격) → boards.json
+BOARDS_FILE = "boards.json"
+SCHEDULER_MAX_CONCURRENT = 4  # 동시에 크롤링하는 게시판 수
+# 확인 간격 자동 조절 (게시판별 요일×시간 새 글 빈도 학습)
+# 학습 기록이 1주일 미만이면 CHECK_INTERVAL_SECONDS(또는 게시판 interval_seconds) 사용
+POLL_MIN_INTERVAL_SECONDS = 60 * 5  # 바쁜 시간대 최소 간격 (boards.json 에서 게시판별 변경 가능)
+POLL_MAX_INTERVAL_SECONDS = 60 * 60 * 3  # 한가한 시간대(밤/주말) 최대 간격
+POLL_REQUEST_COST_SECONDS = 120  # 요청 1번을 공지 지연 몇 초로 볼지 (클수록 덜 자주 확인)
+POLL_HISTORY_HALF_LIFE_DAYS = 28  # 오래된 기록 반감기
+POLL_UTC_OFFSET_HOURS = 9  # 시간대 계산 기준 (KST)
+# 공지 전송 큐 (Discord 채널당 5개/5초 제한, 실패 시 지수 백오프 재시도)
+SEND_RATE_PER_CHANNEL = 5
+SEND_RATE_WINDOW_SECONDS = 5
+SEND_MAX_RETRIES = 5
+SEND_RETRY_BASE_SECONDS = 2
+# 키워드 구독 (?구독 / ?구독취소 / ?구독목록 / ?구독알림)
+SUBSCRIPTION_MAX_KEYWORDS = 20  # 1인당 최대 키워드 수
+SUBSCRIPTION_DM_CONCURRENCY = 2  # 동시에 보내는 DM 수
+# 공지 보관/검색 (?검색, SQLite FTS5)
+ARCHIVE_DB_FILE = "archive.db"
+ARCHIVE_SEARCH_LIMIT = 5  # 검색 결과 수
+# 과거 공지 가져오기 (python backfill.py)
+BACKFILL_PAGE_SIZE = 50  # 목록 1페이지에 요청할 글 수
+BACKFILL_PAGE_CONCURRENCY = 3  # 동시에 받는 목록 페이지 수
+BACKFILL_DETAIL_CONCURRENCY = 6  # 동시에 받는 상세 페이지 수
+BACKFILL_RETRIES = 3
+# 실행 방식 (환경변수 RUN_MODE)
+# "all": 한 프로세스에서 봇+크롤링 / "split": 크롤링은 워커 프로세스로 분리해서 같이 실행
+# "bot": 봇만 (outbox 에서 받아서 전송) / "worker": 크롤링만 (Discord 연결 없음)
+RUN_MODE = os.getenv("RUN_MODE", "all")
+OUTBOX_POLL_SECONDS = 2  # 봇이 outbox 를 확인하는 간격
+OUTBOX_BATCH = 50  # 한 번에 읽는 outbox 항목 수
+OUTBOX_MAX_ATTEMPTS = 5  # 이만큼 실패하면 항목 포기 (4xx 등 영구 오류는 바로)
+# 메트릭 (Prometheus 텍스트 형식, http://127.0.0.1:9108/metrics), 0 이면 끔
+# RUN_MODE=split 이면 워커 프로세스는 METRICS_PORT + 1
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+# 사이클 추적 기록 (HTTP 요청/단계별 시간, JSONL), "" 이면 끔
+# 요약: python -m utils.trace_journal
+TRACE_JOURNAL_FILE = os.getenv("TRACE_JOURNAL_FILE", "logs/trace.jsonl")
+TRACE_JOURNAL_MAX_BYTES = 10 * 1024 * 1024  # 넘으면 .1, .2 ... 로 돌려씀
+TRACE_JOURNAL_BACKUPS = 3
+TRACE_JOURNAL_FLUSH_SECONDS = 1.0
@@ -0,0 +1,161 @@
+# crawler/detail_cache.py
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from utils.atomic_file import write_atomic
+from utils.image_store import ImageStore
+
+
+ALL_FIELDS = frozenset({"text", "images", "files"})
+
+
+def detail_limits(
+    fields=None, max_images: int | None = None, max_text: int | None = None
+) -> dict:
+    """
+    파싱 범위 (캐시에 같이 저장해서 더 넓은 범위 요청이면 다시 파싱)
+    """
+    return {
+        "fields": sorted(ALL_FIELDS if fields is None else set(fields) & ALL_FIELDS),
+        "max_images": max_images,
+        "max_text": max_text,
+    }
+
+
+def limits_cover(stored: dict | None, wanted: dict) -> bool:
+    """stored 범위로 파싱한 결과를 wanted 요청에 그대로 써도 되는지"""
+    if stored is None:
+        stored = detail_limits()  # 범위 기록이 없으면 전체 파싱 결과
+    if not set(wanted["fields"]) <= set(stored["fields"]):
+        return False
+    for key in ("max_images", "max_text"):
+        have, need = stored.get(key), wanted.get(key)
+        if have is not None and (need is None or need > have):
+            return False
+    return True
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+class DetailCache:
+    """
+    상세 페이지 파싱 결과 디스크 캐시 (detail_url + 응답 해시 기준).
+    - 파싱 결과(text/images/files)는 항목별 JSON, data:image 는 이미지 저장소(sha256)에 저장
+    - ETag / Last-Modified 를 같이 저장해서 조건부 요청으로 싸게 재검증
+    - 전체 크기가 max_bytes 를 넘으면 오래 안 쓴 항목부터 삭제(LRU)
+    """
+
+    def __init__(self, root: str, max_bytes: int, blob_store: ImageStore):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.blob_store = blob_store
+        self._index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._index: OrderedDict[str, dict] = self._load_index()
+
+    # ── index ──
+    def _load_index(self) -> OrderedDict:
+        if not os.path.exists(self._index_path):
+            return OrderedDict()
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return OrderedDict(json.load(f) or {})
+        except Exception:
+            return OrderedDict()
+
+    def _save_index(self) -> None:
+        write_atomic(
+            self._index_path, json.dumps(self._index, ensure_ascii=False).encode("utf-8")
+        )
+
+    def _entry_path(self, url: str) -> str:
+        return os.path.join(self.root, _url_key(url) + ".json")
+
+    # ── 조회 ──
+    def get(self, url: str, limits: dict | None = None) -> dict | None:
+        """
+        네트워크 없이 캐시된 파싱 결과 반환 (없거나 limits 보다 좁게 파싱된 결과면 None)
+        image_blobs 는 bytes 대신 이미지 저장소 sha256 참조로 반환
+        """
+        with self._lock:
+            meta = self._index.get(url)
+            if meta is None:
+                return None
+            if limits is not None and not limits_cover(meta.get("limits"), limits):
+                return None
+            self._index.move_to_end(url)
+        return self._read(url)
+
+    def get_if_hash(self, url: str, digest: str, limits: dict | None = None) -> dict | None:
+        meta = self._index.get(url)
+        if not meta or meta.get("hash") != digest:
+            return None
+        return self.get(url, limits)
+
+    def request_headers(self, url: str) -> dict:
+        meta = self._index.get(url) or {}
+        h = {}
+        if meta.get("etag"):
+            h["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            h["If-Modified-Since"] = meta["last_modified"]
+        return h
+
+    def _read(self, url: str) -> dict | None:
+        try:
+            with open(self._entry_path(url), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data["image_blobs"] = data.pop("blob_refs", [])
+            return data
+        except Exception:
+            # 파일이 깨졌거나 지워졌으면 캐시 미스로 취급
+            with self._lock:
+                self._index.pop(url, None)
+            return None
+
+    # ── 저장 ──
+    def put(
+        self, url: str, digest: str, headers, detail: dict, limits: dict | None = None
+    ) -> None:
+        refs = []
+        for blob in detail.get("image_blobs", []) or []:
+            sha = blob.get("sha256")
+            if sha is None:
+                sha = self.blob_store.put(blob.get("bytes") or b"", blob.get("ext") or "jpg")
+                blob["sha256"] = sha  # 호출한 쪽에서 다시 해시하지 않도록 참조 표시
+            refs.append({"mime": blob.get("mime"), "ext": blob.get("ext"), "sha256": sha})
+
+        data = {k: v for k, v in detail.items() if k != "image_blobs"}
+        data["blob_refs"] = refs
+        encoded = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        size = len(encoded)
+
+        write_atomic(self._entry_path(url), encoded)
+
+        with self._lock:
+            self._index[url] = {
+                "hash": digest,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "size": size,
+                "limits": limits or detail_limits(),
+            }
+            self._index.move_to_end(url)
+            self._evict()
+            self._save_index()
+
+    def _evict(self) -> None:
+        total = sum(m.get("size", 0) for m in self._index.values())
+        while total > self.max_bytes and len(self._index) > 1:
+            url, meta = self._index.popitem(last=False)
+            total -= meta.get("size", 0)
+            try:
+                os.remove(self._entry_path(url))
+            except OSError:
+                pass
@@ -0,0 +1,77 @@
+# crawler/list_cache.py
+import hashlib
+import re
+
+# 조회수 칸 (구버전 td.td_num / 새 버전 span.hit). 글이 그대로여도 읽을 때마다 바뀌므로 해시에서 뺌
+# (td.td_num2 는 글 번호라 그대로 둠)
+_VOLATILE_CELL_RE = re.compile(
+    rb"<(td|span)\b[^>]*\bclass\s*=\s*[\"'][^\"']*(?<![\w-])(?:td_num|hit)(?![\w-])[^>]*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def body_digest(content: bytes) -> str:
+    """
+    목록 페이지의 게시글 표(tbody) 부분만 해시.
+    (페이지 다른 곳의 토큰/시간 같은 값 때문에 매번 달라지는 것 방지)
+    조회수 칸은 빼고 해시 (글 번호/제목/작성자/날짜가 같으면 같은 목록)
+    """
+    start = content.find(b"<tbody")
+    end = content.rfind(b"</tbody>")
+    if start != -1 and end > start:
+        content = content[start:end]
+    content = _VOLATILE_CELL_RE.sub(b"", content)
+    return hashlib.sha256(content).hexdigest()
+
+
+class ListPageCache:
+    """
+    목록 페이지 조건부 요청용 캐시.
+    - 서버가 지원하면 ETag / Last-Modified 로 If-None-Match / If-Modified-Since 전송
+    - 지원 안 하면 본문 해시가 지난 사이클과 같을 때 파싱 생략
+    - 새 값은 pending 으로 들고 있다가 사이클이 성공하면 commit() 으로 저장
+      (전송 중 실패하면 다음 사이클에 다시 파싱되도록)
+    - 저장은 상태 저장소(services.state_store.StateStore)의 namespace 에
+    """
+
+    def __init__(self, store, namespace: str = "list_cache"):
+        self.store = store
+        self.namespace = namespace
+        self._pending: dict[str, dict] = {}
+
+    def _entry(self, url: str) -> dict:
+        return self.store.get(self.namespace, url) or {}
+
+    def request_headers(self, url: str) -> dict:
+        entry = self._entry(url)
+        h = {}
+        if entry.get("etag"):
+            h["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            h["If-Modified-Since"] = entry["last_modified"]
+        return h
+
+    def is_unchanged(self, url: str, status: int, headers, content: bytes) -> bool:
+        """
+        304 이거나 본문 해시가 저장된 값과 같으면 True.
+        바뀐 경우 새 검증값을 pending 에 기록.
+        """
+        if status == 304:
+            return True
+
+        digest = body_digest(content)
+        if self._entry(url).get("hash") == digest:
+            return True
+
+        self._pending[url] = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "hash": digest,
+        }
+        return False
+
+    async def commit(self, url: str) -> None:
+        entry = self._pending.pop(url, None)
+        if entry is None:
+            return
+        await self.store.aset(self.namespace, url, entry)
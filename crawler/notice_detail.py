@@ -1,97 +1,53 @@
 # crawlers/notice_detail.py
 from urllib.parse import urljoin, urlsplit
+import asyncio
+import hashlib
 import re
-from utils.http_client import get as http_get
-import base64
-from bs4 import BeautifulSoup
+from utils.http_client import aget as http_aget, decode_body, get as http_get, response_encoding
+import binascii
+from crawler.detail_cache import ALL_FIELDS, DetailCache, detail_limits
+from crawler.parser import DETAIL_STRAINER, make_soup
+from crawler.table_layout import grid_to_codeblock, table_to_grid
+from config import INLINE_IMAGE_MAX_BYTES
+from crawler.text_normalizer import (
+    is_noisy_text,
+    line_stats,
+    normalize_broken_text,
+    normalize_cell_text,
+    split_lines,
+)
+from utils.image_processing import sniff_image_type
+from utils.metrics import PARSE_SECONDS
+from utils.process_pool import run_parse
+from utils.trace_journal import span
 
 # javascript:fn_egov_downFile('ATCH_FILE_ID','1');
 DOWN_RE = re.compile(
     r"fn_egov_downFile\(\s*'([^']+)'\s*,\s*'([^']+)'\s*\)", re.IGNORECASE
 )
 
-# data:image/png;base64,....
-DATA_URL_RE = re.compile(r"^data:(image/[a-zA-Z0-9.+-]+);base64,(.+)$", re.DOTALL)
-
-
-def _is_noisy_text(text: str) -> bool:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    if len(lines) >= 40:
-        short = sum(1 for ln in lines if len(ln) <= 2)
-        if short / len(lines) >= 0.35:
-            return True
-    if text.count("\n") >= 120:
-        return True
-    return False
-
-
-def _normalize_broken_text(text: str) -> str:
-    # 0) 공백을 한 줄로 정리
-    t = re.sub(r"\s+", " ", text).strip()
-
-    # 1) 날짜 붙이기
-    # 1-1) 4자리 연도: 2025. 11. 26. -> 2025.11.26.
-    t = re.sub(r"(\d{4})\s*\.\s*(\d{1,2})\s*\.\s*(\d{1,2})\s*\.", r"\1.\2.\3.", t)
-    # 1-2) 2자리 연도: 25. 11. 26. -> 25.11.26.
-    t = re.sub(
-        r"(?<!\d)(\d{2})\s*\.\s*(\d{1,2})\s*\.\s*(\d{1,2})\s*\.", r"\1.\2.\3.", t
-    )
-
-    # 2) 시간 단위 붙이기: 15 시 -> 15시, 14 시 30 분 -> 14시 30분
-    t = re.sub(r"(\d)\s+(시|분|초|호|일|월|년)", r"\1\2", t)
-
-    # 3) 전화번호 붙이기: (055 751 2088) -> (055-751-2088)
-    t = re.sub(r"\((\d{2,4})\s+(\d{3,4})\s+(\d{4})\)", r"(\1-\2-\3)", t)
-
-    # 4) 기호 주변 공백 정리
-    t = re.sub(r"\s*~\s*", "~", t)
-    t = re.sub(r"\s+([:;,.!?])", r"\1", t)
-    t = re.sub(r"\(\s+", "(", t)
-    t = re.sub(r"\s+\)", ")", t)
-
-    # 5) 섹션/구분자 줄바꿈
-    t = re.sub(r"\s*■\s*", "\n■ ", t)
-
-    # 6) ★★★ 헤더 가독성 강화(줄 띄우고 굵게)
-    t = re.sub(r"\s*(★{3}\s*[^★]+?\s*★{3})\s*", r"\n\n**\1**\n", t)
-
-    # 7) 동그라미 번호 줄바꿈
-    t = re.sub(r"\s*([①②③④⑤⑥⑦⑧⑨⑩])\s*", r"\n\1 ", t)
-
-    # 8) '1. 2. 3.' 목록 줄바꿈
-    #    ✅ (?!\d{1,2}\.) 추가: "25.11." 같은 날짜는 목록으로 보지 않음
-    t = re.sub(
-        r"(?<!\d\.)(?<![0-9A-Za-z가-힣])([1-9]|[1-9]\d)\.\s*(?!\d{1,2}\.)", r"\n\1. ", t
-    )
-
-    # 9) 하이픈 항목/주의문 줄바꿈
-    t = re.sub(r"\s+-\s+", "\n- ", t)
-    t = re.sub(r"\s*※\s*", "\n※ ", t)
-
-    # 10) “문의처:”는 별도 줄로
-    t = re.sub(r"\s*(문의처\s*:)", r"\n\1", t)
-
-    # 11) 줄바꿈 정리
-    t = re.sub(r"\n{3,}", "\n\n", t).strip()
-
-    return t
+# data:image/png;base64,.... 의 앞부분(헤더)만 검사
+DATA_URL_HEADER_RE = re.compile(r"data:(image/[a-zA-Z0-9.+-]+);base64")
+DATA_URL_HEADER_MAX = 128  # 헤더에서 ',' 를 찾을 최대 길이
+B64_CHUNK = 1 << 18  # 한 번에 디코딩할 base64 글자 수
+_B64_WS = " \t\r\n\f\v"  # a2b_base64 가 알아서 건너뛰는 공백
 
 
-def _clean_text(text: str) -> str:
-    lines = [line.strip() for line in text.splitlines()]
-    lines = [line for line in lines if line]
-    return "\n".join(lines)
+class InlineImageTooLarge(ValueError):
+    pass
 
 
 def _extract_body_text(wrap) -> str:
     contents = [item.get_text("").replace("\xa0", " ") for item in wrap.contents]
     raw_nl = "\n".join(contents)
 
-    if not _is_noisy_text(raw_nl):
-        return _clean_text(raw_nl)
+    # 줄 분리는 1번만: 잡음 판단과 정리에 같이 사용
+    lines = split_lines(raw_nl)
+    if not is_noisy_text(line_stats(raw_nl, lines)):
+        return "\n".join(lines)
 
     raw_sp = " ".join(contents)
-    return _normalize_broken_text(raw_sp)
+    return normalize_broken_text(raw_sp)
 
 
 def _build_download_url(detail_url: str, atch_file_id: str, file_sn: str) -> str:
@@ -100,143 +56,108 @@ def _build_download_url(detail_url: str, atch_file_id: str, file_sn: str) -> str
     return f"{base}/cmm/fms/FileDown.do?atchFileId={atch_file_id}&fileSn={file_sn}"
 
 
-def decode_data_image(data_url: str):
+def decode_data_image(data_url: str, *, max_bytes: int | None = INLINE_IMAGE_MAX_BYTES):
     """
     return: (mime, ext, bytes)
+    - 헤더만 정규식으로 확인하고 본문(base64)은 전체 복사 없이 조각 단위로 디코딩
+    - 결과는 미리 잡아둔 버퍼에 바로 채움 (bytearray)
+    - max_bytes 를 넘는 순간 중단 (InlineImageTooLarge)
+    - 실제 포맷은 매직 바이트로 판별 (선언된 mime 과 다르면 매직 바이트 우선)
     """
-    m = DATA_URL_RE.match(data_url.strip())
-    if not m:
+    # 앞뒤 공백은 복사 없이 인덱스로 건너뜀
+    start, end = 0, len(data_url)
+    while start < end and data_url[start].isspace():
+        start += 1
+    while end > start and data_url[end - 1].isspace():
+        end -= 1
+
+    comma = data_url.find(",", start, min(end, start + DATA_URL_HEADER_MAX))
+    m = DATA_URL_HEADER_RE.fullmatch(data_url, start, comma) if comma != -1 else None
+    if not m or comma + 1 >= end:
         raise ValueError("Invalid data:image base64 URL")
-
     mime = m.group(1)  # e.g. image/png
-    b64 = m.group(2)
-
-    # base64 문자열 내 공백/개행 제거
-    b64 = re.sub(r"\s+", "", b64)
 
-    raw = base64.b64decode(b64)
+    # 디코딩 결과 최대 크기(공백 포함 추정)만큼 미리 할당
+    capacity = (end - comma - 1) * 3 // 4
+    if max_bytes is not None:
+        capacity = min(capacity, max_bytes + 3)
+    buf = bytearray(capacity)
+    view = memoryview(buf)
+    size = 0
+    carry = ""
+
+    pos = comma + 1
+    while pos < end or carry:
+        chunk = carry + data_url[pos : min(pos + B64_CHUNK, end)]
+        pos += B64_CHUNK
+        carry = ""
+        if pos < end:
+            # 공백(개행)은 지우지 않고 세기만 해서, 공백 아닌 글자가 4의 배수가 되는 곳에서 자름
+            ws = sum(chunk.count(c) for c in _B64_WS)
+            extra = (len(chunk) - ws) % 4
+            cut = len(chunk)
+            while extra:
+                cut -= 1
+                if chunk[cut] not in _B64_WS:
+                    extra -= 1
+            chunk, carry = chunk[:cut], chunk[cut:]
+        if not chunk:
+            continue
 
-    ext = mime.split("/")[-1].lower()
-    if ext == "jpeg":
-        ext = "jpg"
+        raw = binascii.a2b_base64(chunk)
+        if max_bytes is not None and size + len(raw) > max_bytes:
+            raise InlineImageTooLarge(f"inline image larger than {max_bytes} bytes")
+        if size + len(raw) > len(buf):
+            view.release()
+            buf.extend(bytes(size + len(raw) - len(buf)))
+            view = memoryview(buf)
+        view[size : size + len(raw)] = raw
+        size += len(raw)
 
-    return mime, ext, raw
+    view.release()
+    del buf[size:]
 
+    sniffed = sniff_image_type(bytes(buf[:16]))
+    if sniffed is not None:
+        mime, ext = sniffed
+    else:
+        ext = mime.split("/")[-1].lower()
+        if ext == "jpeg":
+            ext = "jpg"
 
-def _cell_text(cell) -> str:
-    t = cell.get_text(" ", strip=True)
-    # 예: "16:10~16~:25" 같은 오타/깨짐 정리(필요시 확장)
-    t = re.sub(r"(\d{1,2}):(\d{2})\s*~\s*(\d{1,2})\s*~\s*:(\d{2})", r"\1:\2~\3:\4", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
-
-
-def _table_to_grid(table) -> list[list[str]]:
-    grid = []
-    span_map = {}  # col_idx -> [text, remaining_rows]
-
-    for tr in table.find_all("tr"):
-        row = []
-        col = 0
-
-        def fill_spans_until():
-            nonlocal col, row
-            while col in span_map:
-                txt, remain = span_map[col]
-                row.append(txt)
-                remain -= 1
-                if remain <= 0:
-                    del span_map[col]
-                else:
-                    span_map[col] = [txt, remain]
-                col += 1
-
-        fill_spans_until()
-
-        cells = tr.find_all(["th", "td"])
-        for cell in cells:
-            fill_spans_until()
-
-            txt = _cell_text(cell)
-            rs = int(cell.get("rowspan", 1) or 1)
-            cs = int(cell.get("colspan", 1) or 1)
-
-            for i in range(cs):
-                row.append(txt if i == 0 else "")
-                if rs > 1:
-                    span_map[col + i] = [txt, rs - 1]
-            col += cs
-
-        # 행 끝에서도 남은 span이 있으면 채워서 열 수 맞추기
-        fill_spans_until()
-
-        grid.append(row)
-
-    # 행별 열 개수 맞추기
-    max_cols = max((len(r) for r in grid), default=0)
-    for r in grid:
-        if len(r) < max_cols:
-            r.extend([""] * (max_cols - len(r)))
-    return grid
-
-
-def _grid_to_codeblock(grid: list[list[str]], max_width: int = 80) -> str:
-    if not grid:
-        return ""
-
-    # 너무 긴 셀은 자르기
-    def clip(s: str, n: int = 24) -> str:
-        s = s or ""
-        return s if len(s) <= n else (s[: n - 1] + "…")
-
-    clipped = [[clip(c) for c in row] for row in grid]
-
-    cols = len(clipped[0])
-    widths = [0] * cols
-    for row in clipped:
-        for i, c in enumerate(row):
-            widths[i] = max(widths[i], len(c))
-
-    # 전체 폭 너무 넓으면 폭 제한
-    total = sum(widths) + (3 * (cols - 1))
-    if total > max_width:
-        # 폭이 큰 컬럼부터 조금씩 줄이기
-        order = sorted(range(cols), key=lambda i: widths[i], reverse=True)
-        while total > max_width and order:
-            i = order[0]
-            if widths[i] <= 6:
-                order.pop(0)
-                continue
-            widths[i] -= 1
-            total = sum(widths) + (3 * (cols - 1))
+    return mime, ext, buf
 
-    def fmt_row(row):
-        out = []
-        for i, c in enumerate(row):
-            c = clip(c, widths[i])  # 최종 폭에 맞춰 클립
-            out.append(c.ljust(widths[i]))
-        return " | ".join(out)
 
-    lines = []
-    lines.append(fmt_row(clipped[0]))
-    lines.append("-" * min(max_width, len(lines[0])))
-    for r in clipped[1:]:
-        lines.append(fmt_row(r))
+def _cell_text(cell) -> str:
+    return normalize_cell_text(cell.get_text(" ", strip=True))
 
-    return "```text\n" + "\n".join(lines) + "\n```"
 
+def _find_wrap(soup):
+    return soup.select_one(".b-content-box") or soup.select_one(".view_wrap")
 
-def fetch_notice_detail(detail_url: str) -> dict:
-    res = http_get(detail_url, timeout=15)
-    res.raise_for_status()
-    if not res.encoding:
-        res.encoding = res.apparent_encoding
 
-    soup = BeautifulSoup(res.text, "html.parser")
+def parse_notice_detail(
+    html: str,
+    detail_url: str,
+    *,
+    backend: str | None = None,
+    fields=None,
+    max_images: int | None = None,
+    max_text: int | None = None,
+) -> dict:
+    """
+    fields: 필요한 항목만 ("text" / "images" / "files", None 이면 전부). 빠진 항목은 빈 값
+    max_images: data:image 는 앞에서부터 이 개수까지만 디코딩 (나머지는 건드리지 않음)
+    max_text: 본문이 이 길이를 넘으면 자르고, 남은 길이가 없으면 표는 렌더링하지 않음
+    """
+    want = ALL_FIELDS if fields is None else frozenset(fields)
 
-    wrap = (
-        soup.select_one(".b-content-box") or soup.select_one(".view_wrap") or soup.body
-    )
+    # 본문/첨부 박스만 파싱, 본문 박스가 없는 페이지면 전체 파싱 후 body 사용
+    soup = make_soup(html, only=DETAIL_STRAINER, backend=backend)
+    wrap = _find_wrap(soup)
+    if wrap is None:
+        soup = make_soup(html, backend=backend)
+        wrap = _find_wrap(soup) or soup.body
     if wrap is None:
         return {"text": "", "images": [], "image_blobs": [], "files": []}
 
@@ -246,23 +167,64 @@ def fetch_notice_detail(detail_url: str) -> dict:
     for tag in wrap.select("script, style, noscript"):
         tag.decompose()
 
-        # ✅ table 먼저 따로 추출 (표 있는 공지만 처리)
+    # ✅ table 먼저 떼어냄 (본문 텍스트 중복/깨짐 방지, 표 안 이미지 제외)
+    # 렌더링은 본문 길이를 본 뒤에 필요한 만큼만
+    # (안쪽 표는 바깥 표와 같이 떨어져 나가므로 따로 렌더링하지 않음)
+    tables = [
+        table.extract()
+        for table in wrap.find_all("table")
+        if any(parent is wrap for parent in table.parents)
+    ]
+
+    body_text = ""
+    if "text" in want:
+        body_text = _parse_text(wrap, tables, max_text)
+
+    images: list[str] = []
+    image_blobs: list[dict] = []
+    if "images" in want:
+        images, image_blobs = _parse_images(wrap, detail_url, max_images)
+
+    files: list[str] = []
+    if "files" in want:
+        files = _parse_files(soup, detail_url)
+
+    # ✅ watcher에서 쓰는 키 포함해서 반환
+    return {
+        "text": body_text,
+        "images": images,  # URL 이미지
+        "image_blobs": image_blobs,  # data:image 디코딩 이미지
+        "files": files,
+    }
+
+
+def _parse_text(wrap, tables: list, max_text: int | None) -> str:
+    body_text = _extract_body_text(wrap)
+    if max_text is not None and len(body_text) > max_text:
+        return body_text[:max_text]
+
     table_blocks = []
-    for table in wrap.find_all("table"):
+    used = len(body_text)
+    for table in tables:
+        if max_text is not None and used >= max_text:
+            break  # 잘려서 안 보일 표는 그리지 않음
         try:
-            grid = _table_to_grid(table)
-            block = _grid_to_codeblock(grid, max_width=90)
+            grid = table_to_grid(table, _cell_text)
+            block = grid_to_codeblock(grid, max_width=90)
             if block:
                 table_blocks.append(block)
+                used += len(block) + 1
         except Exception:
             pass
-        table.decompose()  # 본문 텍스트에서 표 제거 (중복/깨짐 방지)
-
-    body_text = _extract_body_text(wrap)
 
     if table_blocks:
         body_text = (body_text + "\n\n📋 일정표\n" + "\n".join(table_blocks)).strip()
+    if max_text is not None:
+        body_text = body_text[:max_text]
+    return body_text
 
+
+def _parse_images(wrap, detail_url: str, max_images: int | None) -> tuple[list[str], list[dict]]:
     # ✅ 이미지 처리: URL 이미지 + data:image(base64) 분리
     images: list[str] = []
     image_blobs: list[dict] = []
@@ -276,8 +238,10 @@ def fetch_notice_detail(detail_url: str) -> dict:
         if src.startswith("file://"):
             continue
 
-        # 2) data:image/...;base64,... → 디코딩해서 bytes로 보관
+        # 2) data:image/...;base64,... → 디코딩해서 bytes로 보관 (max_images 까지만)
         if src.startswith("data:image/"):
+            if max_images is not None and len(image_blobs) >= max_images:
+                continue
             try:
                 mime, ext, raw = decode_data_image(src)
                 image_blobs.append({"mime": mime, "ext": ext, "bytes": raw})
@@ -290,8 +254,11 @@ def fetch_notice_detail(detail_url: str) -> dict:
         images.append(urljoin(detail_url, src))
 
     # 중복 제거(순서 유지)
-    images = list(dict.fromkeys(images))
+    # URL 은 문자열뿐이라 자르지 않음 (받기 실패하면 watcher 가 다음 후보 사용)
+    return list(dict.fromkeys(images)), image_blobs
 
+
+def _parse_files(soup, detail_url: str) -> list[str]:
     # ✅ 첨부파일 처리
     files: list[str] = []
     file_box = soup.select_one(".b-file-box") or soup.select_one(".board_file")
@@ -316,12 +283,73 @@ def fetch_notice_detail(detail_url: str) -> dict:
                 atch_id, sn = m.group(1), m.group(2)
                 files.append(_build_download_url(detail_url, atch_id, sn))
 
-    files = list(dict.fromkeys(files))
+    return list(dict.fromkeys(files))
 
-    # ✅ watcher에서 쓰는 키 포함해서 반환
-    return {
-        "text": body_text,
-        "images": images,  # URL 이미지
-        "image_blobs": image_blobs,  # data:image 디코딩 이미지
-        "files": files,
-    }
+
+def parse_notice_detail_bytes(
+    content: bytes, encoding: str | None, detail_url: str, **kwargs
+) -> dict:
+    """
+    응답 바이트 → 상세 결과 (프로세스 풀에서 실행: 디코딩까지 이벤트 루프 밖에서)
+    """
+    return parse_notice_detail(decode_body(content, encoding), detail_url, **kwargs)
+
+
+def fetch_notice_detail(
+    detail_url: str,
+    *,
+    fields=None,
+    max_images: int | None = None,
+    max_text: int | None = None,
+) -> dict:
+    res = http_get(detail_url, timeout=15)
+    res.raise_for_status()
+    return parse_notice_detail(
+        res.text, detail_url, fields=fields, max_images=max_images, max_text=max_text
+    )
+
+
+async def fetch_notice_detail_async(
+    detail_url: str,
+    *,
+    cache: DetailCache | None = None,
+    fields=None,
+    max_images: int | None = None,
+    max_text: int | None = None,
+) -> dict:
+    """
+    cache 를 넘기면 조건부 요청으로 재검증하고,
+    304 이거나 응답 해시가 같으면 다시 파싱하지 않고 캐시 결과 반환.
+    (캐시 결과가 더 좁은 범위로 파싱된 것이면 다시 파싱)
+    """
+    limits = detail_limits(fields, max_images, max_text)
+    headers = cache.request_headers(detail_url) if cache else None
+    res = await http_aget(detail_url, timeout=15, headers=headers)
+    if cache and res.status_code == 304:
+        cached = await asyncio.to_thread(cache.get, detail_url, limits)
+        if cached is not None:
+            return cached
+        res = await http_aget(detail_url, timeout=15)
+    res.raise_for_status()
+
+    digest = hashlib.sha256(res.content).hexdigest()
+    if cache:
+        cached = await asyncio.to_thread(cache.get_if_hash, detail_url, digest, limits)
+        if cached is not None:
+            return cached
+
+    # 파싱/정규화는 CPU 작업이라 스레드/프로세스 풀로 (이벤트 루프는 I/O 만)
+    encoding = response_encoding(res)
+    with PARSE_SECONDS.time("detail"), span("parse", kind="detail", url=detail_url):
+        detail = await run_parse(
+            parse_notice_detail_bytes,
+            res.content,
+            encoding,
+            detail_url,
+            fields=fields,
+            max_images=max_images,
+            max_text=max_text,
+        )
+    if cache:
+        await asyncio.to_thread(cache.put, detail_url, digest, res.headers, detail, limits)
+    return detail
@@ -1,10 +1,21 @@
 # crawlers/notices.py
+import asyncio
 import re
-from urllib.parse import urlsplit, urljoin
+from collections.abc import AsyncIterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit, urljoin
 
-from bs4 import BeautifulSoup
+from crawler.list_cache import ListPageCache
+from crawler.parser import LIST_STRAINER, make_soup
 from models.notice import Notice
-from utils.http_client import get as http_get
+from utils.http_client import (
+    aget as http_aget,
+    decode_body,
+    get as http_get,
+    response_encoding,
+)
+from utils.metrics import PARSE_SECONDS
+from utils.process_pool import run_parse
+from utils.trace_journal import span
 
 
 ONCLICK_RE = re.compile(
@@ -14,6 +25,10 @@ ONCLICK_RE = re.compile(
     re.IGNORECASE,
 )
 
+PAGE_SIZE = 10  # 목록 한 페이지 글 수
+MAX_PAGES = 20  # 따라잡기 시 최대 페이지 수
+PREFETCH_PAGES = 3  # 동시에 미리 받아둘 페이지 수
+
 
 def _to_int_or_none(text: str) -> int | None:
     try:
@@ -51,13 +66,10 @@ def _extract_onclick(subject_td) -> str:
     return (inner.get("onclick") or "").strip() if inner else ""
 
 
-def fetch_notices(list_url: str, limit: int = 10) -> list[Notice]:
-    res = http_get(list_url, timeout=15)
-    res.raise_for_status()
-    if not res.encoding:
-        res.encoding = res.apparent_encoding
-
-    soup = BeautifulSoup(res.text, "html.parser")
+def parse_notices(
+    html: str, list_url: str, limit: int = 10, *, backend: str | None = None
+) -> list[Notice]:
+    soup = make_soup(html, only=LIST_STRAINER, backend=backend)
 
     notices: list[Notice] = []
     seen_ids: set[str] = set()
@@ -147,6 +159,136 @@ def fetch_notices(list_url: str, limit: int = 10) -> list[Notice]:
     return notices
 
 
+def parse_notices_bytes(
+    content: bytes, encoding: str | None, list_url: str, limit: int = 10
+) -> list[Notice]:
+    """
+    응답 바이트 → 공지 목록 (프로세스 풀에서 실행: 디코딩까지 이벤트 루프 밖에서)
+    """
+    return parse_notices(decode_body(content, encoding), list_url, limit)
+
+
+def fetch_notices(list_url: str, limit: int = 10) -> list[Notice]:
+    res = http_get(list_url, timeout=15)
+    res.raise_for_status()
+    return parse_notices(res.text, list_url, limit)
+
+
+async def fetch_notices_async(
+    list_url: str, limit: int = 10, *, cache: ListPageCache | None = None
+) -> list[Notice] | None:
+    """
+    cache 를 넘기면 조건부 요청을 보내고, 목록이 지난번과 같으면 None 반환(파싱 생략).
+    """
+    headers = cache.request_headers(list_url) if cache else None
+    res = await http_aget(list_url, timeout=15, headers=headers)
+    if cache and cache.is_unchanged(list_url, res.status_code, res.headers, res.content):
+        return None
+    res.raise_for_status()
+    # 파싱은 CPU 작업이라 스레드/프로세스 풀로 (이벤트 루프는 I/O 만)
+    encoding = response_encoding(res)
+    with PARSE_SECONDS.time("list"), span("parse", kind="list", url=list_url):
+        return await run_parse(parse_notices_bytes, res.content, encoding, list_url, limit)
+
+
+def page_url(list_url: str, page: int, page_size: int = PAGE_SIZE) -> str:
+    """
+    목록 URL에 페이지 파라미터를 붙인 URL (page는 1부터)
+    - 구버전(selectBoardList.do): pageIndex
+    - 새 버전: article.offset / articleLimit
+    """
+    parts = urlsplit(list_url)
+    query = dict(parse_qsl(parts.query))
+    if parts.path.endswith("selectBoardList.do"):
+        query["pageIndex"] = str(page)
+        if page_size != PAGE_SIZE:
+            # eGov 게시판 페이지 크기 (무시하는 서버는 기본 크기로 → 페이지 번호는 그대로 연속)
+            query["pageUnit"] = str(page_size)
+    else:
+        query["mode"] = "list"
+        query["articleLimit"] = str(page_size)
+        query["article.offset"] = str((page - 1) * page_size)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+async def fetch_notice_page(
+    list_url: str, page: int, page_size: int = PAGE_SIZE
+) -> list[Notice]:
+    url = list_url if page == 1 and page_size == PAGE_SIZE else page_url(list_url, page, page_size)
+    res = await http_aget(url, timeout=15)
+    res.raise_for_status()
+    encoding = response_encoding(res)
+    with PARSE_SECONDS.time("list"), span("parse", kind="list", url=url):
+        return await run_parse(parse_notices_bytes, res.content, encoding, url, page_size)
+
+
+def _reached(notice_id: str, stop_id: str | None) -> bool:
+    if stop_id is None:
+        return False
+    if notice_id == stop_id:
+        return True
+    # 글 번호는 증가하므로, 마지막 글이 삭제된 경우에도 더 오래된 글에서 멈춤
+    if notice_id.isdigit() and stop_id.isdigit():
+        return int(notice_id) < int(stop_id)
+    return False
+
+
+async def iter_notices(
+    list_url: str,
+    *,
+    stop_id: str | None = None,
+    first_page: list[Notice] | None = None,
+    max_pages: int = MAX_PAGES,
+    prefetch: int = PREFETCH_PAGES,
+) -> AsyncIterator[Notice]:
+    """
+    게시판 목록을 최신순으로 페이지를 넘기며 흘려보냄.
+    - stop_id(마지막으로 본 글)에 닿으면 바로 멈춤
+    - 현재 페이지를 처리하는 동안 다음 페이지들을 최대 prefetch개까지 동시에 요청
+    - first_page: 이미 받아둔 1페이지 결과(있으면 재요청 안 함)
+    """
+    pending: dict[int, asyncio.Task] = {}
+    next_page = 2 if first_page is not None else 1
+
+    def schedule() -> None:
+        nonlocal next_page
+        while len(pending) < prefetch and next_page <= max_pages:
+            pending[next_page] = asyncio.create_task(
+                fetch_notice_page(list_url, next_page)
+            )
+            next_page += 1
+
+    seen: set[str] = set()
+    page = next_page - 1 if first_page is not None else 1
+    items = first_page
+    try:
+        while True:
+            schedule()
+            if items is None:
+                if page not in pending:
+                    return
+                items = await pending.pop(page)
+
+            fresh = 0
+            for n in items:
+                if _reached(n.notice_id, stop_id):
+                    return
+                if n.notice_id in seen:
+                    # 크롤링 중 새 글이 올라오면 다음 페이지에 이전 글이 다시 보임
+                    continue
+                seen.add(n.notice_id)
+                fresh += 1
+                yield n
+
+            if fresh == 0:
+                return  # 마지막 페이지를 지남
+            page += 1
+            items = None
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+
 # ── 기존 인터페이스 유지용 wrapper ──
 def fetch_school_notices(list_url: str, limit: int = 10) -> list[Notice]:
     return fetch_notices(list_url, limit)
@@ -0,0 +1,43 @@
+# crawler/parser.py
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import HTML_PARSER
+
+try:
+    import lxml  # noqa: F401
+
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+# 목록: "table tbody tr" 만 읽으므로 table 서브트리만 파싱
+LIST_STRAINER = SoupStrainer("table")
+
+# 상세: 본문 박스 + 첨부파일 박스만 파싱
+DETAIL_STRAINER = SoupStrainer(
+    class_=["b-content-box", "view_wrap", "b-file-box", "board_file"]
+)
+
+
+def resolve_backend(name: str | None = None) -> str:
+    """
+    "auto" → lxml 이 설치돼 있으면 lxml, 아니면 html.parser
+    "lxml" 을 지정했는데 설치가 안 돼 있으면 html.parser 로 폴백
+    """
+    name = (name or HTML_PARSER or "auto").lower()
+    if name in ("auto", "lxml"):
+        return "lxml" if _HAS_LXML else "html.parser"
+    return "html.parser"
+
+
+def make_soup(
+    markup: str | bytes,
+    *,
+    only: SoupStrainer | None = None,
+    backend: str | None = None,
+) -> BeautifulSoup:
+    """
+    파서 엔진 선택 + (가능하면) 필요한 서브트리만 파싱.
+    only 를 넘기면 해당 요소들만 트리에 남음.
+    """
+    return BeautifulSoup(markup, resolve_backend(backend), parse_only=only)
@@ -0,0 +1,147 @@
+# crawler/table_layout.py
+from dataclasses import dataclass
+
+CELL_MAX = 24  # 셀 하나 최대 글자 수
+MIN_COL_WIDTH = 6  # 폭을 줄여도 이 이하로는 안 줄임
+
+
+@dataclass
+class TableGrid:
+    """
+    표를 행 우선(row-major) 평탄 배열로 보관.
+    rowspan/colspan 은 이미 펼쳐진 상태.
+    """
+
+    rows: int
+    cols: int
+    cells: list[str]
+
+    def row(self, r: int) -> list[str]:
+        return self.cells[r * self.cols : (r + 1) * self.cols]
+
+
+def _fill_spans(spans: dict, flat: list[str], col: int) -> int:
+    # 위쪽 행의 rowspan 이 내려오는 칸 채우기
+    while col in spans:
+        span = spans[col]
+        flat.append(span[0])
+        span[1] -= 1
+        if span[1] <= 0:
+            del spans[col]
+        col += 1
+    return col
+
+
+def table_to_grid(table, cell_text) -> TableGrid:
+    """
+    <table> 을 한 번 훑어서 rowspan/colspan 을 펼친 TableGrid 로 변환
+    cell_text: 셀(td/th) → 문자열
+    """
+    flat: list[str] = []
+    row_lens: list[int] = []
+    spans: dict[int, list] = {}  # col_idx -> [text, remaining_rows]
+
+    for tr in table.find_all("tr"):
+        start = len(flat)
+        col = _fill_spans(spans, flat, 0)
+
+        for cell in tr.find_all(["th", "td"]):
+            col = _fill_spans(spans, flat, col)
+
+            txt = cell_text(cell)
+            rs = int(cell.get("rowspan", 1) or 1)
+            cs = int(cell.get("colspan", 1) or 1)
+
+            flat.append(txt)
+            if cs > 1:
+                flat.extend([""] * (cs - 1))
+            if rs > 1:
+                for i in range(cs):
+                    spans[col + i] = [txt, rs - 1]
+            col += cs
+
+        # 행 끝에서도 남은 span이 있으면 채워서 열 수 맞추기
+        _fill_spans(spans, flat, col)
+        row_lens.append(len(flat) - start)
+
+    cols = max(row_lens, default=0)
+    if all(n == cols for n in row_lens):
+        return TableGrid(len(row_lens), cols, flat)
+
+    # 행별 열 개수 맞추기
+    cells: list[str] = []
+    pos = 0
+    for n in row_lens:
+        cells.extend(flat[pos : pos + n])
+        if n < cols:
+            cells.extend([""] * (cols - n))
+        pos += n
+    return TableGrid(len(row_lens), cols, cells)
+
+
+def fit_widths(widths: list[int], budget: int, min_width: int = MIN_COL_WIDTH) -> list[int]:
+    """
+    열 폭 합이 budget 을 넘으면 water-filling 으로 상한 c 를 한 번에 계산해서
+    넓은 열부터 고르게 줄임 (min_width 보다 좁게는 안 줄임)
+    """
+    if sum(widths) <= budget:
+        return widths
+
+    wide = sorted((w for w in widths if w > min_width))
+    room = budget - sum(w for w in widths if w <= min_width)
+
+    cap, extra = min_width, 0
+    for i, w in enumerate(wide):
+        remain = len(wide) - i
+        c = room // remain
+        if c < w:
+            if c >= min_width:
+                cap, extra = c, room - c * remain
+            break
+        room -= w
+
+    out = [min(w, cap) for w in widths]
+    # 남는 칸은 원래 가장 넓던 열부터 1칸씩
+    if extra:
+        for i in sorted(range(len(widths)), key=lambda i: -widths[i]):
+            if extra == 0:
+                break
+            if widths[i] > cap:
+                out[i] += 1
+                extra -= 1
+    return out
+
+
+def _clip(s: str, n: int) -> str:
+    return s if len(s) <= n else (s[: n - 1] + "…")
+
+
+def grid_to_codeblock(grid: TableGrid, max_width: int = 80) -> str:
+    if grid.rows == 0:
+        return ""
+    if grid.cols == 0:
+        # 셀 없는 <tr> 만 있는 표: 예전처럼 빈 줄(행 + 구분선)만 있는 코드블록 ("📋 일정표" 도 붙음)
+        return "```text\n" + "\n" * grid.rows + "\n```"
+
+    cols = grid.cols
+    cells = grid.cells
+
+    # 열 폭: 너무 긴 셀은 CELL_MAX 로 자른 길이 기준
+    widths = [0] * cols
+    for idx, c in enumerate(cells):
+        n = len(c)
+        if n > widths[idx % cols]:
+            widths[idx % cols] = n if n < CELL_MAX else CELL_MAX
+
+    # 전체 폭 너무 넓으면 폭 제한
+    widths = fit_widths(widths, max_width - 3 * (cols - 1))
+
+    lines = []
+    for r in range(grid.rows):
+        row = cells[r * cols : (r + 1) * cols]
+        lines.append(
+            " | ".join(_clip(c, w).ljust(w) for c, w in zip(row, widths))
+        )
+    lines.insert(1, "-" * min(max_width, len(lines[0])))
+
+    return "```text\n" + "\n".join(lines) + "\n```"
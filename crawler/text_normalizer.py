@@ -0,0 +1,130 @@
+# crawler/text_normalizer.py
+import re
+from dataclasses import dataclass
+
+
+# ─────────────────────────────────────────────────────────
+# 줄 통계 (crawler 의 잡음 판단 / watcher 의 표·전단지 판단 공용)
+# ─────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class LineStats:
+    lines: int  # 공백 제거 후 비어있지 않은 줄 수
+    short: int  # 그 중 2글자 이하 줄 수
+    newlines: int  # 원문 "\n" 개수
+
+    @property
+    def short_ratio(self) -> float:
+        return self.short / self.lines if self.lines else 0.0
+
+
+def split_lines(text: str) -> list[str]:
+    """
+    줄마다 strip 하고 빈 줄은 버린 목록
+    """
+    return [ln for ln in map(str.strip, text.splitlines()) if ln]
+
+
+def line_stats(text: str, lines: list[str] | None = None) -> LineStats:
+    if lines is None:
+        lines = split_lines(text)
+    short = sum(1 for ln in lines if len(ln) <= 2)
+    return LineStats(lines=len(lines), short=short, newlines=text.count("\n"))
+
+
+def is_noisy_text(stats: LineStats) -> bool:
+    if stats.lines >= 40 and stats.short_ratio >= 0.35:
+        return True
+    return stats.newlines >= 120
+
+
+def looks_like_broken_table(stats: LineStats) -> bool:
+    if stats.lines < 40:
+        return False
+    # "수", "시", "호" 같은 단문 라인이 비정상적으로 많으면 표/전단지 텍스트일 확률이 큼
+    if stats.short_ratio >= 0.30:
+        return True
+    # 줄이 너무 많아도 위험 신호
+    return stats.lines >= 120
+
+
+# ─────────────────────────────────────────────────────────
+# 깨진 본문 정규화 규칙
+# - 정규식은 모듈 로드 시 1회 컴파일
+# - guard 문자열이 하나도 없으면 해당 규칙은 건너뜀(본문 전체 스캔 생략)
+# - 순서가 결과에 영향을 주므로 규칙 순서는 그대로 유지
+# ─────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class _Rule:
+    pattern: re.Pattern
+    repl: object  # str 또는 callable
+    guards: tuple[str, ...] = ()
+
+    def apply(self, t: str) -> str:
+        if self.guards and not any(g in t for g in self.guards):
+            return t
+        return self.pattern.sub(self.repl, t)
+
+
+_CIRCLED = "①②③④⑤⑥⑦⑧⑨⑩"
+
+_RULES: tuple[_Rule, ...] = (
+    # 1) 날짜 붙이기: 2025. 11. 26. -> 2025.11.26.
+    _Rule(re.compile(r"(\d{4})\s*\.\s*(\d{1,2})\s*\.\s*(\d{1,2})\s*\."), r"\1.\2.\3.", (".",)),
+    #    25. 11. 26. -> 25.11.26. (4자리 규칙 결과에 이어서 적용되므로 한 정규식으로 합치지 않음)
+    _Rule(
+        re.compile(r"(?<!\d)(\d{2})\s*\.\s*(\d{1,2})\s*\.\s*(\d{1,2})\s*\."),
+        r"\1.\2.\3.",
+        (".",),
+    ),
+    # 2) 시간 단위 붙이기: 15 시 -> 15시, 14 시 30 분 -> 14시 30분
+    _Rule(re.compile(r"(\d)\s+(시|분|초|호|일|월|년)"), r"\1\2", tuple("시분초호일월년")),
+    # 3) 전화번호 붙이기: (055 751 2088) -> (055-751-2088)
+    _Rule(re.compile(r"\((\d{2,4})\s+(\d{3,4})\s+(\d{4})\)"), r"(\1-\2-\3)", ("(",)),
+    # 4) 기호 주변 공백 정리 (~ / 문장부호 / 괄호 안쪽)
+    _Rule(re.compile(r"\s*~\s*"), "~", ("~",)),
+    _Rule(re.compile(r"\s+([:;,.!?])"), r"\1", tuple(":;,.!?")),
+    _Rule(re.compile(r"\(\s+"), "(", ("(",)),
+    _Rule(re.compile(r"\s+\)"), ")", (")",)),
+    # 5) 섹션/구분자 줄바꿈
+    _Rule(re.compile(r"\s*■\s*"), "\n■ ", ("■",)),
+    # 6) ★★★ 헤더 가독성 강화(줄 띄우고 굵게)
+    _Rule(re.compile(r"\s*(★{3}\s*[^★]+?\s*★{3})\s*"), r"\n\n**\1**\n", ("★★★",)),
+    # 7) 동그라미 번호 줄바꿈
+    _Rule(re.compile(rf"\s*([{_CIRCLED}])\s*"), r"\n\1 ", tuple(_CIRCLED)),
+    # 8) '1. 2. 3.' 목록 줄바꿈 ("25.11." 같은 날짜는 목록으로 보지 않음)
+    _Rule(
+        re.compile(r"(?<!\d\.)(?<![0-9A-Za-z가-힣])([1-9]|[1-9]\d)\.\s*(?!\d{1,2}\.)"),
+        r"\n\1. ",
+        (".",),
+    ),
+    # 9) 하이픈 항목/주의문 줄바꿈
+    _Rule(re.compile(r"\s+-\s+"), "\n- ", ("-",)),
+    _Rule(re.compile(r"\s*※\s*"), "\n※ ", ("※",)),
+    # 10) “문의처:”는 별도 줄로
+    _Rule(re.compile(r"\s*(문의처\s*:)"), r"\n\1", ("문의처",)),
+    # 11) 줄바꿈 정리
+    _Rule(re.compile(r"\n{3,}"), "\n\n", ("\n\n\n",)),
+)
+
+
+def normalize_broken_text(text: str) -> str:
+    # 0) 공백을 한 줄로 정리 (re.sub(r"\s+", " ") + strip 과 동일)
+    t = " ".join(text.split())
+    for rule in _RULES:
+        t = rule.apply(t)
+    return t.strip()
+
+
+# ─────────────────────────────────────────────────────────
+# 표 셀 텍스트
+# ─────────────────────────────────────────────────────────
+# 예: "16:10~16~:25" 같은 오타/깨짐 정리(필요시 확장)
+_BROKEN_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2}):(\d{2})\s*~\s*(\d{1,2})\s*~\s*:(\d{2})"
+)
+
+
+def normalize_cell_text(t: str) -> str:
+    if "~" in t:
+        t = _BROKEN_TIME_RANGE_RE.sub(r"\1:\2~\3:\4", t)
+    return " ".join(t.split())
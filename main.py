@@ -1,45 +1,121 @@
-
 # main
-from config import DISCORD_TOKEN
+import asyncio
+import atexit
+import os
+import subprocess
+import sys
+
+from config import (
+    DISCORD_TOKEN,
+    METRICS_PORT,
+    PARSE_EXECUTOR,
+    RUN_MODE,
+    TRACE_JOURNAL_FILE,
+)
 import discord
 import truststore
 
 from bot.bot_clinet import create_bot
-from bot.commands import setup_command, setup_role_commands
-from services.notice_watcher import (
-    create_school_notice_watcher,
-    create_dept_notice_watcher,
+from bot.commands import (
+    setup_command,
+    setup_profile_commands,
+    setup_role_commands,
+    setup_search_commands,
+    setup_subscription_commands,
 )
+from services.board_registry import load_boards
+from services.notice_publisher import DiscordPublisher
+from services.notice_scheduler import NoticeScheduler
+from services.notice_watcher import create_notice_watchers
+from services.outbox import OutboxConsumer, OutboxPublisher, get_outbox
 
 from services.role_watcher import create_role_watcher
 from utils.http_client import init_http
+from utils.metrics import start_metrics_server
+from utils.process_pool import warm_process_pool
+from utils.trace_journal import worker_journal_path
+
+RUN_MODES = ("all", "split", "bot", "worker")
+
+
+def run_bot(with_crawler: bool) -> None:
+    """
+    with_crawler=True: 이 프로세스에서 공지 크롤링까지 (RUN_MODE=all)
+    with_crawler=False: 워커가 outbox 에 넣은 공지만 받아서 전송 (RUN_MODE=bot/split)
+    """
+    if not DISCORD_TOKEN:
+        raise RuntimeError("DISCORD_TOKEN이 설정되지 않았습니다. .env파일을 확인하세요.")
+
+    bot = create_bot()
+    init_http()
+
+    publisher = DiscordPublisher(bot)
+    if with_crawler:
+        if PARSE_EXECUTOR == "process":
+            warm_process_pool()
+        notices = NoticeScheduler(create_notice_watchers(publisher, load_boards()))
+    else:
+        notices = OutboxConsumer(publisher, get_outbox())
+    role_watcher = create_role_watcher(bot)
+
+    setup_command(bot)
+    setup_role_commands(bot)
+    setup_subscription_commands(bot)
+    setup_search_commands(bot)
+    setup_profile_commands(bot, notices if with_crawler else None)
+
+    # 로그인
+    @bot.event
+    async def on_ready():
+        await start_metrics_server()
+        role_watcher.start()
+
+        notices.start()
+        print(f"{bot.user.name}이(가) 연결 되었습니다.")
+        await bot.change_presence(
+            status=discord.Status.online, activity=discord.Game("만드는 중")
+        )
+
+    # 봇 작동
+    bot.run(DISCORD_TOKEN)
 
-bot = create_bot()
-init_http()
 
-school_watcher = create_school_notice_watcher(bot)
-dept_watcher = create_dept_notice_watcher(bot)
-role_watcher = create_role_watcher(bot)
+def run_worker() -> None:
+    """
+    공지 크롤링/파싱/이미지 처리만 하는 프로세스 (Discord 연결 없음, 결과는 outbox 로)
+    """
+    init_http()
+    if PARSE_EXECUTOR == "process":
+        warm_process_pool()
+    watchers = create_notice_watchers(OutboxPublisher(get_outbox()), load_boards())
+    print(f"[worker] 게시판 {len(watchers)}개 크롤링 시작")
 
-if not DISCORD_TOKEN:
-    raise RuntimeError("DISCORD_TOKEN이 설정되지 않았습니다. .env파일을 확인하세요.")
+    async def main() -> None:
+        await start_metrics_server()
+        await NoticeScheduler(watchers).run()
 
-setup_command(bot)
-setup_role_commands(bot)
+    asyncio.run(main())
 
 
-# 로그인
-@bot.event
-async def on_ready():
-    role_watcher.start()
+def spawn_worker() -> subprocess.Popen:
+    # 같은 폴더(state.db / 이미지 저장소 공유)에서 워커 프로세스 실행, 봇이 끝나면 같이 종료
+    env = dict(os.environ, RUN_MODE="worker")
+    if METRICS_PORT:
+        env["METRICS_PORT"] = str(METRICS_PORT + 1)  # 봇과 같은 포트는 못 씀
+    if TRACE_JOURNAL_FILE:
+        env["TRACE_JOURNAL_FILE"] = worker_journal_path(TRACE_JOURNAL_FILE)
+    worker = subprocess.Popen([sys.executable, os.path.abspath(__file__)], env=env)
+    atexit.register(worker.terminate)
+    return worker
 
-    school_watcher.start()
-    dept_watcher.start()
-    print(f"{bot.user.name}이(가) 연결 되었습니다.")
-    await bot.change_presence(
-        status=discord.Status.online, activity=discord.Game("만드는 중")
-    )
 
+if __name__ == "__main__":
+    if RUN_MODE not in RUN_MODES:
+        raise RuntimeError(f"RUN_MODE 는 {', '.join(RUN_MODES)} 중 하나여야 합니다: {RUN_MODE}")
 
-# 봇 작동
-bot.run(DISCORD_TOKEN)
+    if RUN_MODE == "worker":
+        run_worker()
+    else:
+        if RUN_MODE == "split":
+            spawn_worker()
+        run_bot(with_crawler=RUN_MODE == "all")
@@ -0,0 +1,15 @@
+# models/board.py
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BoardConfig:
+    key: str  # 게시판 식별자 (예: "school")
+    label: str  # 출력 앞머리 라벨 (예: "학교 공지")
+    url: str  # 목록 URL
+    channel_id: int  # 공지 올릴 채널
+    state_key: str  # 마지막 공지 ID 저장 키 (예: "last_school_notice_id")
+    mention_roles: list[int] = field(default_factory=list)
+    interval_seconds: int | None = None  # 학습 전 기본 간격, 없으면 CHECK_INTERVAL_SECONDS
+    min_interval_seconds: int | None = None  # 없으면 POLL_MIN_INTERVAL_SECONDS
+    max_interval_seconds: int | None = None  # 없으면 POLL_MAX_INTERVAL_SECONDS
@@ -1,5 +1,5 @@
 # models/notice.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -10,3 +10,23 @@ class Notice:
     dept: str | None = None  # td_name
     views: int | None = None  # td_num
     date: str | None = None  # td_datetime
+
+
+@dataclass
+class NoticeImage:
+    filename: str  # notice_1.png
+    data: bytes | None = None
+    path: str | None = None  # 이미지 저장소 파일 경로 (있으면 data 대신 사용)
+
+
+@dataclass
+class NoticePayload:
+    """
+    전송 직전 상태의 공지 (메시지 본문 + 첨부 이미지)
+    """
+
+    notice: Notice
+    content: str
+    images: list[NoticeImage] = field(default_factory=list)
+    content_hash: str = ""  # 수정 감지용 (조회수 제외)
+    dm_users: dict[int, list[str]] = field(default_factory=dict)  # 구독 DM 대상 → 키워드
@@ -0,0 +1,40 @@
+# services/board_registry.py
+import json
+
+from config import BOARDS_FILE
+from models.board import BoardConfig
+
+
+def load_boards(path: str = BOARDS_FILE) -> list[BoardConfig]:
+    """
+    게시판 목록 파일(JSON 배열) 읽기.
+    게시판 추가 = 파일에 항목 1개 추가 (코드 수정 불필요)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        items = json.load(f) or []
+
+    boards: list[BoardConfig] = []
+    seen: set[str] = set()
+    for item in items:
+        board = BoardConfig(
+            key=item["key"],
+            label=item.get("label", "공지"),
+            url=item["url"],
+            channel_id=int(item["channel_id"]),
+            state_key=item.get("state_key") or f"last_{item['key']}_notice_id",
+            mention_roles=[int(r) for r in item.get("mention_roles", [])],
+            interval_seconds=item.get("interval_seconds"),
+            min_interval_seconds=item.get("min_interval_seconds"),
+            max_interval_seconds=item.get("max_interval_seconds"),
+        )
+        if (
+            board.min_interval_seconds is not None
+            and board.max_interval_seconds is not None
+            and board.min_interval_seconds > board.max_interval_seconds
+        ):
+            raise ValueError(f"min_interval_seconds > max_interval_seconds: {board.key}")
+        if board.key in seen:
+            raise ValueError(f"중복된 게시판 key: {board.key}")
+        seen.add(board.key)
+        boards.append(board)
+    return boards
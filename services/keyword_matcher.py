@@ -0,0 +1,117 @@
+# services/keyword_matcher.py
+from collections import deque
+
+
+def normalize_keyword(text: str) -> str:
+    # 대소문자/공백 차이 무시 ("수강 신청" == "수강신청")
+    return "".join(text.casefold().split())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 다중 키워드 매칭 (본문 1번 훑기, 키워드 수와 무관하게 O(본문 길이 + 일치 수)).
+    - add(): trie 에 바로 추가 (기존 노드는 그대로), 실패 링크만 다음 검색 때 다시 계산
+    - remove(): trie 는 그대로 두고 출력에서만 빠짐, 죽은 키워드가 많아지면 그때 새로 만듦
+    - 본문은 normalize_keyword 와 같은 규칙으로 공백 제거 후 검색
+    """
+
+    def __init__(self, keywords=()):
+        self._reset()
+        for kw in keywords:
+            self.add(kw)
+
+    def _reset(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[str | None] = [None]  # 이 노드에서 끝나는 키워드
+        self._dict_link: list[int] = [0]  # 실패 링크를 따라가다 처음 만나는 출력 노드
+        self._active: set[str] = set()
+        self._dead = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, keyword: str) -> bool:
+        return normalize_keyword(keyword) in self._active
+
+    def add(self, keyword: str) -> None:
+        kw = normalize_keyword(keyword)
+        if not kw or kw in self._active:
+            return
+        node = 0
+        for ch in kw:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                self._dict_link.append(0)
+                self._dirty = True
+            node = nxt
+        if self._out[node] is None:
+            self._dirty = True
+        else:
+            self._dead -= 1  # 지웠던 키워드를 다시 추가
+        self._out[node] = kw
+        self._active.add(kw)
+
+    def remove(self, keyword: str) -> None:
+        kw = normalize_keyword(keyword)
+        if kw not in self._active:
+            return
+        self._active.discard(kw)
+        self._dead += 1
+        # 죽은 키워드가 살아있는 것보다 많아지면 trie 를 새로 만들어 크기 회복
+        if self._dead > len(self._active):
+            active = list(self._active)
+            self._reset()
+            for k in active:
+                self.add(k)
+
+    def _build(self) -> None:
+        # BFS 로 실패 링크 / 출력 링크 계산
+        queue: deque[int] = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            self._dict_link[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                fail = self._fail[nxt]
+                self._dict_link[nxt] = fail if self._out[fail] is not None else self._dict_link[fail]
+                queue.append(nxt)
+        self._dirty = False
+
+    def find(self, text: str) -> set[str]:
+        """
+        text 에 들어있는 키워드 집합
+        """
+        if not self._active:
+            return set()
+        if self._dirty:
+            self._build()
+
+        goto, fail, out, link = self._goto, self._fail, self._out, self._dict_link
+        active = self._active
+        found: set[str] = set()
+        node = 0
+        for ch in normalize_keyword(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            m = node if out[node] is not None else link[node]
+            while m:
+                kw = out[m]
+                if kw in active:
+                    found.add(kw)
+                m = link[m]
+        return found
@@ -0,0 +1,167 @@
+# services/notice_archive.py
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+
+from config import ARCHIVE_DB_FILE, ARCHIVE_SEARCH_LIMIT
+from models.notice import Notice
+from services.state_store import StateStore
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def bigrams(text: str) -> str:
+    """
+    한국어 검색용 2글자 n-gram ("장학금 신청" → "장학 학금 신청")
+    FTS5 기본 토크나이저는 띄어쓰기 단위라 "장학" 으로 "장학금" 을 못 찾음
+    """
+    out: list[str] = []
+    for word in _WORD_RE.findall(text.casefold()):
+        if len(word) == 1:
+            out.append(word)
+        else:
+            out.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return " ".join(out)
+
+
+def to_match_query(query: str) -> str | None:
+    """
+    검색어 → FTS5 MATCH 식. 단어마다 bigram 구(phrase), 단어끼리는 AND
+    (1글자 단어는 그 글자로 시작하는 bigram 접두 검색)
+    """
+    terms: list[str] = []
+    for word in _WORD_RE.findall(query.casefold()):
+        if len(word) == 1:
+            terms.append(f'"{word}"*')
+        else:
+            grams = " ".join(word[i : i + 2] for i in range(len(word) - 1))
+            terms.append(f'"{grams}"')
+    return " AND ".join(terms) or None
+
+
+def _doc_hash(n: Notice, text: str) -> str:
+    return hashlib.sha1(f"{n.title}\n{n.dept}\n{n.date}\n{text}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ArchivedNotice:
+    board: str
+    label: str
+    notice_id: str
+    title: str
+    url: str
+    dept: str | None
+    date: str | None
+
+
+class NoticeArchive:
+    """
+    크롤링한 공지 전체 보관 + 전문 검색 (SQLite FTS5, archive.db).
+    - notices: 원문(제목/링크/부서/날짜/본문), notice_fts: 제목/본문 bigram 색인
+    - add(): 내용이 바뀐 경우에만 색인 갱신 (watcher 가 공지 처리할 때마다 호출)
+    - search(): 제목 일치에 가중치를 둔 bm25 순위
+    """
+
+    def __init__(self, store: StateStore):
+        self.store = store
+        with store.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS notices ("
+                " id INTEGER PRIMARY KEY, board TEXT NOT NULL, notice_id TEXT NOT NULL,"
+                " label TEXT NOT NULL, title TEXT NOT NULL, url TEXT NOT NULL,"
+                " dept TEXT, date TEXT, body TEXT NOT NULL, doc_hash TEXT NOT NULL,"
+                " updated_at REAL NOT NULL, UNIQUE (board, notice_id))"
+            )
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS notice_fts USING fts5("
+                " title, body, tokenize = 'unicode61 remove_diacritics 0')"
+            )
+
+    # ── 색인 ──
+    def _upsert(self, conn, board: str, label: str, n: Notice, text: str) -> bool:
+        doc_hash = _doc_hash(n, text)
+        row = conn.execute(
+            "SELECT id, doc_hash FROM notices WHERE board = ? AND notice_id = ?",
+            (board, n.notice_id),
+        ).fetchone()
+        if row is not None and row[1] == doc_hash:
+            return False
+
+        values = (label, n.title, n.url, n.dept, n.date, text, doc_hash, time.time())
+        if row is None:
+            rowid = conn.execute(
+                "INSERT INTO notices (board, notice_id, label, title, url, dept, date,"
+                " body, doc_hash, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (board, n.notice_id, *values),
+            ).lastrowid
+        else:
+            rowid = row[0]
+            conn.execute(
+                "UPDATE notices SET label = ?, title = ?, url = ?, dept = ?, date = ?,"
+                " body = ?, doc_hash = ?, updated_at = ? WHERE id = ?",
+                (*values, rowid),
+            )
+            conn.execute("DELETE FROM notice_fts WHERE rowid = ?", (rowid,))
+        conn.execute(
+            "INSERT INTO notice_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (rowid, bigrams(f"{n.title} {n.dept or ''}"), bigrams(text)),
+        )
+        return True
+
+    def add_many(self, items: list[tuple[str, str, Notice, str]]) -> int:
+        """
+        (board, label, notice, text) 여러 개를 한 트랜잭션으로 색인. 바뀐 개수 반환
+        """
+        with self.store.transaction() as conn:
+            return sum(self._upsert(conn, *item) for item in items)
+
+    async def add(self, board: str, label: str, n: Notice, detail: dict) -> None:
+        text = detail.get("text") or ""
+        await self.store.run(self.add_many, [(board, label, n, text)])
+
+    async def aadd_many(self, items: list[tuple[str, str, Notice, str]]) -> int:
+        return await self.store.run(self.add_many, items)
+
+    def _known_ids(self, board: str, notice_ids: list[str]) -> set[str]:
+        if not notice_ids:
+            return set()
+        marks = ", ".join("?" * len(notice_ids))
+        rows = self.store.query(
+            f"SELECT notice_id FROM notices WHERE board = ? AND notice_id IN ({marks})",
+            (board, *notice_ids),
+        )
+        return {r[0] for r in rows}
+
+    # 읽기는 쓰기 잠금(BEGIN IMMEDIATE)/writer 스레드를 거치지 않음 → 크롤러의 보관 쓰기를 막지 않음
+    async def known_ids(self, board: str, notice_ids: list[str]) -> set[str]:
+        """이미 보관된 notice_id"""
+        return await asyncio.to_thread(self._known_ids, board, notice_ids)
+
+    # ── 검색 ──
+    def _search(self, query: str, limit: int) -> list[ArchivedNotice]:
+        match = to_match_query(query)
+        if match is None:
+            return []
+        rows = self.store.query(
+            "SELECT n.board, n.label, n.notice_id, n.title, n.url, n.dept, n.date"
+            " FROM notice_fts JOIN notices n ON n.id = notice_fts.rowid"
+            " WHERE notice_fts MATCH ?"
+            " ORDER BY bm25(notice_fts, 5.0, 1.0), n.id DESC LIMIT ?",
+            (match, limit),
+        )
+        return [ArchivedNotice(*r) for r in rows]
+
+    async def search(self, query: str, limit: int = ARCHIVE_SEARCH_LIMIT) -> list[ArchivedNotice]:
+        return await asyncio.to_thread(self._search, query, limit)
+
+
+_archive: NoticeArchive | None = None
+
+
+def get_notice_archive() -> NoticeArchive:
+    global _archive
+    if _archive is None:
+        _archive = NoticeArchive(StateStore(ARCHIVE_DB_FILE))
+    return _archive
@@ -0,0 +1,129 @@
+# services/notice_publisher.py
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+import discord
+from discord import AllowedMentions
+from discord.ext import commands
+
+from config import POSTED_RETENTION_DAYS
+from models.notice import NoticePayload
+from services.posted_index import PostedIndex
+from services.send_queue import SendQueue
+from services.state_store import get_state_store
+from services.subscriptions import SubscriptionService, get_subscriptions
+
+_posted_index: PostedIndex | None = None
+_send_queue: SendQueue | None = None
+
+
+def get_posted_index() -> PostedIndex:
+    global _posted_index
+    if _posted_index is None:
+        _posted_index = PostedIndex(get_state_store(), POSTED_RETENTION_DAYS)
+    return _posted_index
+
+
+def get_send_queue() -> SendQueue:
+    global _send_queue
+    if _send_queue is None:
+        _send_queue = SendQueue(get_posted_index())
+    return _send_queue
+
+
+class DiscordPublisher:
+    """
+    준비된 공지를 Discord 로 직접 보내는 쪽 (봇 프로세스 안에서만 사용).
+    NoticeWatcher(같은 프로세스) 와 OutboxConsumer(워커가 보낸 것) 가 같이 사용.
+    publisher 는 ready / is_delivered / posted_hash / publish / edit 만 있으면 됨
+    (다른 구현: services.outbox.OutboxPublisher)
+    """
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        *,
+        posted_index: PostedIndex | None = None,
+        send_queue: SendQueue | None = None,
+        subscriptions: SubscriptionService | None = None,
+    ):
+        self.bot = bot
+        self.posted_index = posted_index or get_posted_index()
+        self.send_queue = send_queue or get_send_queue()
+        self.subscriptions = subscriptions or get_subscriptions()
+        self._dm_tasks: set[asyncio.Task] = set()
+
+    async def ready(self) -> None:
+        await self.bot.wait_until_ready()
+
+    def is_delivered(self, board: str, notice_id: str) -> bool:
+        return self.send_queue.is_delivered(board, notice_id)
+
+    def posted_hash(self, board: str, notice_id: str) -> str | None:
+        """수정 반영 대상이면 마지막으로 올린 내용 해시, 아니면 None"""
+        item = self.posted_index.get(board, notice_id)
+        if item is None or item.coalesced:
+            return None
+        return item.content_hash
+
+    async def _channel(self, channel_id: int) -> discord.abc.Messageable:
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            channel = await self.bot.fetch_channel(channel_id)
+        if not isinstance(channel, discord.abc.Messageable):
+            raise TypeError(f"channel {channel_id} is not messageable")
+        return channel
+
+    async def publish(
+        self,
+        board: str,
+        label: str,
+        channel_id: int,
+        payloads: AsyncIterator[NoticePayload],
+    ) -> None:
+        """
+        준비되는 순서대로 전송 큐에 넣고, 전부 전달(또는 건너뜀)될 때까지 대기
+        """
+        channel = await self._channel(channel_id)
+        ready: list[NoticePayload] = []
+        sends: list[asyncio.Future] = []
+        try:
+            async with aclosing(payloads) as it:
+                async for payload in it:
+                    # 재시작 등으로 이미 보낸 공지(전달 기록 있음)는 건너뜀
+                    if self.is_delivered(board, payload.notice.notice_id):
+                        continue
+                    ready.append(payload)
+                    sends.append(self.send_queue.put(channel, board, payload))
+            messages = await asyncio.gather(*sends)
+        finally:
+            for send in sends:
+                send.cancel()
+
+        # 구독 DM 은 사이클을 막지 않도록 뒤에서
+        for payload, message in zip(ready, messages):
+            if message is not None and payload.dm_users:
+                self._notify_dm(label, payload)
+
+    async def edit(
+        self, board: str, channel_id: int, notice_id: str, content: str, content_hash: str
+    ) -> None:
+        item = self.posted_index.get(board, notice_id)
+        if item is None or item.coalesced or item.channel_id != channel_id:
+            return
+        if item.content_hash == content_hash:
+            return
+        channel = await self._channel(channel_id)
+        msg = await channel.fetch_message(item.message_id)  # type: ignore[attr-defined]
+        await msg.edit(content=content, allowed_mentions=AllowedMentions.none())
+        await self.posted_index.update_hash(item, content_hash)
+
+    def _notify_dm(self, label: str, payload: NoticePayload) -> None:
+        n = payload.notice
+        text = f"[{label}] {n.title}\n{n.url}"
+        task = asyncio.create_task(
+            self.subscriptions.send_dms(self.bot, payload.dm_users, text)
+        )
+        self._dm_tasks.add(task)
+        task.add_done_callback(self._dm_tasks.discard)
@@ -0,0 +1,129 @@
+# services/notice_scheduler.py
+import asyncio
+import heapq
+import itertools
+import time
+
+from config import SCHEDULER_MAX_CONCURRENT
+from utils.metrics import CYCLE_ERRORS, CYCLE_SECONDS, LAST_CYCLE
+from utils.profiler import CycleProfiler, ProfilerBusy
+from utils.trace_journal import span, start_cycle
+
+
+class NoticeScheduler:
+    """
+    모든 게시판 watcher 를 하나의 루프로 돌리는 스케줄러.
+    - 다음 실행 시각 기준 우선순위 큐(heap)
+    - 시작 시각을 간격 안에서 골고루 분산 (모든 게시판이 동시에 요청하지 않도록)
+    - 동시에 크롤링하는 게시판 수를 max_concurrent 로 제한
+    watcher 는 key / run_cycle() / next_interval() 만 있으면 됨
+    (Discord 와 무관: 봇 프로세스에서는 start(), 워커 프로세스에서는 run() 을 직접 실행)
+    """
+
+    def __init__(self, watchers: list, *, max_concurrent: int = SCHEDULER_MAX_CONCURRENT):
+        self.watchers = watchers
+        self.max_concurrent = max_concurrent
+        self._heap: list[tuple[float, int, object]] = []
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self._profile: dict[str, asyncio.Future] = {}  # key → 프로파일 보고서 (다음 사이클 1번)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    def get(self, key: str):
+        return next((w for w in self.watchers if w.key == key), None)
+
+    def profile_next(self, key: str) -> asyncio.Future:
+        """
+        해당 게시판의 다음 사이클을 프로파일링 (대기 중이면 바로 실행). 결과는 보고서 텍스트
+        """
+        watcher = self.get(key)
+        if watcher is None:
+            raise KeyError(key)
+        fut = self._profile.get(key)
+        if fut is None or fut.done():
+            fut = self._profile[key] = asyncio.get_running_loop().create_future()
+            for i, (_, seq, w) in enumerate(self._heap):
+                if w is watcher:
+                    self._heap[i] = (0.0, seq, w)
+                    heapq.heapify(self._heap)
+                    self._wake.set()
+                    break
+            # 지금 실행 중이면 끝난 뒤 바로 다시 실행됨 (_run_one)
+        return fut
+
+    def _push(self, due: float, watcher) -> None:
+        heapq.heappush(self._heap, (due, next(self._seq), watcher))
+        self._wake.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(self.max_concurrent)
+
+        # 첫 실행 분산: i번째 게시판은 자기 간격의 i/n 지점에서 시작
+        now = loop.time()
+        n = len(self.watchers)
+        for i, w in enumerate(self.watchers):
+            self._push(now + w.next_interval() * i / max(n, 1), w)
+
+        while True:
+            self._wake.clear()
+            if not self._heap:
+                await self._wake.wait()
+                continue
+
+            due = self._heap[0][0]
+            delay = due - loop.time()
+            if delay > 0:
+                # 실행 중인 게시판이 끝나서 더 이른 항목이 들어오면 바로 깨어남
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, watcher = heapq.heappop(self._heap)
+            task = loop.create_task(self._run_one(watcher, sem))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_one(self, watcher, sem: asyncio.Semaphore) -> None:
+        loop = asyncio.get_running_loop()
+        start_cycle(watcher.key)  # 이 task 안의 HTTP/파싱/전송 기록에 게시판/사이클 ID
+        profile = self._profile.pop(watcher.key, None)
+        try:
+            async with sem:
+                with CYCLE_SECONDS.time(watcher.key), span("cycle"):
+                    if profile is None:
+                        await watcher.run_cycle()
+                    else:
+                        await self._run_profiled(watcher, profile)
+            LAST_CYCLE.set(time.time(), watcher.key)
+        except Exception as e:
+            # 게시판 하나가 실패해도 스케줄러는 계속
+            CYCLE_ERRORS.inc(watcher.key, "cycle")
+            print(f"[scheduler] {watcher.key} cycle failed: {e!r}")
+        finally:
+            if watcher.key in self._profile:
+                self._push(loop.time(), watcher)
+            else:
+                self._push(loop.time() + watcher.next_interval(), watcher)
+
+    async def _run_profiled(self, watcher, profile: asyncio.Future) -> None:
+        profiler = CycleProfiler()
+        try:
+            await profiler.run(watcher.run_cycle)
+        except ProfilerBusy as e:
+            # 다른 게시판을 프로파일링 중이면 이번 사이클은 평소대로
+            if not profile.done():
+                profile.set_exception(e)
+            await watcher.run_cycle()
+        finally:
+            # 사이클이 실패해도 보고서는 전달 (실패 내용 포함)
+            if profiler.stats is not None and not profile.done():
+                profile.set_result(profiler.report(f"{watcher.key} cycle"))
@@ -1,66 +1,92 @@
 # services/notice_watcher.py
 import asyncio
-import json
-import os
-import io
-import discord
-from discord import AllowedMentions
-from discord.ext import commands, tasks
-from utils.http_client import get as http_get
+import hashlib
+import inspect
+from contextlib import aclosing
+from collections.abc import AsyncIterator
+from utils.http_client import aget as http_aget
 
 from config import (
-    SCHOOL_NOTICE_URL,
-    SCHOOL_NOTICE_CHANNEL_ID,
-    DEPT_NOTICE_URL,
-    DEPT_NOTICE_CHANNEL_ID,
     CHECK_INTERVAL_SECONDS,
-    STATE_FILE,
-    ROLE_ID_TEST,
-    ROLE_ID_1,
-    ROLE_ID_2,
-    ROLE_ID_3,
-    ROLE_ID_4,
+    POLL_MIN_INTERVAL_SECONDS,
+    POLL_MAX_INTERVAL_SECONDS,
+    NOTICE_FETCH_CONCURRENCY,
+    POSTED_RECHECK_LIMIT,
+    DETAIL_CACHE_DIR,
+    DETAIL_CACHE_MAX_BYTES,
+    DETAIL_MAX_TEXT,
+    IMAGE_STORE_DIR,
+    IMAGE_STORE_MAX_BYTES,
 )
 
 # from crawler.school_notice import fetch_school_notices
 # from crawler.dept_notice import fetch_dept_notices
-from crawler.notices import fetch_school_notices, fetch_dept_notices
-from crawler.notice_detail import (
-    fetch_notice_detail as fetch_school_notice_detail,
-    fetch_notice_detail as fetch_dept_notice_detail,
-)
-from models.notice import Notice
-
-allowed = AllowedMentions(roles=True)
+from crawler.notices import fetch_notices_async, iter_notices
+from crawler.notice_detail import fetch_notice_detail_async
+from crawler.detail_cache import DetailCache, detail_limits
+from crawler.list_cache import ListPageCache
+from crawler.text_normalizer import line_stats, looks_like_broken_table
+from models.board import BoardConfig
+from models.notice import Notice, NoticeImage, NoticePayload
+from services.notice_archive import NoticeArchive, get_notice_archive
+from services.posting_rate import PostingRateModel
+from services.send_queue import MESSAGE_MAX_CHARS
+from services.subscriptions import SubscriptionService, get_subscriptions
+from services.state_store import NS_LIST_CACHE, NS_NOTICE, get_state_store
+from utils.image_processing import prepare_image, sniff_image_type
+from utils.image_store import ImageStore
+from utils.metrics import CYCLE_ERRORS, IMAGE_BYTES
+from utils.trace_journal import span
+
+
+MAX_IMAGES = 2  # 공지 1개당 첨부 이미지 수
+# 상세 파싱 범위: 쓰지 않을 data:image 는 디코딩하지 않고 긴 본문/표는 잘라냄
+DETAIL_PARSE_LIMITS = {"max_images": MAX_IMAGES, "max_text": DETAIL_MAX_TEXT}
+
+# 학교/학과 watcher 가 같이 쓰는 캐시 (처음 쓸 때 생성: import 만으로 DB/캐시 폴더를 열지 않도록)
+_list_cache: ListPageCache | None = None
+_image_store: ImageStore | None = None
+_detail_cache: DetailCache | None = None
+_rate_model: PostingRateModel | None = None
+
+
+def get_list_cache() -> ListPageCache:
+    global _list_cache
+    if _list_cache is None:
+        _list_cache = ListPageCache(get_state_store(), NS_LIST_CACHE)
+    return _list_cache
+
+
+def get_image_store() -> ImageStore:
+    global _image_store
+    if _image_store is None:
+        _image_store = ImageStore(IMAGE_STORE_DIR, IMAGE_STORE_MAX_BYTES)
+    return _image_store
+
+
+def get_detail_cache() -> DetailCache:
+    global _detail_cache
+    if _detail_cache is None:
+        _detail_cache = DetailCache(DETAIL_CACHE_DIR, DETAIL_CACHE_MAX_BYTES, get_image_store())
+    return _detail_cache
+
+
+def get_rate_model() -> PostingRateModel:
+    global _rate_model
+    if _rate_model is None:
+        _rate_model = PostingRateModel(get_state_store())
+    return _rate_model
 
 
 # ─────────────────────────────────────────────────────────
-# STATE (학교/학과 key를 같은 파일에 같이 저장)
+# STATE (게시판별 마지막 공지 ID, SQLite 상태 저장소)
 # ─────────────────────────────────────────────────────────
-def _load_state() -> dict:
-    if not os.path.exists(STATE_FILE):
-        return {}
-    try:
-        with open(STATE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
-
-
-def _save_state(state: dict) -> None:
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
-
-
 def _get_last_id(state_key: str) -> str | None:
-    state = _load_state()
-    return state.get(state_key)
+    return get_state_store().get(NS_NOTICE, state_key)
 
 
-def _set_last_id(state_key: str, last_id: str) -> None:
-    state = _load_state()
-    state[state_key] = last_id
-    _save_state(state)
+async def _set_last_id(state_key: str, last_id: str) -> None:
+    await get_state_store().aset(NS_NOTICE, state_key, last_id)
 
 
 # ─────────────────────────────────────────────────────────
@@ -87,29 +113,88 @@ def _trim(text: str, limit: int = 1500) -> str:
 
 
 async def _download_bytes(url: str, referer: str | None = None) -> tuple[bytes, str]:
-    def _get():
-        headers = {"User-Agent": "Mozilla/5.0"}
-        if referer:
-            headers["Referer"] = referer
-        r = http_get(url, timeout=15, referer=referer)
-        r.raise_for_status()
-        return r.content, r.headers.get("Content-Type", "")
-
-    return await asyncio.to_thread(_get)
-
-
-def _looks_like_broken_table_text(t: str) -> bool:
-    lines = [ln.strip() for ln in t.splitlines() if ln.strip()]
-    if len(lines) < 40:
-        return False
-    short_ratio = sum(1 for ln in lines if len(ln) <= 2) / len(lines)
-    # "수", "시", "호" 같은 단문 라인이 비정상적으로 많으면 표/전단지 텍스트일 확률이 큼
-    if short_ratio >= 0.30:
-        return True
-    # 줄이 너무 많아도 위험 신호
-    if len(lines) >= 120:
-        return True
-    return False
+    r = await http_aget(url, timeout=15, referer=referer)
+    r.raise_for_status()
+    return r.content, r.headers.get("Content-Type", "")
+
+
+async def _call(func, *args, **kwargs):
+    # async 함수는 바로 await, 기존 동기 함수는 스레드에서 실행
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def _ext_from_content_type(ctype: str) -> str:
+    c = (ctype or "").lower()
+    if "png" in c:
+        return "png"
+    if "gif" in c:
+        return "gif"
+    if "webp" in c:
+        return "webp"
+    return "jpg"
+
+
+def _content_hash(n: Notice, detail: dict) -> str:
+    """
+    수정 여부 판단용 해시 (조회수처럼 계속 바뀌는 값은 제외)
+    """
+    h = hashlib.sha256()
+    parts = [n.title, n.dept or "", n.date or "", detail.get("text", "") or ""]
+    parts += detail.get("images", []) or []
+    parts += detail.get("files", []) or []
+    for blob in detail.get("image_blobs", []) or []:
+        parts.append(blob.get("sha256") or hashlib.sha256(blob.get("bytes") or b"").hexdigest())
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _render_message(
+    label: str,
+    n: Notice,
+    detail: dict,
+    *,
+    mention_roles: list[int] | None = None,
+    mention_users: list[int] | None = None,
+    edited: bool = False,
+) -> str:
+    body_raw = detail.get("text", "") or ""
+    files = detail.get("files", []) or []
+    has_any_image = bool(detail.get("images")) or bool(detail.get("image_blobs"))
+
+    msg = (
+        f"\n📢 **새 {label}**{' (✏️ 수정됨)' if edited else ''}\n"
+        f"[ **{n.title}** ]\n"
+        f"- 부서: {n.dept or '-'} / 날짜: {n.date or '-'} / 조회수: {n.views if n.views is not None else '-'}\n"
+    )
+
+    # ✅ 전단지/표로 인해 텍스트가 깨져보이면(그리고 이미지가 있으면) 본문 생략
+    if has_any_image and looks_like_broken_table(line_stats(body_raw)):
+        msg += "\n📌 본문이 표/전단지 형식이라 이미지와 링크로 안내합니다."
+    else:
+        body = _trim(body_raw, 1500)
+        if body:
+            msg += f"\n{body}"
+
+    if files:
+        msg += "\n\n📎 첨부파일이 있습니다. (공지 링크에서 확인)"
+
+    msg += f"\n\n🔗 공지 바로가기:\n{n.url}\n"
+    mentions = [f"<@&{r}>" for r in mention_roles or []]
+    mentions += [f"<@{u}>" for u in mention_users or []]
+    if mentions:
+        msg += "\n" + " ".join(mentions)
+    msg += "\n======================================="
+    return msg
+
+
+async def _in_order(jobs: list[asyncio.Task]) -> AsyncIterator[NoticePayload]:
+    # 준비는 동시에, 내보내기는 원래 순서대로
+    for job in jobs:
+        yield await job
 
 
 # ─────────────────────────────────────────────────────────
@@ -117,13 +202,18 @@ def _looks_like_broken_table_text(t: str) -> bool:
 # ─────────────────────────────────────────────────────────
 class NoticeWatcher:
     """
-    같은 로직으로 '학교공지/학과공지' 둘 다 돌릴 수 있도록 설정값만 주입하는 Watcher
+    같은 로직으로 여러 게시판을 돌릴 수 있도록 설정값만 주입하는 Watcher
+    (주기 실행은 NoticeScheduler 가 run_cycle() 을 호출)
+    보내기/수정은 publisher 가 담당:
+    - services.notice_publisher.DiscordPublisher: 같은 프로세스에서 Discord 로 바로
+    - services.outbox.OutboxPublisher: 워커 프로세스에서 outbox 로 (봇이 받아서 전송)
     """
 
     def __init__(
         self,
-        bot: commands.Bot,
+        publisher,
         *,
+        key: str,  # 게시판 식별자 (예: "school")
         list_url: str,
         channel_id: int,
         state_key: str,  # 예: "last_school_notice_id"
@@ -131,8 +221,20 @@ class NoticeWatcher:
         fetch_detail_func,
         limit: int = 10,
         label: str = "공지",  # 출력 앞머리 라벨
+        mention_roles: list[int] | None = None,  # 공지마다 멘션할 역할
+        interval_seconds: int = CHECK_INTERVAL_SECONDS,  # 학습 전 기본 간격
+        min_interval_seconds: int = POLL_MIN_INTERVAL_SECONDS,
+        max_interval_seconds: int = POLL_MAX_INTERVAL_SECONDS,
+        rate_model: PostingRateModel | None = None,  # 간격 자동 조절(선택)
+        list_cache: ListPageCache | None = None,  # 목록 조건부 요청용(선택)
+        iter_list_func=None,  # 여러 페이지 따라잡기용(선택)
+        detail_cache: DetailCache | None = None,  # 상세 파싱 결과 캐시(선택)
+        image_store: ImageStore | None = None,  # 없으면 공용 저장소
+        subscriptions: SubscriptionService | None = None,  # 없으면 공용 키워드 구독
+        archive: NoticeArchive | None = None,  # 없으면 공용 검색 보관소
     ):
-        self.bot = bot
+        self.publisher = publisher
+        self.key = key
         self.list_url = list_url
         self.channel_id = channel_id
         self.state_key = state_key
@@ -140,178 +242,325 @@ class NoticeWatcher:
         self.fetch_detail_func = fetch_detail_func
         self.limit = limit
         self.label = label
-        self._started = False
-
-    def start(self) -> None:
-        if self._started:
-            return
-        self._started = True
-        self.loop.start()
-
-    @tasks.loop(seconds=CHECK_INTERVAL_SECONDS)
-    async def loop(self):
-        await self.bot.wait_until_ready()
-
-        # 채널 가져오기
-        channel = self.bot.get_channel(self.channel_id)
-        if channel is None:
-            try:
-                channel = await self.bot.fetch_channel(self.channel_id)
-            except Exception:
-                return
-        if not isinstance(channel, discord.abc.Messageable):
-            return
+        self.mention_roles = mention_roles or []
+        self.interval_seconds = interval_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.rate_model = rate_model
+        self.list_cache = list_cache
+        self.iter_list_func = iter_list_func
+        self.detail_cache = detail_cache
+        self.image_store = image_store or get_image_store()
+        self.subscriptions = subscriptions or get_subscriptions()
+        self.archive = archive or get_notice_archive()
+        # 마지막으로 파싱한 1페이지 목록 (목록이 그대로인 사이클에서도 수정 확인용)
+        self._recent: list[Notice] | None = None
+
+    def next_interval(self) -> float:
+        if self.rate_model is None:
+            return self.interval_seconds
+        return self.rate_model.interval(
+            self.key,
+            default=self.interval_seconds,
+            min_interval=self.min_interval_seconds,
+            max_interval=self.max_interval_seconds,
+        )
+
+    async def run_cycle(self) -> None:
+        await self.publisher.ready()
+        try:
+            # 다른 프로세스(봇 ↔ 워커)에서 바뀐 키워드 구독 반영 (사이클마다 1번)
+            await self.subscriptions.arefresh()
+        except Exception:
+            CYCLE_ERRORS.inc(self.key, "subscriptions")
 
         last_id = _get_last_id(self.state_key)
 
-        # 목록 가져오기(스레드)
+        # 목록 가져오기 (캐시가 있으면 변경 없을 때 None)
+        # 시작 후 첫 사이클은 수정 확인에 쓸 목록이 없으므로 캐시 없이 한 번 파싱
+        use_cache = self.list_cache is not None and self._recent is not None
+        kwargs = {"cache": self.list_cache} if use_cache else {}
         try:
-            notices: list[Notice] = await asyncio.to_thread(
-                self.fetch_list_func, self.list_url, self.limit
+            notices: list[Notice] | None = await _call(
+                self.fetch_list_func, self.list_url, self.limit, **kwargs
             )
         except Exception:
+            CYCLE_ERRORS.inc(self.key, "list")
             return
 
+        if notices is None:
+            # 목록은 그대로여도 올린 공지 본문은 수정됐을 수 있음
+            await self._observe(0)
+            await self._recheck_posted(self._recent or [])
+            return
         if not notices:
+            await self._observe(0)
             return
 
         new_notices = _pick_new_notices(notices, last_id)
-        if not new_notices:
-            return
 
-        # 오래된 것부터
-        for n in reversed(new_notices):
+        # 1페이지가 전부 새 글이면 마지막으로 본 글이 나올 때까지 다음 페이지로 따라잡기
+        if (
+            last_id is not None
+            and self.iter_list_func is not None
+            and len(new_notices) == len(notices)
+        ):
+            try:
+                new_notices = await self._catch_up(notices, last_id)
+            except Exception:
+                CYCLE_ERRORS.inc(self.key, "catch_up")
+                return  # 중간에 실패하면 다음 사이클에 다시 시도
+
+        if new_notices:
+            # 오래된 것부터: 상세/이미지는 전부 동시에 받기 시작하고, 준비된 순서대로 publisher 로
+            # (지난 사이클에 이미 보낸 공지는 건너뜀)
+            ordered = [
+                n
+                for n in reversed(new_notices)
+                if not self.publisher.is_delivered(self.key, n.notice_id)
+            ]
+            sem = asyncio.Semaphore(NOTICE_FETCH_CONCURRENCY)
+            jobs = [asyncio.create_task(self._prepare(n, sem)) for n in ordered]
+            try:
+                # 전부 전달(또는 건너뜀)된 뒤에만 마지막 ID 갱신
+                with span("publish", notices=len(ordered)):
+                    await self.publisher.publish(
+                        self.key, self.label, self.channel_id, _in_order(jobs)
+                    )
+            finally:
+                for job in jobs:
+                    job.cancel()
+
+            # 최신 공지 ID 저장(가장 최신 0번)
+            await _set_last_id(self.state_key, notices[0].notice_id)
+
+        # 처음 실행(last_id 없음)은 기존 글이라 빈도 학습에서 제외
+        await self._observe(len(new_notices) if last_id is not None else 0)
+
+        self._recent = notices
+
+        # 이미 올린 최근 공지가 수정됐으면 메시지도 수정
+        new_ids = {n.notice_id for n in new_notices}
+        await self._recheck_posted([n for n in notices if n.notice_id not in new_ids])
+        await self._commit_list_cache()
+
+    async def _recheck_posted(self, notices: list[Notice]) -> None:
+        """
+        최근 공지 몇 개만 조건부 요청으로 싸게 다시 확인 → 해시가 바뀌었으면 메시지 수정
+        """
+        recent = [
+            (n, posted)
+            for n in notices
+            if (posted := self.publisher.posted_hash(self.key, n.notice_id)) is not None
+        ][:POSTED_RECHECK_LIMIT]
+
+        for n, posted in recent:
             try:
-                detail = await asyncio.to_thread(self.fetch_detail_func, n.url)
+                detail = await self._fetch_detail(n.url)
+                await self._archive(n, detail)
+                new_hash = _content_hash(n, detail)
+                if new_hash == posted:
+                    continue
+                content, _ = self._render(n, detail, edited=True)
+                await self.publisher.edit(
+                    self.key, self.channel_id, n.notice_id, content, new_hash
+                )
             except Exception:
-                detail = {"text": "", "images": [], "files": []}
+                CYCLE_ERRORS.inc(self.key, "recheck")
+                continue
 
-            body_raw = detail.get("text", "") or ""
-            image_urls = detail.get("images", []) or []
-            image_blobs = detail.get("image_blobs", []) or []
-            files = detail.get("files", []) or []
+    async def _prepare(self, n: Notice, sem: asyncio.Semaphore) -> NoticePayload:
+        """
+        상세 페이지 + 첨부할 이미지까지 받아서 보낼 내용 완성 (네트워크는 sem 으로 제한)
+        """
+        try:
+            async with sem:
+                detail = await self._get_detail(n.url)
+        except Exception:
+            CYCLE_ERRORS.inc(self.key, "detail")
+            detail = {"text": "", "images": [], "files": []}
+        else:
+            await self._archive(n, detail)
+
+        with span("render", notice=n.notice_id):
+            msg, dm_users = self._render(n, detail)
+        content_hash = _content_hash(n, detail)
+        images = await self._collect_images(
+            n,
+            detail.get("image_blobs", []) or [],
+            detail.get("images", []) or [],
+            sem,
+        )
+        return NoticePayload(
+            notice=n,
+            content=msg,
+            images=images,
+            content_hash=content_hash,
+            dm_users=dm_users,
+        )
+
+    def _render(
+        self, n: Notice, detail: dict, *, edited: bool = False
+    ) -> tuple[str, dict[int, list[str]]]:
+        """
+        메시지 본문 + DM 으로 보낼 구독자.
+        키워드 구독자 중 멘션 방식은 본문에 멘션, 2000자에 안 들어가는 나머지는 DM 으로
+        """
+        matched = self.subscriptions.match_notice(n, detail)
+        mention, dm = self.subscriptions.split_by_mode(matched)
+
+        base = _render_message(
+            self.label, n, detail, mention_roles=self.mention_roles, edited=edited
+        )
+        budget = MESSAGE_MAX_CHARS - len(base) - 1
+        fitted: list[int] = []
+        for user_id in mention:
+            cost = len(f"<@{user_id}> ")
+            if cost > budget:
+                dm.append(user_id)
+                continue
+            budget -= cost
+            fitted.append(user_id)
+
+        if not fitted:
+            msg = base
+        else:
+            msg = _render_message(
+                self.label,
+                n,
+                detail,
+                mention_roles=self.mention_roles,
+                mention_users=fitted,
+                edited=edited,
+            )
+        return msg, {u: matched[u] for u in dm}
 
-            msg = (
-                f"\n📢 **새 {self.label}**\n"
-                f"[ **{n.title}** ]\n"
-                f"- 부서: {n.dept or '-'} / 날짜: {n.date or '-'} / 조회수: {n.views if n.views is not None else '-'}\n"
+    async def _collect_images(
+        self,
+        n: Notice,
+        image_blobs: list[dict],
+        image_urls: list[str],
+        sem: asyncio.Semaphore,
+    ) -> list[NoticeImage]:
+        images: list[NoticeImage] = []
+
+        for blob in image_blobs:
+            if len(images) >= MAX_IMAGES:
+                break
+            sha = blob.get("sha256")
+            if sha is None:
+                raw = blob.get("bytes")
+                if not raw:
+                    continue
+                ext = (blob.get("ext") or "jpg").lower()
+                IMAGE_BYTES.inc("inline", amount=len(raw))
+                try:
+                    sha = await asyncio.to_thread(self.image_store.put, raw, ext)
+                except OSError:
+                    continue  # 저장 실패한 이미지만 빼고 공지는 그대로
+            elif not self.image_store.has(sha):
+                continue
+            images.append(await self._stored_image(sha, len(images) + 1))
+
+        # URL 이미지: 저장소에 있으면 네트워크 없이, 없으면 필요한 개수만큼 동시에 받고
+        # 실패한 만큼 다음 후보로
+        pending = list(image_urls)
+        while len(images) < MAX_IMAGES and pending:
+            need = MAX_IMAGES - len(images)
+            batch, pending = pending[:need], pending[need:]
+            results = await asyncio.gather(
+                *(self._fetch_image(url, n.url, sem) for url in batch),
+                return_exceptions=True,
             )
-            has_any_image = bool(image_urls) or bool(image_blobs)
-
-            # ✅ 전단지/표로 인해 텍스트가 깨져보이면(그리고 이미지가 있으면) 본문 생략
-            if has_any_image and _looks_like_broken_table_text(body_raw):
-                msg += "\n📌 본문이 표/전단지 형식이라 이미지와 링크로 안내합니다."
-            else:
-                body = _trim(body_raw, 1500)
-                if body:
-                    msg += f"\n{body}"
-
-            if files:
-                msg += "\n\n📎 첨부파일이 있습니다. (공지 링크에서 확인)"
-
-            msg += f"\n\n🔗 공지 바로가기:\n{n.url}\n"
-            msg += f"\n<@&{ROLE_ID_1}> <@&{ROLE_ID_2}> <@&{ROLE_ID_3}> <@&{ROLE_ID_4}>"
-            msg += "\n======================================="
-
-            # 이미지 있으면 첨부+embed, 없으면 텍스트
-            if has_any_image:
-                files_to_send: list[discord.File] = []
-                embeds_to_send: list[discord.Embed] = []
-
-                idx = 1
-
-                for blob in image_blobs:
-                    if idx > 2:
-                        break
-                    try:
-                        ext = (blob.get("ext") or "jpg").lower()
-                        raw = blob.get("bytes")
-                        if not raw:
-                            continue
-
-                        filename = f"notice_{idx}.{ext}"
-                        files_to_send.append(
-                            discord.File(fp=io.BytesIO(raw), filename=filename)
-                        )
-
-                        embed = discord.Embed()
-                        embed.set_image(url=f"attachment://{filename}")
-                        embeds_to_send.append(embed)
-
-                        idx += 1
-                    except Exception:
-                        continue
-
-                for url in image_urls:
-                    if idx > 2:
-                        break
-                    try:
-                        img_bytes, ctype = await _download_bytes(url, referer=n.url)
-
-                        ext = "jpg"
-                        c = (ctype or "").lower()
-                        if "png" in c:
-                            ext = "png"
-                        elif "gif" in c:
-                            ext = "gif"
-                        elif "webp" in c:
-                            ext = "webp"
-
-                        filename = f"notice_{idx}.{ext}"
-                        files_to_send.append(
-                            discord.File(fp=io.BytesIO(img_bytes), filename=filename)
-                        )
-
-                        embed = discord.Embed()
-                        embed.set_image(url=f"attachment://{filename}")
-                        embeds_to_send.append(embed)
-
-                        idx += 1
-                    except Exception:
-                        continue
-
-                if files_to_send:
-                    await channel.send(
-                        content=msg,
-                        files=files_to_send,
-                        embeds=embeds_to_send,
-                        allowed_mentions=allowed,
-                    )
-                else:
-                    # 이미지 전부 실패하면 텍스트만
-                    await channel.send(msg, allowed_mentions=allowed)
+            for res in results:
+                if isinstance(res, BaseException):
+                    continue
+                images.append(await self._stored_image(res, len(images) + 1))
+
+        return images
+
+    async def _fetch_image(self, url: str, referer: str, sem: asyncio.Semaphore) -> str:
+        sha = self.image_store.lookup(url)
+        if sha is not None:
+            return sha
+        async with sem:
+            data, ctype = await _download_bytes(url, referer=referer)
+        IMAGE_BYTES.inc("download", amount=len(data))
+        sniffed = sniff_image_type(data[:16])
+        ext = sniffed[1] if sniffed else _ext_from_content_type(ctype)
+        return await asyncio.to_thread(self.image_store.put, data, ext, key=url)
+
+    async def _stored_image(self, sha: str, idx: int) -> NoticeImage:
+        # 필요하면 축소/재압축한 버전으로 교체, 전송은 파일 경로로 (메모리 복사 없음)
+        sha = await prepare_image(self.image_store, sha)
+        ext = self.image_store.ext(sha)
+        return NoticeImage(f"notice_{idx}.{ext}", path=self.image_store.path(sha))
+
+    async def _get_detail(self, url: str) -> dict:
+        # 이미 처리한 페이지(재시도/재시작)는 네트워크 없이 캐시에서
+        if self.detail_cache:
+            cached = await asyncio.to_thread(
+                self.detail_cache.get, url, detail_limits(**DETAIL_PARSE_LIMITS)
+            )
+            if cached is not None:
+                return cached
+        return await self._fetch_detail(url)
+
+    async def _fetch_detail(self, url: str) -> dict:
+        if self.detail_cache:
+            return await _call(
+                self.fetch_detail_func, url, cache=self.detail_cache, **DETAIL_PARSE_LIMITS
+            )
+        return await _call(self.fetch_detail_func, url, **DETAIL_PARSE_LIMITS)
+
+    async def _catch_up(self, first_page: list[Notice], last_id: str) -> list[Notice]:
+        items: list[Notice] = []
+        async with aclosing(
+            self.iter_list_func(self.list_url, stop_id=last_id, first_page=first_page)
+        ) as it:
+            async for n in it:
+                items.append(n)
+        return items
+
+    async def _archive(self, n: Notice, detail: dict) -> None:
+        # 검색 색인 실패는 공지 전송에 영향 없음
+        try:
+            await self.archive.add(self.key, self.label, n, detail)
+        except Exception:
+            pass
 
-            else:
-                await channel.send(msg, allowed_mentions=allowed)
+    async def _observe(self, new_count: int) -> None:
+        if self.rate_model:
+            await self.rate_model.observe(self.key, new_count)
 
-        # 최신 공지 ID 저장(가장 최신 0번)
-        _set_last_id(self.state_key, notices[0].notice_id)
+    async def _commit_list_cache(self) -> None:
+        if self.list_cache:
+            await self.list_cache.commit(self.list_url)
 
 
 # ─────────────────────────────────────────────────────────
 # 생성 헬퍼(메인에서 간단히 사용)
 # ─────────────────────────────────────────────────────────
-def create_school_notice_watcher(bot: commands.Bot) -> NoticeWatcher:
+def create_notice_watcher(publisher, board: BoardConfig) -> NoticeWatcher:
     return NoticeWatcher(
-        bot,
-        list_url=SCHOOL_NOTICE_URL,
-        channel_id=SCHOOL_NOTICE_CHANNEL_ID,
-        state_key="last_school_notice_id",
-        fetch_list_func=fetch_school_notices,
-        fetch_detail_func=fetch_school_notice_detail,
-        limit=1,
-        label="학교 공지",
+        publisher,
+        key=board.key,
+        list_url=board.url,
+        channel_id=board.channel_id,
+        state_key=board.state_key,
+        fetch_list_func=fetch_notices_async,
+        fetch_detail_func=fetch_notice_detail_async,
+        label=board.label,
+        mention_roles=board.mention_roles,
+        interval_seconds=board.interval_seconds or CHECK_INTERVAL_SECONDS,
+        min_interval_seconds=board.min_interval_seconds or POLL_MIN_INTERVAL_SECONDS,
+        max_interval_seconds=board.max_interval_seconds or POLL_MAX_INTERVAL_SECONDS,
+        rate_model=get_rate_model(),
+        list_cache=get_list_cache(),
+        iter_list_func=iter_notices,
+        detail_cache=get_detail_cache(),
     )
 
 
-def create_dept_notice_watcher(bot: commands.Bot) -> NoticeWatcher:
-    return NoticeWatcher(
-        bot,
-        list_url=DEPT_NOTICE_URL,
-        channel_id=DEPT_NOTICE_CHANNEL_ID,
-        state_key="last_dept_notice_id",
-        fetch_list_func=fetch_dept_notices,
-        fetch_detail_func=fetch_dept_notice_detail,
-        limit=1,
-        label="학과 공지",
-    )
+def create_notice_watchers(publisher, boards: list[BoardConfig]) -> list[NoticeWatcher]:
+    return [create_notice_watcher(publisher, b) for b in boards]
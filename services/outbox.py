@@ -0,0 +1,320 @@
+# services/outbox.py
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import asdict
+
+from config import OUTBOX_POLL_SECONDS, OUTBOX_BATCH, OUTBOX_MAX_ATTEMPTS, POSTED_RETENTION_DAYS
+from models.notice import Notice, NoticeImage, NoticePayload
+from services.state_store import StateStore, get_state_store
+from utils.metrics import NOTICES_SENT
+
+KIND_POST = "post"
+KIND_EDIT = "edit"
+
+
+def _is_permanent(e: BaseException) -> bool:
+    """
+    다시 보내도 안 되는 오류: 깨진 payload, 4xx(429 제외: 삭제된 메시지, 권한 없음 등)
+    """
+    if isinstance(e, (ValueError, KeyError, TypeError)):  # json.JSONDecodeError 포함
+        return True
+    status = getattr(e, "status", None)  # discord.HTTPException
+    return isinstance(status, int) and 400 <= status < 500 and status != 429
+
+
+def _encode_payload(payload: NoticePayload) -> str:
+    return json.dumps(
+        {
+            "notice": asdict(payload.notice),
+            "content": payload.content,
+            # 이미지는 이미지 저장소 파일 경로로 전달 (두 프로세스가 같은 폴더 사용)
+            "images": [
+                {"filename": img.filename, "path": img.path}
+                for img in payload.images
+                if img.path
+            ],
+            "dm_users": {str(k): v for k, v in payload.dm_users.items()},
+        },
+        ensure_ascii=False,
+    )
+
+
+def _decode_payload(data: str, content_hash: str) -> NoticePayload:
+    d = json.loads(data)
+    return NoticePayload(
+        notice=Notice(**d["notice"]),
+        content=d["content"],
+        # 봇이 보내기 전에 저장소에서 지워진 이미지는 빼고 보냄
+        images=[
+            NoticeImage(img["filename"], path=img["path"])
+            for img in d["images"]
+            if os.path.exists(img["path"])
+        ],
+        content_hash=content_hash,
+        dm_users={int(k): v for k, v in d["dm_users"].items()},
+    )
+
+
+class Outbox:
+    """
+    워커 → 봇 전송 대기열 (state.db 의 outbox 테이블, 두 프로세스가 WAL 로 같이 사용).
+    - 같은 공지 게시(post)는 1번만, 수정(edit)은 내용 해시별로 1번만 들어감
+    - 봇이 보낸 뒤 delivered_at 기록, 보관 기간이 지나면 정리
+    - 계속 실패하는 항목은 failed_at/error 기록 후 더 이상 시도 안 함
+    """
+
+    def __init__(self, store: StateStore, retention_days: int = POSTED_RETENTION_DAYS):
+        self.store = store
+        self.retention = retention_days * 86400
+        with store.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL,"
+                " board TEXT NOT NULL, label TEXT NOT NULL, notice_id TEXT NOT NULL,"
+                " channel_id INTEGER NOT NULL, content_hash TEXT NOT NULL,"
+                " payload TEXT NOT NULL, created_at REAL NOT NULL, delivered_at REAL,"
+                " attempts INTEGER NOT NULL DEFAULT 0, failed_at REAL, error TEXT)"
+            )
+            columns = {r[1] for r in conn.execute("PRAGMA table_info(outbox)")}
+            if "attempts" not in columns:
+                conn.execute("ALTER TABLE outbox ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+                conn.execute("ALTER TABLE outbox ADD COLUMN failed_at REAL")
+                conn.execute("ALTER TABLE outbox ADD COLUMN error TEXT")
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS outbox_post"
+                " ON outbox (board, notice_id) WHERE kind = 'post'"
+            )
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS outbox_edit"
+                " ON outbox (board, notice_id, content_hash) WHERE kind = 'edit'"
+            )
+            conn.execute("DROP INDEX IF EXISTS outbox_pending")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_todo"
+                " ON outbox (id) WHERE delivered_at IS NULL AND failed_at IS NULL"
+            )
+
+    # ── 워커 쪽 ──
+    def _add(self, rows: list[tuple]) -> None:
+        with self.store.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO outbox (kind, board, label, notice_id, channel_id,"
+                " content_hash, payload, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    async def add(self, rows: list[tuple]) -> None:
+        await self.store.run(self._add, rows)
+
+    def has_post(self, board: str, notice_id: str) -> bool:
+        return bool(
+            self.store.query(
+                "SELECT 1 FROM outbox WHERE kind = 'post' AND board = ? AND notice_id = ?",
+                (board, notice_id),
+            )
+        )
+
+    def last_hash(self, board: str, notice_id: str) -> str | None:
+        rows = self.store.query(
+            "SELECT content_hash FROM outbox WHERE board = ? AND notice_id = ?"
+            " ORDER BY id DESC LIMIT 1",
+            (board, notice_id),
+        )
+        return rows[0][0] if rows else None
+
+    # ── 봇 쪽 ──
+    def pending(self, limit: int = OUTBOX_BATCH) -> list[tuple]:
+        return self.store.query(
+            "SELECT id, kind, board, label, notice_id, channel_id, content_hash, payload"
+            " FROM outbox WHERE delivered_at IS NULL AND failed_at IS NULL"
+            " ORDER BY id LIMIT ?",
+            (limit,),
+        )
+
+    def _mark_delivered(self, ids: list[int]) -> None:
+        now = time.time()
+        with self.store.transaction() as conn:
+            conn.executemany(
+                "UPDATE outbox SET delivered_at = ? WHERE id = ?", [(now, i) for i in ids]
+            )
+            conn.execute(
+                "DELETE FROM outbox WHERE (delivered_at IS NOT NULL OR failed_at IS NOT NULL)"
+                " AND created_at < ?",
+                (now - self.retention,),
+            )
+
+    async def mark_delivered(self, ids: list[int]) -> None:
+        await self.store.run(self._mark_delivered, ids)
+
+    def _mark_attempt(self, row_id: int, error: str, permanent: bool) -> bool:
+        """실패 1회 기록. 더 이상 시도하지 않게 됐으면 True"""
+        with self.store.transaction() as conn:
+            conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, error = ? WHERE id = ?",
+                (error, row_id),
+            )
+            conn.execute(
+                "UPDATE outbox SET failed_at = ? WHERE id = ? AND (? OR attempts >= ?)",
+                (time.time(), row_id, permanent, OUTBOX_MAX_ATTEMPTS),
+            )
+            row = conn.execute("SELECT failed_at FROM outbox WHERE id = ?", (row_id,)).fetchone()
+        return row is not None and row[0] is not None
+
+    async def mark_attempt(self, row_id: int, error: str, *, permanent: bool) -> bool:
+        return await self.store.run(self._mark_attempt, row_id, error, permanent)
+
+
+class OutboxPublisher:
+    """
+    워커 프로세스용 publisher: Discord 대신 outbox 에 기록 (NoticeWatcher 는 그대로 사용)
+    """
+
+    def __init__(self, outbox: Outbox):
+        self.outbox = outbox
+
+    async def ready(self) -> None:
+        return None
+
+    def is_delivered(self, board: str, notice_id: str) -> bool:
+        # 워커 입장에서는 outbox 에 넣은 순간 전달 완료 (봇이 알아서 보냄)
+        return self.outbox.has_post(board, notice_id)
+
+    def posted_hash(self, board: str, notice_id: str) -> str | None:
+        return self.outbox.last_hash(board, notice_id)
+
+    async def publish(
+        self,
+        board: str,
+        label: str,
+        channel_id: int,
+        payloads: AsyncIterator[NoticePayload],
+    ) -> None:
+        async with aclosing(payloads) as it:
+            async for p in it:
+                # 준비되는 대로 하나씩 기록 → 봇이 바로 보내기 시작
+                await self.outbox.add(
+                    [
+                        (
+                            KIND_POST,
+                            board,
+                            label,
+                            p.notice.notice_id,
+                            channel_id,
+                            p.content_hash,
+                            _encode_payload(p),
+                            time.time(),
+                        )
+                    ]
+                )
+                NOTICES_SENT.inc(board)
+
+    async def edit(
+        self, board: str, channel_id: int, notice_id: str, content: str, content_hash: str
+    ) -> None:
+        data = json.dumps({"content": content}, ensure_ascii=False)
+        await self.outbox.add(
+            [(KIND_EDIT, board, "", notice_id, channel_id, content_hash, data, time.time())]
+        )
+
+
+async def _one_by_one(payloads: list[NoticePayload]) -> AsyncIterator[NoticePayload]:
+    for p in payloads:
+        yield p
+
+
+class OutboxConsumer:
+    """
+    봇 프로세스 쪽: outbox 를 주기적으로 읽어서 DiscordPublisher 로 전송/수정
+    - 항목마다 따로 처리 (하나가 계속 실패해도 뒤 항목은 그대로 전송)
+    - 게시 글은 순서대로 동시에 전송 큐에 넣음 (묶어 보내기/속도 제한은 전송 큐가 처리)
+    - 실패하면 delivered_at 을 안 찍어서 다음에 다시 시도, 영구 오류(4xx/깨진 payload)나
+      OUTBOX_MAX_ATTEMPTS 번 실패하면 failed 로 표시하고 건너뜀
+    """
+
+    def __init__(self, publisher, outbox: Outbox, *, poll_seconds: float = OUTBOX_POLL_SECONDS):
+        self.publisher = publisher
+        self.outbox = outbox
+        self.poll_seconds = poll_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        await self.publisher.ready()
+        while True:
+            try:
+                rows = await asyncio.to_thread(self.outbox.pending)
+                if not rows:
+                    await asyncio.sleep(self.poll_seconds)
+                    continue
+                if not await self._dispatch(rows):
+                    # 다시 시도할 항목만 남았으면 잠깐 쉬었다가
+                    await asyncio.sleep(self.poll_seconds * 5)
+            except Exception as e:
+                print(f"[outbox] delivery failed, retrying: {e!r}")
+                await asyncio.sleep(self.poll_seconds * 5)
+
+    async def _deliver(self, row: tuple) -> None:
+        _, kind, board, label, notice_id, channel_id, content_hash, data = row
+        if kind == KIND_EDIT:
+            content = json.loads(data)["content"]
+            await self.publisher.edit(board, channel_id, notice_id, content, content_hash)
+        else:
+            payload = _decode_payload(data, content_hash)
+            await self.publisher.publish(board, label, channel_id, _one_by_one([payload]))
+
+    async def _deliver_in_order(self, rows: list[tuple]) -> list[BaseException | None]:
+        results: list[BaseException | None] = []
+        for row in rows:
+            try:
+                await self._deliver(row)
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def _dispatch(self, rows: list[tuple]) -> bool:
+        """
+        rows 를 전부 처리(전송/실패 기록). 하나라도 전달됐거나 포기했으면 True
+        """
+        # 채널마다 outbox 에 들어온 순서대로 하나씩 (게시 → 그 글의 수정 순서도 그대로 유지)
+        # 채널끼리는 동시에. _deliver 안에서 채널 조회 등으로 기다리는 동안 순서가 섞이지 않도록
+        by_channel: dict[int, list[tuple]] = {}
+        for row in rows:
+            by_channel.setdefault(row[5], []).append(row)
+        groups = list(by_channel.values())
+        per_channel = await asyncio.gather(*(self._deliver_in_order(g) for g in groups))
+        rows = [row for group in groups for row in group]
+        results = [result for group in per_channel for result in group]
+
+        progressed = False
+        delivered = []
+        for row, result in zip(rows, results):
+            if result is None:
+                delivered.append(row[0])
+                continue
+            permanent = _is_permanent(result)
+            gave_up = await self.outbox.mark_attempt(row[0], repr(result), permanent=permanent)
+            if gave_up:
+                print(f"[outbox] giving up on {row[1]} {row[2]}/{row[4]}: {result!r}")
+                progressed = True
+        if delivered:
+            await self.outbox.mark_delivered(delivered)
+            progressed = True
+        return progressed
+
+
+_outbox: Outbox | None = None
+
+
+def get_outbox() -> Outbox:
+    global _outbox
+    if _outbox is None:
+        _outbox = Outbox(get_state_store())
+    return _outbox
@@ -0,0 +1,108 @@
+# services/posted_index.py
+import time
+from dataclasses import dataclass
+
+from services.state_store import StateStore
+
+
+@dataclass
+class PostedNotice:
+    board: str
+    notice_id: str
+    content_hash: str
+    channel_id: int
+    message_id: int
+    posted_at: float
+    coalesced: bool = False  # 다른 공지와 합쳐 보낸 메시지 (수정 반영 안 함)
+
+
+class PostedIndex:
+    """
+    올린 공지 목록 (notice_id → Discord message_id, 내용 해시).
+    - 조회는 메모리 dict 로 O(1)
+    - retention_days 가 지난 기록은 저장할 때 같이 정리
+    """
+
+    def __init__(self, store: StateStore, retention_days: int):
+        self.store = store
+        self.retention = retention_days * 86400
+        with store.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS posted_notices ("
+                " board TEXT NOT NULL, notice_id TEXT NOT NULL,"
+                " content_hash TEXT NOT NULL, channel_id INTEGER NOT NULL,"
+                " message_id INTEGER NOT NULL, posted_at REAL NOT NULL,"
+                " coalesced INTEGER NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (board, notice_id))"
+            )
+            columns = {r[1] for r in conn.execute("PRAGMA table_info(posted_notices)")}
+            if "coalesced" not in columns:
+                conn.execute(
+                    "ALTER TABLE posted_notices"
+                    " ADD COLUMN coalesced INTEGER NOT NULL DEFAULT 0"
+                )
+            rows = conn.execute(
+                "SELECT board, notice_id, content_hash, channel_id, message_id,"
+                " posted_at, coalesced FROM posted_notices"
+            ).fetchall()
+        self._items: dict[tuple[str, str], PostedNotice] = {
+            (r[0], r[1]): PostedNotice(*r[:6], coalesced=bool(r[6])) for r in rows
+        }
+
+    def get(self, board: str, notice_id: str) -> PostedNotice | None:
+        return self._items.get((board, notice_id))
+
+    def _save(self, item: PostedNotice) -> None:
+        cutoff = time.time() - self.retention
+        with self.store.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO posted_notices"
+                " (board, notice_id, content_hash, channel_id, message_id,"
+                " posted_at, coalesced) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    item.board,
+                    item.notice_id,
+                    item.content_hash,
+                    item.channel_id,
+                    item.message_id,
+                    item.posted_at,
+                    int(item.coalesced),
+                ),
+            )
+            conn.execute("DELETE FROM posted_notices WHERE posted_at < ?", (cutoff,))
+        self._items[(item.board, item.notice_id)] = item
+        for key in [k for k, v in self._items.items() if v.posted_at < cutoff]:
+            del self._items[key]
+
+    async def record(
+        self,
+        board: str,
+        notice_id: str,
+        content_hash: str,
+        channel_id: int,
+        message_id: int,
+        *,
+        coalesced: bool = False,
+    ) -> None:
+        item = PostedNotice(
+            board,
+            notice_id,
+            content_hash,
+            channel_id,
+            message_id,
+            time.time(),
+            coalesced,
+        )
+        await self.store.run(self._save, item)
+
+    async def update_hash(self, item: PostedNotice, content_hash: str) -> None:
+        updated = PostedNotice(
+            item.board,
+            item.notice_id,
+            content_hash,
+            item.channel_id,
+            item.message_id,
+            item.posted_at,
+            item.coalesced,
+        )
+        await self.store.run(self._save, updated)
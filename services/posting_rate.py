@@ -0,0 +1,115 @@
+# services/posting_rate.py
+import math
+import time
+from datetime import datetime, timedelta, timezone
+
+from config import (
+    POLL_UTC_OFFSET_HOURS,
+    POLL_REQUEST_COST_SECONDS,
+    POLL_HISTORY_HALF_LIFE_DAYS,
+)
+from services.state_store import StateStore, NS_POSTING_RATE
+
+HOURS_PER_WEEK = 7 * 24
+WEEK_SECONDS = 7 * 86400
+MIN_HISTORY_WEEKS = 1.0  # 이보다 기록이 짧으면 학습값 대신 기본 간격 사용
+PRIOR_WEEKS = 1.0  # 시간대별 값이 적을 때 전체 평균 쪽으로 당기는 정도
+
+
+def _bucket(ts: float, tz: timezone) -> int:
+    """요일(월=0) × 24 + 시"""
+    t = datetime.fromtimestamp(ts, tz)
+    return t.weekday() * 24 + t.hour
+
+
+class PostingRateModel:
+    """
+    게시판별 새 글 빈도를 요일×시간(168칸)으로 학습해서 다음 확인 간격을 계산.
+    - observe(): 목록을 확인할 때마다 호출 (새 글 수 + 지난 확인 이후 흐른 시간)
+    - 오래된 기록은 반감기(half_life)로 서서히 잊음 (학기/방학 변화 반영)
+    - 간격 = sqrt(2 × 요청 비용 / 시간당 새 글 수)
+      (요청 1번의 비용을 "공지 지연 몇 초"로 보고, 요청 수와 평균 지연의 합을 최소화)
+    - 저장은 상태 저장소(StateStore)의 posting_rate namespace
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        *,
+        utc_offset_hours: float = POLL_UTC_OFFSET_HOURS,
+        request_cost: float = POLL_REQUEST_COST_SECONDS,
+        half_life_days: float = POLL_HISTORY_HALF_LIFE_DAYS,
+        namespace: str = NS_POSTING_RATE,
+    ):
+        self.store = store
+        self.tz = timezone(timedelta(hours=utc_offset_hours))
+        self.request_cost = request_cost
+        self.half_life = half_life_days * 86400
+        self.namespace = namespace
+
+    def _load(self, key: str) -> dict:
+        entry = self.store.get(self.namespace, key)
+        if not entry:
+            return {"counts": [0.0] * HOURS_PER_WEEK, "weeks": 0.0, "updated": None}
+        return entry
+
+    async def observe(self, key: str, new_count: int, now: float | None = None) -> None:
+        """
+        목록 확인 1회 기록. 새 글은 확인한 시각의 칸에 더함
+        (확인 간격이 짧은 시간대일수록 정확, 한가한 시간대 오차는 간격 계산에 영향 적음)
+        """
+        now = time.time() if now is None else now
+        entry = self._load(key)
+        counts = entry["counts"]
+        weeks = entry["weeks"]
+
+        if entry["updated"] is not None:
+            elapsed = max(0.0, now - entry["updated"])
+            decay = 0.5 ** (elapsed / self.half_life)
+            counts = [c * decay for c in counts]
+            weeks = weeks * decay + elapsed / WEEK_SECONDS
+
+        if new_count:
+            counts[_bucket(now, self.tz)] += new_count
+
+        await self.store.aset(
+            self.namespace, key, {"counts": counts, "weeks": weeks, "updated": now}
+        )
+
+    def rate_per_hour(self, key: str, now: float | None = None) -> float | None:
+        """
+        지금 시간대와 다음 시간대 중 더 바쁜 쪽의 시간당 새 글 수 (기록이 짧으면 None)
+        """
+        entry = self._load(key)
+        weeks = entry["weeks"]
+        if weeks < MIN_HISTORY_WEEKS:
+            return None
+
+        counts = entry["counts"]
+        # 각 칸은 1주일에 1시간씩 관측 → counts / weeks = 그 시간대의 시간당 글 수
+        overall = sum(counts) / (weeks * HOURS_PER_WEEK)
+        now = time.time() if now is None else now
+        b = _bucket(now, self.tz)
+        rates = [
+            (counts[i] + PRIOR_WEEKS * overall) / (weeks + PRIOR_WEEKS)
+            for i in (b, (b + 1) % HOURS_PER_WEEK)
+        ]
+        return max(rates)
+
+    def interval(
+        self,
+        key: str,
+        *,
+        default: float,
+        min_interval: float,
+        max_interval: float,
+        now: float | None = None,
+    ) -> float:
+        rate = self.rate_per_hour(key, now)
+        if rate is None:
+            seconds = default
+        elif rate <= 0:
+            seconds = max_interval
+        else:
+            seconds = math.sqrt(2 * self.request_cost * 3600 / rate)
+        return min(max(seconds, min_interval), max_interval)
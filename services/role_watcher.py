@@ -1,31 +1,13 @@
 # services/role_watcher.py
 from __future__ import annotations
 
-import json
-import os
 import discord
 from discord.ext import commands
 
+from services.state_store import NS_ROLE, get_state_store
 from ui.grade_role_view import GradeRoleView
 from ui.role_embed import build_role_embed
 
-ROLE_STATE_FILE = "role_state.json"
-
-
-def _load_role_state() -> dict:
-    if not os.path.exists(ROLE_STATE_FILE):
-        return {}
-    try:
-        with open(ROLE_STATE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
-
-
-def _save_role_state(state: dict) -> None:
-    with open(ROLE_STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
-
 
 class RoleWatcher:
     def __init__(self, bot: commands.Bot):
@@ -52,9 +34,9 @@ class RoleWatcher:
         """
         await self.bot.wait_until_ready()
 
-        state = _load_role_state()
-        channel_id = state.get("channel_id")
-        message_id = state.get("message_id")
+        store = get_state_store()
+        channel_id = store.get(NS_ROLE, "channel_id")
+        message_id = store.get(NS_ROLE, "message_id")
 
         if channel is None and channel_id:
             ch = self.bot.get_channel(channel_id)
@@ -80,7 +62,7 @@ class RoleWatcher:
                 pass
 
         msg = await channel.send(embed=embed, view=view)
-        _save_role_state({"channel_id": channel.id, "message_id": msg.id})
+        await store.aupdate(NS_ROLE, {"channel_id": channel.id, "message_id": msg.id})
         return msg
 
 
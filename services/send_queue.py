@@ -0,0 +1,253 @@
+# services/send_queue.py
+import asyncio
+import io
+import random
+from collections import deque
+from dataclasses import dataclass
+
+import aiohttp
+import discord
+from discord import AllowedMentions
+
+from config import (
+    SEND_RATE_PER_CHANNEL,
+    SEND_RATE_WINDOW_SECONDS,
+    SEND_MAX_RETRIES,
+    SEND_RETRY_BASE_SECONDS,
+)
+from models.notice import NoticePayload
+from services.posted_index import PostedIndex
+from utils.metrics import NOTICES_SENT, SEND_FAILURES, SEND_RETRIES, SEND_SECONDS
+from utils.trace_journal import span
+
+MESSAGE_MAX_CHARS = 2000  # Discord 메시지 본문 한도
+MESSAGE_MAX_EMBEDS = 10  # Discord 메시지 1개당 embed 한도
+
+allowed = AllowedMentions(roles=True)
+
+
+class TokenBucket:
+    """
+    채널별 전송 속도 제한 (window 초마다 rate 개, 남은 토큰만큼은 바로 전송)
+    """
+
+    def __init__(self, rate: int, window: float):
+        self.capacity = rate
+        self.refill = rate / window  # 초당 토큰
+        self.tokens = float(rate)
+        self.updated: float | None = None
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if self.updated is not None:
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.refill
+                )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.refill)
+
+
+@dataclass
+class _Job:
+    board: str
+    payload: NoticePayload
+    future: asyncio.Future
+
+
+class _PermanentError(Exception):
+    pass
+
+
+def _text_only(job: _Job) -> bool:
+    return not job.payload.images
+
+
+def _coalesced_content(batch: list[_Job]) -> str:
+    return "\n".join(j.payload.content for j in batch)
+
+
+class SendQueue:
+    """
+    공지 전송 전담 큐 (채널별로 순서대로 1개씩 처리).
+    - 채널별 토큰 버킷으로 Discord 속도 제한(채널당 5개/5초)에 걸리기 전에 조절
+    - 대기 중인 연속된 텍스트 공지는 2000자 안에서 메시지 1개로 합쳐서 전송
+    - 429/5xx/네트워크 오류는 지수 백오프로 재시도, 권한/형식 오류(4xx)는 그 공지만 건너뜀
+    - 전송 성공 즉시 공지별로 PostedIndex 에 기록 (= 전달 체크포인트)
+      → 사이클이 중간에 끊겨도 다음 사이클에서 이미 보낸 공지는 다시 안 보냄
+    """
+
+    def __init__(
+        self,
+        posted_index: PostedIndex,
+        *,
+        rate: int = SEND_RATE_PER_CHANNEL,
+        window: float = SEND_RATE_WINDOW_SECONDS,
+        max_retries: int = SEND_MAX_RETRIES,
+        retry_base: float = SEND_RETRY_BASE_SECONDS,
+    ):
+        self.posted_index = posted_index
+        self.rate = rate
+        self.window = window
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self._pending: dict[int, deque[_Job]] = {}
+        self._wake: dict[int, asyncio.Event] = {}
+        self._buckets: dict[int, TokenBucket] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+
+    def is_delivered(self, board: str, notice_id: str) -> bool:
+        return self.posted_index.get(board, notice_id) is not None
+
+    def put(
+        self, channel: discord.abc.Messageable, board: str, payload: NoticePayload
+    ) -> asyncio.Future:
+        """
+        전송 예약. future 는 보낸 Message (건너뛴 공지는 None)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        channel_id = channel.id  # type: ignore[attr-defined]
+
+        self._pending.setdefault(channel_id, deque()).append(_Job(board, payload, future))
+        self._wake.setdefault(channel_id, asyncio.Event()).set()
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = loop.create_task(self._worker(channel))
+        return future
+
+    # ── worker ──
+    def _next_batch(self, pending: deque[_Job]) -> list[_Job]:
+        batch = [pending.popleft()]
+        if not _text_only(batch[0]):
+            return batch
+        size = len(batch[0].payload.content)
+        while pending and _text_only(pending[0]):
+            extra = len(pending[0].payload.content) + 1  # 구분 줄바꿈
+            if size + extra > MESSAGE_MAX_CHARS:
+                break
+            size += extra
+            batch.append(pending.popleft())
+        return batch
+
+    async def _worker(self, channel: discord.abc.Messageable) -> None:
+        channel_id = channel.id  # type: ignore[attr-defined]
+        pending = self._pending[channel_id]
+        wake = self._wake[channel_id]
+        bucket = self._buckets.setdefault(channel_id, TokenBucket(self.rate, self.window))
+
+        while True:
+            if not pending:
+                wake.clear()
+                await wake.wait()
+                continue
+
+            batch = self._next_batch(pending)
+            # 기다리는 사이 취소된 항목(사이클 중단)은 보내지 않음
+            batch = [j for j in batch if not j.future.done()]
+            if not batch:
+                continue
+
+            try:
+                message = await self._send_with_retry(channel, bucket, batch)
+            except _PermanentError as e:
+                SEND_FAILURES.inc(batch[0].board)
+                print(f"[send_queue] skipped {[j.payload.notice.notice_id for j in batch]}: {e}")
+                for j in batch:
+                    if not j.future.done():
+                        j.future.set_result(None)
+                continue
+            except Exception as e:
+                SEND_FAILURES.inc(batch[0].board)
+                for j in batch:
+                    if not j.future.done():
+                        j.future.set_exception(e)
+                continue
+
+            try:
+                await self._checkpoint(channel_id, batch, message)
+            except Exception as e:
+                # 메시지는 이미 나갔지만 기록 실패 → 호출한 쪽에 알리고 worker 는 계속
+                print(f"[send_queue] checkpoint failed for message {message.id}: {e!r}")
+                for j in batch:
+                    if not j.future.done():
+                        j.future.set_exception(e)
+                continue
+            for j in batch:
+                if not j.future.done():
+                    j.future.set_result(message)
+
+    async def _checkpoint(
+        self, channel_id: int, batch: list[_Job], message: discord.Message
+    ) -> None:
+        coalesced = len(batch) > 1
+        for j in batch:
+            await self.posted_index.record(
+                j.board,
+                j.payload.notice.notice_id,
+                j.payload.content_hash,
+                channel_id,
+                message.id,
+                coalesced=coalesced,
+            )
+            NOTICES_SENT.inc(j.board)
+
+    async def _send_with_retry(
+        self,
+        channel: discord.abc.Messageable,
+        bucket: TokenBucket,
+        batch: list[_Job],
+    ) -> discord.Message:
+        board = batch[0].board
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            try:
+                # 채널 worker 는 여러 사이클이 같이 쓰므로 cycle 은 비움
+                with SEND_SECONDS.time(board), span(
+                    "send", board=board, cycle=None, notices=len(batch), attempt=attempt
+                ):
+                    return await self._send(channel, batch)
+            except discord.HTTPException as e:
+                if e.status != 429 and e.status < 500:
+                    raise _PermanentError(repr(e)) from e
+                if attempt == self.max_retries:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                if attempt == self.max_retries:
+                    raise
+            SEND_RETRIES.inc(board)
+            delay = self.retry_base * 2**attempt
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+        raise AssertionError("unreachable")
+
+    async def _send(
+        self, channel: discord.abc.Messageable, batch: list[_Job]
+    ) -> discord.Message:
+        if len(batch) > 1:
+            return await channel.send(_coalesced_content(batch), allowed_mentions=allowed)
+
+        payload = batch[0].payload
+        # 이미지 있으면 첨부+embed, 없으면(전부 실패 포함) 텍스트만
+        if not payload.images:
+            return await channel.send(payload.content, allowed_mentions=allowed)
+
+        # 재시도 때마다 새로 열어야 함 (discord.File 은 보내면서 스트림을 닫음)
+        files_to_send: list[discord.File] = []
+        embeds_to_send: list[discord.Embed] = []
+        for img in payload.images[:MESSAGE_MAX_EMBEDS]:
+            fp = img.path if img.path else io.BytesIO(img.data or b"")
+            files_to_send.append(discord.File(fp=fp, filename=img.filename))
+            embed = discord.Embed()
+            embed.set_image(url=f"attachment://{img.filename}")
+            embeds_to_send.append(embed)
+
+        return await channel.send(
+            content=payload.content,
+            files=files_to_send,
+            embeds=embeds_to_send,
+            allowed_mentions=allowed,
+        )
@@ -0,0 +1,169 @@
+# services/state_store.py
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from config import STATE_DB_FILE, STATE_FILE, ROLE_STATE_FILE, LIST_CACHE_FILE
+
+# 네임스페이스
+NS_NOTICE = "notice"  # 게시판별 마지막 공지 ID
+NS_ROLE = "role"  # 역할 선택 메시지 channel_id / message_id
+NS_LIST_CACHE = "list_cache"  # 목록 페이지 ETag/해시
+NS_POSTING_RATE = "posting_rate"  # 게시판별 요일×시간 새 글 빈도
+NS_BACKFILL = "backfill"  # 게시판별 과거 공지 가져오기 진행 상황
+
+# 최초 실행 시 가져올 기존 JSON 파일
+_LEGACY_FILES = (
+    (STATE_FILE, NS_NOTICE),
+    (ROLE_STATE_FILE, NS_ROLE),
+    (LIST_CACHE_FILE, NS_LIST_CACHE),
+)
+
+
+class StateStore:
+    """
+    SQLite(WAL) 기반 공용 상태 저장소.
+    - 읽기: 메모리 캐시에서 바로 (디스크 I/O 없음)
+    - 쓰기: 트랜잭션으로 원자적으로, async 쪽은 전용 writer 스레드에서 순서대로 실행
+    - 다른 서비스의 테이블도 transaction()/run()/query() 로 같은 DB를 사용
+    - 봇/워커 프로세스가 같은 파일을 같이 열 수 있음 (key/value 네임스페이스는 한쪽만 씀)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-db")
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")  # 다른 프로세스가 쓰는 중이면 대기
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS imported (path TEXT PRIMARY KEY)"
+        )
+        self._cache: dict[tuple[str, str], object] = {
+            (ns, k): json.loads(v)
+            for ns, k, v in self._conn.execute("SELECT namespace, key, value FROM kv")
+        }
+
+    # ── 트랜잭션 ──
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    async def run(self, fn, *args):
+        """
+        DB 작업을 writer 스레드에서 실행 (이벤트 루프 안 막음, 쓰기 순서 보장)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, fn, *args)
+
+    def query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """
+        읽기 전용 SQL (다른 프로세스가 쓴 최신 값까지 보임, 캐시 안 거침)
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ── key/value ──
+    def get(self, namespace: str, key: str, default=None):
+        return self._cache.get((namespace, key), default)
+
+    def get_all(self, namespace: str) -> dict:
+        return {k: v for (ns, k), v in self._cache.items() if ns == namespace}
+
+    def update(self, namespace: str, values: dict) -> None:
+        """
+        여러 키를 한 트랜잭션으로 저장
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO kv (namespace, key, value) VALUES (?, ?, ?)"
+                " ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                [
+                    (namespace, k, json.dumps(v, ensure_ascii=False))
+                    for k, v in values.items()
+                ],
+            )
+            for k, v in values.items():
+                self._cache[(namespace, k)] = v
+
+    def set(self, namespace: str, key: str, value) -> None:
+        self.update(namespace, {key: value})
+
+    async def aupdate(self, namespace: str, values: dict) -> None:
+        await self.run(self.update, namespace, values)
+
+    async def aset(self, namespace: str, key: str, value) -> None:
+        await self.run(self.update, namespace, {key: value})
+
+    # ── 기존 JSON 가져오기 ──
+    def import_json(self, path: str, namespace: str) -> None:
+        """
+        기존 JSON 상태 파일을 1회만 가져옴 (이미 가져온 파일은 무시)
+        """
+        key = os.path.abspath(path)
+        if self._conn.execute(
+            "SELECT 1 FROM imported WHERE path = ?", (key,)
+        ).fetchone():
+            # 이 프로세스가 캐시를 읽은 뒤에 다른 프로세스가 가져왔을 수 있음
+            with self._lock:
+                self._reload(self._conn, namespace)
+            return
+        data = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f) or {}
+            except Exception:
+                data = {}
+        # 표시와 데이터를 한 트랜잭션으로 (중간에 죽어도 반쯤 가져온 상태가 안 남음)
+        # 봇/워커가 동시에 시작해도 먼저 표시한 쪽만 가져옴, 이미 DB에 있는 값이 우선
+        with self.transaction() as conn:
+            cur = conn.execute("INSERT OR IGNORE INTO imported (path) VALUES (?)", (key,))
+            if cur.rowcount:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+                    [(namespace, k, json.dumps(v, ensure_ascii=False)) for k, v in data.items()],
+                )
+            # 다른 프로세스가 먼저 가져왔으면 그 결과를 캐시에 반영
+            self._reload(conn, namespace)
+
+    def _reload(self, conn: sqlite3.Connection, namespace: str) -> None:
+        for k, v in conn.execute(
+            "SELECT key, value FROM kv WHERE namespace = ?", (namespace,)
+        ):
+            self._cache[(namespace, k)] = json.loads(v)
+
+
+_store: StateStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """
+    앱 전체에서 같은 StateStore 1개 사용 (처음 호출 시 기존 JSON 자동 가져오기)
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            store = StateStore(STATE_DB_FILE)
+            for path, namespace in _LEGACY_FILES:
+                store.import_json(path, namespace)
+            _store = store
+        return _store
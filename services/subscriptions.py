@@ -0,0 +1,210 @@
+# services/subscriptions.py
+import asyncio
+import threading
+
+import discord
+
+from config import SUBSCRIPTION_MAX_KEYWORDS, SUBSCRIPTION_DM_CONCURRENCY
+from models.notice import Notice
+from services.keyword_matcher import KeywordMatcher, normalize_keyword
+from services.state_store import StateStore, get_state_store
+
+MODE_MENTION = "mention"  # 공지 메시지에서 멘션
+MODE_DM = "dm"  # 개인 메시지로 알림
+
+KEYWORD_MIN_LEN = 2
+KEYWORD_MAX_LEN = 30
+
+
+class SubscriptionError(Exception):
+    """사용자에게 그대로 보여줄 수 있는 구독 오류"""
+
+
+class SubscriptionService:
+    """
+    키워드 구독 (user_id ↔ keyword), 상태 저장소의 subscriptions 테이블에 저장.
+    - 키워드 → 구독자 dict + KeywordMatcher 1개로 공지 1건당 1번만 훑어서 매칭
+    - 구독 추가/취소는 matcher 에 바로 반영 (전체 재구성 없음)
+    - 다른 프로세스(봇 ↔ 워커)가 바꾼 경우는 subscription_version 을 보고 다시 읽음
+    """
+
+    def __init__(self, store: StateStore):
+        self.store = store
+        with store.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS subscriptions ("
+                " user_id INTEGER NOT NULL, keyword TEXT NOT NULL,"
+                " PRIMARY KEY (user_id, keyword))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS subscription_modes ("
+                " user_id INTEGER PRIMARY KEY, mode TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS subscription_version ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0), version INTEGER NOT NULL)"
+            )
+            conn.execute("INSERT OR IGNORE INTO subscription_version VALUES (0, 0)")
+
+        self._lock = threading.Lock()
+        self._version = -1
+        self.refresh()
+
+    def _load(self) -> None:
+        # 읽기만 하므로 쓰기 잠금 없이. 버전을 먼저 읽어서, 그 사이 바뀐 게 있으면 다음 refresh 때 다시 읽힘
+        version = self.store.query("SELECT version FROM subscription_version")[0][0]
+        rows = self.store.query("SELECT user_id, keyword FROM subscriptions")
+        modes = self.store.query("SELECT user_id, mode FROM subscription_modes")
+
+        by_keyword: dict[str, set[int]] = {}
+        by_user: dict[int, set[str]] = {}
+        for user_id, kw in rows:
+            by_keyword.setdefault(kw, set()).add(user_id)
+            by_user.setdefault(user_id, set()).add(kw)
+        matcher = KeywordMatcher(by_keyword)
+        with self._lock:
+            self._by_keyword = by_keyword
+            self._by_user = by_user
+            self._modes: dict[int, str] = dict(modes)
+            self.matcher = matcher
+            self._version = version
+
+    def refresh(self) -> None:
+        """
+        다른 프로세스가 구독을 바꿨으면 다시 읽기 (안 바뀌었으면 조회 1번으로 끝)
+        """
+        rows = self.store.query("SELECT version FROM subscription_version")
+        if not rows or rows[0][0] != self._version:
+            self._load()
+
+    async def arefresh(self) -> None:
+        """refresh() 를 스레드에서 (watcher 가 사이클마다 1번 호출)"""
+        await asyncio.to_thread(self.refresh)
+
+    def _bump(self, conn) -> None:
+        # 우리가 마지막으로 본 버전이 아니면 다른 프로세스 변경이 있었던 것 → 다음 refresh 때 다시 읽기
+        before = conn.execute("SELECT version FROM subscription_version").fetchone()[0]
+        conn.execute("UPDATE subscription_version SET version = version + 1")
+        self._version = before + 1 if before == self._version else -1
+
+    # ── 조회 ──
+    def keywords(self, user_id: int) -> list[str]:
+        return sorted(self._by_user.get(user_id, ()))
+
+    def mode(self, user_id: int) -> str:
+        return self._modes.get(user_id, MODE_MENTION)
+
+    def match(self, text: str) -> dict[int, list[str]]:
+        """
+        text 에 걸린 구독자 → 일치한 키워드 목록
+        """
+        with self._lock:
+            found = self.matcher.find(text)
+            users: dict[int, list[str]] = {}
+            for kw in sorted(found):
+                for user_id in self._by_keyword.get(kw, ()):
+                    users.setdefault(user_id, []).append(kw)
+        return users
+
+    def match_notice(self, n: Notice, detail: dict) -> dict[int, list[str]]:
+        # DB 조회 없음: 이 프로세스의 변경은 matcher 에 바로 반영, 다른 프로세스 변경은 arefresh() 로
+        return self.match(f"{n.title}\n{n.dept or ''}\n{detail.get('text') or ''}")
+
+    # ── 변경 ──
+    def _add(self, user_id: int, kw: str) -> None:
+        with self.store.transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO subscriptions (user_id, keyword) VALUES (?, ?)",
+                (user_id, kw),
+            )
+            self._bump(conn)
+        with self._lock:
+            self._by_keyword.setdefault(kw, set()).add(user_id)
+            self._by_user.setdefault(user_id, set()).add(kw)
+            self.matcher.add(kw)
+
+    def _remove(self, user_id: int, kw: str) -> None:
+        with self.store.transaction() as conn:
+            conn.execute(
+                "DELETE FROM subscriptions WHERE user_id = ? AND keyword = ?",
+                (user_id, kw),
+            )
+            self._bump(conn)
+        with self._lock:
+            self._by_user.get(user_id, set()).discard(kw)
+            users = self._by_keyword.get(kw)
+            if users is not None:
+                users.discard(user_id)
+                if not users:
+                    del self._by_keyword[kw]
+                    self.matcher.remove(kw)
+
+    def _set_mode(self, user_id: int, mode: str) -> None:
+        with self.store.transaction() as conn:
+            conn.execute(
+                "INSERT INTO subscription_modes (user_id, mode) VALUES (?, ?)"
+                " ON CONFLICT(user_id) DO UPDATE SET mode = excluded.mode",
+                (user_id, mode),
+            )
+            self._bump(conn)
+        self._modes[user_id] = mode
+
+    async def subscribe(self, user_id: int, keyword: str) -> str:
+        kw = normalize_keyword(keyword)
+        if not KEYWORD_MIN_LEN <= len(kw) <= KEYWORD_MAX_LEN:
+            raise SubscriptionError(
+                f"키워드는 {KEYWORD_MIN_LEN}~{KEYWORD_MAX_LEN}자로 입력하세요."
+            )
+        current = self._by_user.get(user_id, set())
+        if kw not in current and len(current) >= SUBSCRIPTION_MAX_KEYWORDS:
+            raise SubscriptionError(
+                f"키워드는 최대 {SUBSCRIPTION_MAX_KEYWORDS}개까지 구독할 수 있습니다."
+            )
+        await self.store.run(self._add, user_id, kw)
+        return kw
+
+    async def unsubscribe(self, user_id: int, keyword: str) -> bool:
+        kw = normalize_keyword(keyword)
+        if kw not in self._by_user.get(user_id, set()):
+            return False
+        await self.store.run(self._remove, user_id, kw)
+        return True
+
+    async def set_mode(self, user_id: int, mode: str) -> None:
+        await self.store.run(self._set_mode, user_id, mode)
+
+    # ── 알림 ──
+    def split_by_mode(self, users: dict[int, list[str]]) -> tuple[list[int], list[int]]:
+        """(멘션할 사용자, DM 보낼 사용자)"""
+        mention, dm = [], []
+        for user_id in sorted(users):
+            (dm if self.mode(user_id) == MODE_DM else mention).append(user_id)
+        return mention, dm
+
+    async def send_dms(
+        self, bot: discord.Client, users: dict[int, list[str]], text: str
+    ) -> None:
+        """
+        구독자에게 DM (DM 막힌 사용자 등 실패는 무시)
+        """
+        sem = asyncio.Semaphore(SUBSCRIPTION_DM_CONCURRENCY)
+
+        async def one(user_id: int, keywords: list[str]) -> None:
+            async with sem:
+                try:
+                    user = bot.get_user(user_id) or await bot.fetch_user(user_id)
+                    await user.send(f"🔔 구독 키워드: {', '.join(keywords)}\n{text}")
+                except Exception:
+                    pass
+
+        await asyncio.gather(*(one(u, kws) for u, kws in users.items()))
+
+
+_service: SubscriptionService | None = None
+
+
+def get_subscriptions() -> SubscriptionService:
+    global _service
+    if _service is None:
+        _service = SubscriptionService(get_state_store())
+    return _service
@@ -0,0 +1,83 @@
+# tests/bench_table_layout.py
+"""
+큰 합성 표로 table_to_grid / grid_to_codeblock 시간 재기 (pytest 대상 아님).
+
+    python tests/bench_table_layout.py --rows 400 --cols 40 --repeat 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from crawler.table_layout import grid_to_codeblock, table_to_grid  # noqa: E402
+from crawler.text_normalizer import normalize_cell_text  # noqa: E402
+
+
+def _cell_text(cell) -> str:
+    return normalize_cell_text(cell.get_text(" ", strip=True))
+
+
+def synthetic_table(rows: int, cols: int, span_ratio: float, seed: int) -> str:
+    """
+    rows×cols 표 HTML. span_ratio 비율의 셀에 rowspan/colspan, 셀 길이는 0~30자
+    """
+    rnd = random.Random(seed)
+    out = ["<table>"]
+    for _ in range(rows):
+        out.append("<tr>")
+        for _ in range(cols):
+            text = rnd.choice("가나다abc0123 ~:") * rnd.randint(0, 30)
+            if rnd.random() < span_ratio:
+                out.append(
+                    f'<td rowspan="{rnd.randint(1, 3)}" colspan="{rnd.randint(1, 2)}">{text}</td>'
+                )
+            else:
+                out.append(f"<td>{text}</td>")
+        out.append("</tr>")
+    out.append("</table>")
+    return "".join(out)
+
+
+def _time(func, repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="표 레이아웃 벤치마크 (합성 표)")
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--cols", type=int, default=40)
+    parser.add_argument("--span-ratio", type=float, default=0.1)
+    parser.add_argument("--max-width", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    html = synthetic_table(args.rows, args.cols, args.span_ratio, args.seed)
+    table = BeautifulSoup(html, "html.parser").table
+    grid = table_to_grid(table, _cell_text)
+
+    results = {
+        "table_to_grid": _time(lambda: table_to_grid(table, _cell_text), args.repeat),
+        "grid_to_codeblock": _time(lambda: grid_to_codeblock(grid, args.max_width), args.repeat),
+    }
+    print(f"{args.rows}x{args.cols} (grid {grid.rows}x{grid.cols}), repeat {args.repeat}")
+    for name, times in results.items():
+        print(
+            f"{name:<18} median {statistics.median(times) * 1000:8.2f} ms"
+            f"  min {min(times) * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+# tests/conftest.py
+import os
+import sys
+
+# 저장소 루트에서 `pytest` 로 실행해도 crawler/utils 를 import 할 수 있도록
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
@@ -0,0 +1,104 @@
+# tests/test_backfill.py
+"""
+가짜 목록 서버로 backfill 진행 확인 (네트워크 없음)
+"""
+import asyncio
+from urllib.parse import parse_qsl, urlsplit
+
+import backfill
+import crawler.notices
+from models.board import BoardConfig
+from services.notice_archive import NoticeArchive
+from services.state_store import NS_BACKFILL, StateStore
+from utils.http_client import HttpResponse
+
+LIST_URL = "https://www.yc.ac.kr/www/selectBbsNttList.do?bbsNo=1"
+BOARD = BoardConfig(key="school", label="학교 공지", url=LIST_URL, channel_id=1, state_key="k")
+
+
+class FakeBoardServer:
+    """
+    새 버전 게시판 흉내: article.offset / articleLimit 으로 페이지 (최신 글이 먼저)
+    ignore_limit=True 면 articleLimit 을 무시하고 항상 default_limit 개만 줌
+    """
+
+    def __init__(self, total: int, *, ignore_limit: bool = False, default_limit: int = 10):
+        self.ids = [str(90000 + i) for i in range(total, 0, -1)]
+        self.ignore_limit = ignore_limit
+        self.default_limit = default_limit
+
+    async def aget(self, url: str, timeout=None, headers=None) -> HttpResponse:
+        query = dict(parse_qsl(urlsplit(url).query))
+        offset = int(query.get("article.offset", 0))
+        limit = int(query.get("articleLimit", self.default_limit))
+        if self.ignore_limit:
+            limit = self.default_limit
+        rows = "".join(
+            f'<tr><td class="b-num-box">{ntt}</td><td class="b-td-left">'
+            f'<a href="?mode=view&amp;articleNo={ntt}" data-article-no="{ntt}">공지 {ntt}</a>'
+            f"</td></tr>"
+            for ntt in self.ids[offset : offset + limit]
+        )
+        html = f"<html><body><table><tbody>{rows}</tbody></table></body></html>"
+        return HttpResponse(url, 200, content=html.encode("utf-8"), encoding="utf-8")
+
+
+def _run(tmp_path, monkeypatch, server: FakeBoardServer, fetch_detail, **kwargs):
+    monkeypatch.setattr(crawler.notices, "http_aget", server.aget)
+    monkeypatch.setattr(backfill, "fetch_notice_detail_async", fetch_detail)
+    store = StateStore(str(tmp_path / "state.db"))
+    archive = NoticeArchive(StateStore(str(tmp_path / "archive.db")))
+
+    async def main():
+        job = backfill.Backfill(store, archive, page_size=50, **kwargs)
+        await job.run_board(BOARD)
+        return await archive.known_ids(BOARD.key, server.ids)
+
+    return store, asyncio.run(main())
+
+
+async def _detail_ok(url, **kwargs):
+    return {"text": f"본문 {url}"}
+
+
+def test_server_ignoring_article_limit(tmp_path, monkeypatch):
+    server = FakeBoardServer(137, ignore_limit=True)
+    store, known = _run(tmp_path, monkeypatch, server, _detail_ok)
+    assert known == set(server.ids)  # 50개씩 건너뛰지 않고 전부
+    progress = store.get(NS_BACKFILL, BOARD.key)
+    assert progress["done"] and progress["server_page_size"] == 10
+
+
+def test_server_honoring_article_limit(tmp_path, monkeypatch):
+    server = FakeBoardServer(137)
+    store, known = _run(tmp_path, monkeypatch, server, _detail_ok)
+    assert known == set(server.ids)
+    assert store.get(NS_BACKFILL, BOARD.key)["page_size"] == 50
+
+
+def test_small_board_is_not_mistaken_for_ignored_limit(tmp_path, monkeypatch):
+    server = FakeBoardServer(7)
+    store, known = _run(tmp_path, monkeypatch, server, _detail_ok)
+    assert known == set(server.ids)
+    assert store.get(NS_BACKFILL, BOARD.key)["server_page_size"] is None
+
+
+def test_failed_details_are_retried_on_next_run(tmp_path, monkeypatch):
+    server = FakeBoardServer(30)
+    broken = {"90005", "90017"}
+
+    async def flaky_detail(url, **kwargs):
+        if any(url.endswith(f"articleNo={ntt}") for ntt in broken):
+            raise ConnectionError("detail down")
+        return await _detail_ok(url)
+
+    monkeypatch.setattr(backfill, "BACKFILL_RETRIES", 0)
+    store, known = _run(tmp_path, monkeypatch, server, flaky_detail)
+    assert known == set(server.ids) - broken  # 빈 본문으로 저장하지 않음
+    progress = store.get(NS_BACKFILL, BOARD.key)
+    assert progress["done"] and {d["notice_id"] for d in progress["retry"]} == broken
+
+    broken.clear()
+    store, known = _run(tmp_path, monkeypatch, server, flaky_detail)
+    assert known == set(server.ids)
+    assert store.get(NS_BACKFILL, BOARD.key)["retry"] == []
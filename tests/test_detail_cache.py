@@ -0,0 +1,48 @@
+# tests/test_detail_cache.py
+import os
+import threading
+
+from crawler.detail_cache import DetailCache
+from utils.image_store import ImageStore
+
+URL = "https://www.yc.ac.kr/www/selectBbsNttView.do?nttNo=1"
+
+
+def _cache(root) -> DetailCache:
+    return DetailCache(str(root / "detail"), 10**7, ImageStore(str(root / "images"), 10**7))
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = _cache(tmp_path)
+    blob = {"mime": "image/png", "ext": "png", "bytes": b"\x89PNG data"}
+    detail = {"text": "본문", "images": [], "image_blobs": [blob], "files": []}
+    cache.put(URL, "h1", {"ETag": '"abc"'}, detail)
+
+    got = cache.get(URL)
+    assert got["text"] == "본문"
+    assert got["image_blobs"][0]["sha256"] == blob["sha256"]
+    assert cache.request_headers(URL) == {"If-None-Match": '"abc"'}
+
+
+def test_concurrent_writers_do_not_clash(tmp_path):
+    # 같은 폴더를 쓰는 캐시 두 개(봇/워커 프로세스 흉내)가 같은 글을 동시에 저장
+    caches = [_cache(tmp_path), _cache(tmp_path)]
+    errors: list[BaseException] = []
+
+    def write(cache: DetailCache, n: int) -> None:
+        try:
+            for i in range(50):
+                detail = {"text": f"{n}-{i}", "images": [], "image_blobs": [], "files": []}
+                cache.put(URL, f"h{i}", {}, detail)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(c, n)) for n, c in enumerate(caches * 2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert not [f for f in os.listdir(tmp_path / "detail") if f.endswith(".tmp")]
+    assert _cache(tmp_path).get(URL)["text"]
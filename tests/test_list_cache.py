@@ -0,0 +1,40 @@
+# tests/test_list_cache.py
+from crawler.list_cache import body_digest
+
+OLD_ROW = (
+    '<html><input name="token" value="{token}"><table><tbody><tr>'
+    '<td class="td_num2">12</td>'
+    '<td class="td_subject" onclick="fn_egov_inqire_notice(\'BBS\', \'{ntt}\')">제목</td>'
+    '<td class="td_name">학생처</td><td class="td_num">{views}</td>'
+    '<td class="td_datetime">2025-11-26</td>'
+    "</tr></tbody></table></html>"
+)
+NEW_ROW = (
+    '<table><tbody><tr><td class="b-num-box">12</td><td class="b-td-left">'
+    '<a href="?mode=view&amp;articleNo={ntt}" data-article-no="{ntt}">제목</a>'
+    '<span class="b-writer">학생처</span><span class="b-date">2025.11.26</span>'
+    '<span class="hit">조회수 {views}</span></td></tr></tbody></table>'
+)
+
+
+def _digest(template: str, **kw) -> str:
+    values = {"token": "a", "ntt": "100", "views": "5", **kw}
+    return body_digest(template.format(**values).encode("utf-8"))
+
+
+def test_view_count_is_ignored():
+    for template in (OLD_ROW, NEW_ROW):
+        assert _digest(template, views="5") == _digest(template, views="1,234")
+
+
+def test_outside_tbody_is_ignored():
+    assert _digest(OLD_ROW, token="a") == _digest(OLD_ROW, token="b")
+
+
+def test_row_change_is_detected():
+    for template in (OLD_ROW, NEW_ROW):
+        assert _digest(template, ntt="100") != _digest(template, ntt="101")
+    # 글 번호 칸(td_num2)은 조회수 칸으로 보지 않음
+    assert body_digest(b"<tbody><td class=\"td_num2\">1</td></tbody>") != body_digest(
+        b"<tbody><td class=\"td_num2\">2</td></tbody>"
+    )
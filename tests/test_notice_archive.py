@@ -0,0 +1,50 @@
+# tests/test_notice_archive.py
+import asyncio
+import sqlite3
+
+from models.notice import Notice
+from services.notice_archive import NoticeArchive
+from services.state_store import StateStore
+
+
+def _archive(tmp_path) -> NoticeArchive:
+    archive = NoticeArchive(StateStore(str(tmp_path / "archive.db")))
+    archive.add_many(
+        [
+            ("school", "학교 공지", Notice("1", "국가장학금 2차 신청 안내", "u1"), "신청 기간 안내"),
+            ("school", "학교 공지", Notice("2", "도서관 휴관", "u2"), "시험 기간 연장 운영"),
+        ]
+    )
+    return archive
+
+
+def test_search_and_known_ids(tmp_path):
+    archive = _archive(tmp_path)
+
+    async def main():
+        hits = await archive.search("장학금")
+        known = await archive.known_ids("school", ["1", "2", "3"])
+        return hits, known
+
+    hits, known = asyncio.run(main())
+    assert [h.notice_id for h in hits] == ["1"]
+    assert known == {"1", "2"}
+
+
+def test_reads_do_not_need_the_write_lock(tmp_path):
+    archive = _archive(tmp_path)
+    # 다른 프로세스(크롤러)가 쓰기 트랜잭션을 잡고 있어도 검색/ID 확인은 바로 끝나야 함
+    writer = sqlite3.connect(str(tmp_path / "archive.db"), isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        archive.store._conn.execute("PRAGMA busy_timeout=100")
+
+        async def main():
+            return await archive.search("휴관"), await archive.known_ids("school", ["2"])
+
+        hits, known = asyncio.run(main())
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    assert [h.notice_id for h in hits] == ["2"]
+    assert known == {"2"}
@@ -0,0 +1,30 @@
+# tests/test_table_layout.py
+from crawler.table_layout import TableGrid, fit_widths, grid_to_codeblock
+
+
+def test_empty_grid():
+    assert grid_to_codeblock(TableGrid(0, 0, [])) == ""
+
+
+def test_zero_column_grid_keeps_empty_codeblock():
+    # 셀 없는 <tr> 만 있는 표도 예전처럼 빈 코드블록 (행 수 + 구분선만큼 빈 줄)
+    assert grid_to_codeblock(TableGrid(1, 0, [])) == "```text\n\n\n```"
+    assert grid_to_codeblock(TableGrid(3, 0, [])) == "```text\n\n\n\n\n```"
+
+
+def test_codeblock_layout():
+    grid = TableGrid(2, 2, ["구분", "일정", "신청", "11.26~12.3"])
+    assert grid_to_codeblock(grid) == (
+        "```text\n"
+        "구분 | 일정        \n"
+        "---------------\n"
+        "신청 | 11.26~12.3\n"
+        "```"
+    )
+
+
+def test_fit_widths_respects_budget_and_minimum():
+    assert fit_widths([10, 20], 40) == [10, 20]
+    fitted = fit_widths([24, 24, 4], 30)
+    assert sum(fitted) == 30 and fitted[2] == 4
+    assert fit_widths([24, 24], 5) == [6, 6]  # min_width 보다 좁게는 안 줄임
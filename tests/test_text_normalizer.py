@@ -0,0 +1,30 @@
+# tests/test_text_normalizer.py
+"""
+정규화 결과가 규칙 정리 전 구현(crawler/notice_detail.py 의 _normalize_broken_text / _cell_text)과
+글자 하나까지 같은지 확인. fixtures/normalizer_golden.json 은 그 구현으로 만든 [입력, 기대 출력] 목록.
+"""
+import json
+import os
+
+import pytest
+
+from conftest import FIXTURES
+from crawler.text_normalizer import normalize_broken_text, normalize_cell_text
+
+with open(os.path.join(FIXTURES, "normalizer_golden.json"), encoding="utf-8") as f:
+    GOLDEN = json.load(f)
+
+
+@pytest.mark.parametrize("text, expected", GOLDEN["normalize_broken_text"])
+def test_normalize_broken_text_golden(text, expected):
+    assert normalize_broken_text(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", GOLDEN["normalize_cell_text"])
+def test_normalize_cell_text_golden(text, expected):
+    assert normalize_cell_text(text) == expected
+
+
+def test_sequential_date_rules():
+    # 4자리 규칙 결과("2025.11.26.")에 2자리 규칙이 이어서 적용되어야 함
+    assert normalize_broken_text("2025. 11. 26. 27. 28.") == "2025.11.26.27. \n28."
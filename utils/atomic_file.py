@@ -0,0 +1,20 @@
+# utils/atomic_file.py
+import os
+import tempfile
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    같은 폴더의 고유한 임시 파일에 쓰고 교체 (동시에 같은 파일을 써도 서로 안 덮어씀)
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
@@ -1,28 +1,199 @@
 # utils/http_client.py
+import asyncio
+import re
+import ssl
 import threading
-import requests
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import aiohttp
 import truststore
+from multidict import CIMultiDict
+
+from utils.metrics import HTTP_REQUESTS, HTTP_SECONDS
+from utils.trace_journal import span
+
+# 호스트별 동시 연결 수 / 전체 연결 수 상한
+MAX_CONNECTIONS_PER_HOST = 8
+MAX_CONNECTIONS = 32
+KEEPALIVE_TIMEOUT = 30
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",  # 기본 UA 통일
+    "Accept-Encoding": "gzip, deflate",
+}
 
-_lock = threading.Lock()
-_session: requests.Session | None = None
+_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([A-Za-z0-9_.:-]+)", re.IGNORECASE)
+
+_init_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_session: aiohttp.ClientSession | None = None
 _inited = False
 
 
+def detect_encoding(content: bytes) -> str:
+    """<meta charset> → utf-8 로 디코딩되면 utf-8 → 아니면 cp949"""
+    m = _CHARSET_RE.search(content[:4096])
+    if m:
+        return m.group(1).decode("ascii", "ignore")
+    try:
+        content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def decode_body(content: bytes, encoding: str | None = None) -> str:
+    """
+    응답 본문 → str (HttpResponse.text 와 같은 규칙, 프로세스 풀에서 바이트만 받아 디코딩할 때 사용)
+    """
+    enc = encoding or detect_encoding(content)
+    try:
+        return content.decode(enc, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def response_encoding(res: "HttpResponse") -> str:
+    """
+    응답 charset (헤더에 없으면 본문 앞부분으로 추정). 추정 시간도 추적 기록에 남김
+    """
+    with span("encoding", url=res.url) as f:
+        f["encoding"] = res.encoding or res.apparent_encoding
+    return f["encoding"]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+        self.url = url
+
+
+@dataclass
+class HttpResponse:
+    """
+    requests.Response 중 이 프로젝트에서 쓰는 부분만 흉내 낸 응답 객체.
+    (본문은 이미 다 읽은 상태라 커넥션은 풀로 반환됨)
+    """
+
+    url: str
+    status_code: int
+    headers: CIMultiDict = field(default_factory=CIMultiDict)  # 대소문자 무시
+    content: bytes = b""
+    encoding: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def apparent_encoding(self) -> str:
+        return detect_encoding(self.content)
+
+    @property
+    def text(self) -> str:
+        return decode_body(self.content, self.encoding)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HTTPError(self.status_code, self.url)
+
+
 def init_http() -> None:
     """
     앱 시작 시 1회만 호출 권장.
     - truststore SSL 주입 1회
-    - requests.Session 1회 생성
+    - 전용 이벤트 루프 스레드 + aiohttp 커넥션 풀 1회 생성
     """
-    global _inited, _session
-    if _inited:
-        return
+    global _inited, _loop, _session
+    with _init_lock:
+        if _inited:
+            return
+
+        truststore.inject_into_ssl()
 
-    truststore.inject_into_ssl()
-    s = requests.Session()
-    s.headers.update({"User-Agent": "Mozilla/5.0"})  # 기본 UA 통일
-    _session = s
-    _inited = True
+        loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=loop.run_forever, name="http-client", daemon=True
+        ).start()
+
+        async def _create_session() -> aiohttp.ClientSession:
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ssl=truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT),
+            )
+            # gzip/deflate 해제는 aiohttp가 자동으로 처리
+            return aiohttp.ClientSession(
+                connector=connector, headers=DEFAULT_HEADERS, auto_decompress=True
+            )
+
+        _session = asyncio.run_coroutine_threadsafe(_create_session(), loop).result()
+        _loop = loop
+        _inited = True
+
+
+async def _request(
+    url: str, timeout: float, headers: dict | None
+) -> HttpResponse:
+    assert _session is not None
+    host = urlsplit(url).hostname or ""
+    start = time.perf_counter()
+    try:
+        async with _session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as r:
+            content = await r.read()
+    except Exception:
+        HTTP_REQUESTS.inc(host, "error")
+        raise
+    finally:
+        HTTP_SECONDS.observe(time.perf_counter() - start, host)
+    HTTP_REQUESTS.inc(host, str(r.status))
+    return HttpResponse(
+        url=str(r.url),
+        status_code=r.status,
+        headers=CIMultiDict(r.headers),
+        content=content,
+        encoding=r.charset,
+    )
+
+
+def _build_headers(referer: str | None, headers: dict | None) -> dict | None:
+    h = {}
+    if headers:
+        h.update(headers)
+    if referer:
+        h["Referer"] = referer
+    return h or None
+
+
+async def aget(
+    url: str,
+    *,
+    timeout: float = 15,
+    referer: str | None = None,
+    headers: dict | None = None,
+) -> HttpResponse:
+    """
+    어느 이벤트 루프에서든 바로 await 가능한 GET.
+    실제 요청은 http 전용 루프의 공유 커넥션 풀에서 실행되므로
+    여러 요청을 gather하면 동시에 진행됨 (전역 Lock 없음).
+    """
+    if not _inited:
+        init_http()
+
+    fut = asyncio.run_coroutine_threadsafe(
+        _request(url, timeout, _build_headers(referer, headers)), _loop
+    )
+    with span("http", url=url) as f:
+        res = await asyncio.wrap_future(fut)
+        f["status"] = res.status_code
+        f["bytes"] = len(res.content)
+    return res
 
 
 def get(
@@ -31,19 +202,18 @@ def get(
     timeout: int = 15,
     referer: str | None = None,
     headers: dict | None = None
-) -> requests.Response:
+) -> HttpResponse:
     """
-    Session 재사용 + 멀티스레드 안전하게 Lock으로 감싸서 요청.
+    기존 동기 인터페이스 유지용 shim. (스레드에서 호출해도 안전)
     """
-    if not _inited or _session is None:
+    if not _inited:
         init_http()
 
-    h = {}
-    if headers:
-        h.update(headers)
-    if referer:
-        h["Referer"] = referer
-
-    # requests.Session은 thread-safe 보장이 약하므로 Lock으로 보호
-    with _lock:
-        return _session.get(url, timeout=timeout, headers=h or None)
+    fut = asyncio.run_coroutine_threadsafe(
+        _request(url, timeout, _build_headers(referer, headers)), _loop
+    )
+    with span("http", url=url) as f:
+        res = fut.result()
+        f["status"] = res.status_code
+        f["bytes"] = len(res.content)
+    return res
@@ -0,0 +1,187 @@
+# utils/image_processing.py
+import asyncio
+import importlib.util
+import io
+import struct
+
+from config import IMAGE_MAX_BYTES, IMAGE_MAX_DIMENSION
+from utils.image_store import ImageStore
+from utils.process_pool import get_process_pool
+
+_HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+
+# ─────────────────────────────────────────────────────────
+# 포맷/크기 확인 (헤더만 읽음, 디코딩 없음)
+# ─────────────────────────────────────────────────────────
+def sniff_image_type(head: bytes) -> tuple[str, str] | None:
+    """
+    매직 바이트로 실제 포맷 판별 → (mime, ext), 모르면 None
+    """
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png", "png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg", "jpg"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif", "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp", "webp"
+    if head[:2] == b"BM":
+        return "image/bmp", "bmp"
+    return None
+
+
+def probe_size(data: bytes) -> tuple[int, int] | None:
+    """
+    PNG/GIF/JPEG/WebP 헤더에서 (가로, 세로)만 읽음. 모르는 포맷이면 None
+    data 는 bytes 또는 mmap
+    """
+    # bytes / mmap 둘 다 되도록 슬라이싱/인덱싱만 사용
+    try:
+        if data[:8] == b"\x89PNG\r\n\x1a\n":
+            return struct.unpack(">II", data[16:24])
+        if data[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", data[6:10])
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            chunk = data[12:16]
+            if chunk == b"VP8 ":
+                w, h = struct.unpack("<HH", data[26:30])
+                return w & 0x3FFF, h & 0x3FFF
+            if chunk == b"VP8L":
+                b = data[21:25]
+                w = 1 + (((b[1] & 0x3F) << 8) | b[0])
+                h = 1 + (((b[3] & 0x0F) << 10) | (b[2] << 2) | ((b[1] & 0xC0) >> 6))
+                return w, h
+            if chunk == b"VP8X":
+                w = 1 + int.from_bytes(data[24:27], "little")
+                h = 1 + int.from_bytes(data[27:30], "little")
+                return w, h
+            return None
+        if data[:2] == b"\xff\xd8":
+            # SOFn 마커까지 세그먼트 건너뛰기
+            i = 2
+            n = len(data)
+            while i + 9 < n:
+                if data[i] != 0xFF:
+                    i += 1
+                    continue
+                marker = data[i + 1]
+                if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                    i += 2
+                    continue
+                seg_len = struct.unpack(">H", data[i + 2 : i + 4])[0]
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    h, w = struct.unpack(">HH", data[i + 5 : i + 9])
+                    return w, h
+                i += 2 + seg_len
+    except (struct.error, IndexError):
+        return None
+    return None
+
+
+def needs_processing(data, max_bytes: int, max_dim: int) -> bool:
+    if len(data) > max_bytes:
+        return True
+    size = probe_size(data)
+    return size is not None and max(size) > max_dim
+
+
+# ─────────────────────────────────────────────────────────
+# 축소/재압축 (프로세스 풀에서 실행)
+# ─────────────────────────────────────────────────────────
+def _encode(im, fmt: str, **kwargs) -> bytes:
+    buf = io.BytesIO()
+    im.save(buf, fmt, **kwargs)
+    return buf.getvalue()
+
+
+def shrink_image(path: str, max_bytes: int, max_dim: int) -> tuple[bytes, str] | None:
+    """
+    path 의 이미지를 max_dim 이하로 줄이고 max_bytes 이하가 될 때까지 재압축.
+    (원본 바이트를 프로세스 간에 넘기지 않도록 파일 경로로 받음)
+    - 투명도가 있으면 PNG 먼저 시도, 안 되면 흰 배경으로 합쳐 JPEG
+    - 실패하면 None (원본 그대로 사용)
+    """
+    from PIL import Image
+
+    with Image.open(path) as src:
+        src.draft("RGB", (max_dim, max_dim))  # JPEG는 축소 디코딩으로 빠르게
+        im = src.copy()
+
+    if max(im.size) > max_dim:
+        im.thumbnail((max_dim, max_dim), Image.LANCZOS)
+
+    has_alpha = im.mode in ("RGBA", "LA") or (
+        im.mode == "P" and "transparency" in im.info
+    )
+    if has_alpha:
+        im = im.convert("RGBA")
+        out = _encode(im, "PNG", optimize=True)
+        if len(out) <= max_bytes:
+            return out, "png"
+        bg = Image.new("RGB", im.size, (255, 255, 255))
+        bg.paste(im, mask=im.split()[-1])
+        im = bg
+    else:
+        im = im.convert("RGB")
+
+    while True:
+        for quality in (85, 75, 60):
+            out = _encode(im, "JPEG", quality=quality, optimize=True, progressive=True)
+            if len(out) <= max_bytes:
+                return out, "jpg"
+        if max(im.size) <= 256:
+            return None
+        im = im.resize((im.width * 3 // 4, im.height * 3 // 4), Image.LANCZOS)
+
+
+def _probe(store: ImageStore, sha: str, max_bytes: int, max_dim: int) -> bool:
+    view = store.open_view(sha)
+    try:
+        return needs_processing(view, max_bytes, max_dim)
+    finally:
+        view.close()
+
+
+async def prepare_image(
+    store: ImageStore,
+    sha: str,
+    *,
+    max_bytes: int = IMAGE_MAX_BYTES,
+    max_dim: int = IMAGE_MAX_DIMENSION,
+) -> str:
+    """
+    Discord 업로드 전에 필요할 때만 축소/재압축 → 업로드할 이미지의 sha
+    - 작은 이미지는 헤더만 보고(mmap) 그대로 통과
+    - 변환은 프로세스 풀에서 (이벤트 루프 안 막음)
+    - 변환 결과는 저장소에 원본 sha + 설정값 키로 남겨서 재사용
+    """
+    if not _HAS_PIL:
+        return sha
+
+    key = f"processed:{sha}:{max_bytes}:{max_dim}"
+    done = store.lookup(key)
+    if done is not None:
+        return done
+
+    # 헤더 확인도 파일을 여는 작업이라 스레드에서. 빈 파일(mmap 불가)/정리된 파일이면 원본 그대로
+    try:
+        if not await asyncio.to_thread(_probe, store, sha, max_bytes, max_dim):
+            return sha
+    except Exception:
+        return sha
+
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(
+            get_process_pool(), shrink_image, store.path(sha), max_bytes, max_dim
+        )
+    except Exception:
+        result = None
+
+    if result is None:
+        store.alias(key, sha)  # 줄일 수 없으면 원본 사용
+        return sha
+
+    data, ext = result
+    return await asyncio.to_thread(store.put, data, ext, key=key)
@@ -0,0 +1,118 @@
+# utils/image_store.py
+import hashlib
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+
+from utils.atomic_file import write_atomic
+
+
+class ImageStore:
+    """
+    내용 주소 기반(SHA-256) 이미지 디스크 저장소.
+    - 같은 바이트는 1번만 저장 (배너/로고 중복 제거)
+    - URL(또는 임의 키) → sha 매핑으로 다시 받을 필요 없이 재사용
+    - 전체 크기가 max_bytes 를 넘으면 오래 안 쓴 이미지부터 삭제(LRU)
+    - 읽기는 mmap 으로 (파일 내용을 파이썬 메모리로 복사하지 않음)
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+        data = self._load_index()
+        self._blobs: OrderedDict[str, dict] = OrderedDict(data.get("blobs") or {})
+        self._keys: dict[str, str] = data.get("keys") or {}
+        self._total = sum(m.get("size", 0) for m in self._blobs.values())
+
+    # ── index ──
+    def _load_index(self) -> dict:
+        if not os.path.exists(self._index_path):
+            return {}
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f) or {}
+        except Exception:
+            return {}
+
+    def _save_index(self) -> None:
+        data = json.dumps({"blobs": self._blobs, "keys": self._keys}).encode("utf-8")
+        write_atomic(self._index_path, data)
+
+    # ── 조회 ──
+    def path(self, sha: str) -> str:
+        return os.path.join(self.root, sha[:2], sha)
+
+    def has(self, sha: str) -> bool:
+        return sha in self._blobs and os.path.exists(self.path(sha))
+
+    def ext(self, sha: str) -> str:
+        return (self._blobs.get(sha) or {}).get("ext") or "jpg"
+
+    def size(self, sha: str) -> int:
+        return (self._blobs.get(sha) or {}).get("size", 0)
+
+    def lookup(self, key: str) -> str | None:
+        """
+        URL 등 키로 저장된 sha 찾기 (파일이 없으면 None)
+        """
+        sha = self._keys.get(key)
+        if sha is None or not self.has(sha):
+            return None
+        with self._lock:
+            self._blobs.move_to_end(sha)
+        return sha
+
+    def open_view(self, sha: str) -> mmap.mmap:
+        """
+        읽기 전용 mmap (사용 후 close 필요)
+        """
+        with open(self.path(sha), "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # ── 저장 ──
+    def put(self, data: bytes, ext: str, *, key: str | None = None) -> str:
+        sha = hashlib.sha256(data).hexdigest()
+        path = self.path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                write_atomic(path, data)
+            except OSError:
+                # 다른 스레드/프로세스가 같은 내용을 먼저 저장함 (Windows 는 열린 파일 교체 불가)
+                if not os.path.exists(path):
+                    raise
+
+        with self._lock:
+            if sha not in self._blobs:
+                self._blobs[sha] = {"size": len(data), "ext": ext}
+                self._total += len(data)
+            self._blobs.move_to_end(sha)
+            if key is not None:
+                self._keys[key] = sha
+            self._evict()
+            self._save_index()
+        return sha
+
+    def alias(self, key: str, sha: str) -> None:
+        with self._lock:
+            self._keys[key] = sha
+            self._save_index()
+
+    def _evict(self) -> None:
+        evicted = set()
+        while self._total > self.max_bytes and len(self._blobs) > 1:
+            sha, meta = self._blobs.popitem(last=False)
+            self._total -= meta.get("size", 0)
+            evicted.add(sha)
+            try:
+                os.remove(self.path(sha))
+            except OSError:
+                pass
+        if evicted:
+            self._keys = {k: v for k, v in self._keys.items() if v not in evicted}
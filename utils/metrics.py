@@ -0,0 +1,236 @@
+# utils/metrics.py
+"""
+프로세스 내 메트릭 (카운터/게이지/지연 히스토그램) + Prometheus 텍스트 형식 /metrics 엔드포인트.
+
+기록은 dict 갱신 1번(히스토그램은 버킷 이분 탐색 추가)이라 아무도 수집하지 않아도 부담 거의 없음.
+문자열 변환은 /metrics 요청이 들어왔을 때만 함.
+
+    HTTP_REQUESTS.inc("www.yc.ac.kr", "200")
+    with CYCLE_SECONDS.time("school"):
+        ...
+"""
+import asyncio
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from config import METRICS_HOST, METRICS_PORT
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 기본 버킷 (HTTP/파싱/전송은 수 ms ~ 수십 초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _fmt(v: float) -> str:
+    if isinstance(v, int):
+        return str(v)
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    return repr(v)
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (), registry=None):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()  # 스레드(to_thread)에서 기록하는 경우 대비
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _check(self, labelvalues: tuple) -> None:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name}: labels {self.labelnames} != {labelvalues}")
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labelvalues, amount: float = 1) -> None:
+        self._check(labelvalues)
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def get(self, *labelvalues) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, *labelvalues) -> None:
+        self._check(labelvalues)
+        with self._lock:
+            self._values[labelvalues] = value
+
+    def dec(self, *labelvalues, amount: float = 1) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: tuple[float, ...] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 → [버킷별 개수..., +Inf 개수, 합계]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labelvalues) -> None:
+        self._check(labelvalues)
+        i = bisect_left(self.buckets, value)  # value <= le 인 첫 버킷
+        with self._lock:
+            row = self._values.get(labelvalues)
+            if row is None:
+                row = self._values[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[i] += 1
+            row[-1] += value
+
+    @contextmanager
+    def time(self, *labelvalues):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labelvalues)
+
+    def count(self, *labelvalues) -> int:
+        row = self._values.get(labelvalues)
+        return sum(row[:-1]) if row else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        out: list[str] = []
+        for key, row in items:
+            total = 0
+            for le, n in zip((*self.buckets, math.inf), row):
+                total += n  # Prometheus 버킷은 누적
+                le_label = f'le="{_fmt(float(le))}"'
+                out.append(f"{self.name}_bucket{_labels(self.labelnames, key, le_label)} {total}")
+            out.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(row[-1])}")
+            out.append(f"{self.name}_count{_labels(self.labelnames, key)} {total}")
+        return out
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# ─────────────────────────────────────────────────────────
+# 공용 메트릭
+# ─────────────────────────────────────────────────────────
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by host and status (error = no response)", ("host", "status")
+)
+HTTP_SECONDS = Histogram("http_request_seconds", "HTTP request latency", ("host",))
+PARSE_SECONDS = Histogram("parse_seconds", "HTML parse time including executor wait", ("kind",))
+IMAGE_BYTES = Counter("image_bytes_total", "Image bytes by source (download / inline)", ("source",))
+SEND_SECONDS = Histogram("discord_send_seconds", "Discord send latency per attempt", ("board",))
+SEND_RETRIES = Counter("discord_send_retries_total", "Discord send attempts retried", ("board",))
+SEND_FAILURES = Counter("discord_send_failures_total", "Discord sends given up", ("board",))
+NOTICES_SENT = Counter("notices_sent_total", "Notices delivered (or written to the outbox)", ("board",))
+CYCLE_SECONDS = Histogram(
+    "notice_cycle_seconds",
+    "Notice watcher cycle duration",
+    ("board",),
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+CYCLE_ERRORS = Counter(
+    "notice_cycle_errors_total", "Errors swallowed inside a notice cycle", ("board", "stage")
+)
+LAST_CYCLE = Gauge("notice_last_cycle_timestamp_seconds", "Unix time of the last finished cycle", ("board",))
+
+
+# ─────────────────────────────────────────────────────────
+# /metrics 엔드포인트 (asyncio.start_server, 로컬 전용)
+# ─────────────────────────────────────────────────────────
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request = await asyncio.wait_for(reader.readline(), timeout=5)
+        # 헤더는 안 봄 (빈 줄까지 읽고 버림)
+        while await asyncio.wait_for(reader.readline(), timeout=5) not in (b"\r\n", b"\n", b""):
+            pass
+
+        parts = request.split()
+        if len(parts) >= 2 and parts[0] == b"GET" and parts[1].split(b"?")[0] == b"/metrics":
+            status, body = "200 OK", REGISTRY.render().encode("utf-8")
+        else:
+            status, body = "404 Not Found", b"not found\n"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii")
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+_server: asyncio.AbstractServer | None = None
+
+
+async def start_metrics_server(
+    port: int = METRICS_PORT, host: str = METRICS_HOST
+) -> asyncio.AbstractServer | None:
+    """
+    port 가 0 이면 안 띄움. 이미 떠 있거나 포트를 못 쓰면 그대로 진행 (봇/크롤링은 계속)
+    """
+    global _server
+    if not port or _server is not None:
+        return _server
+    try:
+        _server = await asyncio.start_server(_handle, host, port)
+    except OSError as e:
+        print(f"[metrics] {host}:{port} 사용 불가: {e}")
+        return None
+    print(f"[metrics] http://{host}:{port}/metrics")
+    return _server
@@ -0,0 +1,76 @@
+# utils/process_pool.py
+import asyncio
+import contextvars
+import functools
+import importlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from config import PARSE_EXECUTOR, PROCESS_POOL_WORKERS
+
+# 워커 프로세스가 뜰 때 미리 import (첫 작업에서 bs4/lxml import 비용이 안 들도록)
+PRELOAD_MODULES = ("crawler.notices", "crawler.notice_detail", "utils.image_processing")
+
+# True 인 task 에서는 파싱을 이 스레드에서 바로 실행 (utils.profiler 가 사이클 프로파일링할 때)
+PARSE_INLINE: contextvars.ContextVar[bool] = contextvars.ContextVar("parse_inline", default=False)
+
+_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+
+
+def _preload() -> None:
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    CPU 작업(이미지 변환, HTML 파싱)용 공용 프로세스 풀. 처음 쓸 때 1회 생성.
+    """
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_WORKERS or None, initializer=_preload
+            )
+        return _pool
+
+
+def warm_process_pool() -> None:
+    """
+    워커 프로세스를 미리 띄워둠 (기다리지 않음). 첫 공지 묶음이 프로세스 시작을 기다리지 않도록
+    """
+    pool = get_process_pool()
+    for _ in range(pool._max_workers):
+        pool.submit(_ping)
+
+
+async def run_parse(func, *args, **kwargs):
+    """
+    HTML 파싱 실행. PARSE_EXECUTOR="process" 면 프로세스 풀(GIL 밖에서 병렬), 아니면 스레드.
+    func 는 모듈 최상위 함수, 인자/결과는 pickle 가능한 값(bytes, dataclass 등)이어야 함
+    """
+    if PARSE_INLINE.get():
+        return func(*args, **kwargs)
+    if PARSE_EXECUTOR != "process":
+        return await asyncio.to_thread(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_process_pool(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
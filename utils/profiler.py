@@ -0,0 +1,98 @@
+# utils/profiler.py
+"""
+사이클 1번을 cProfile + tracemalloc 으로 실행하고 텍스트 보고서 만들기 (?profile 명령).
+요청이 있을 때만 켜지고, 평소 사이클에는 아무것도 하지 않음.
+"""
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+
+from utils.process_pool import PARSE_INLINE
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 20
+TOP_TRACEBACKS = 5
+TRACEMALLOC_FRAMES = 5
+
+# 보고서에서 뺄 파일 (프로파일러/asyncio 내부)
+_IGNORE_FILES = ("<frozen importlib._bootstrap>", "<unknown>", tracemalloc.__file__)
+
+
+class ProfilerBusy(RuntimeError):
+    """이미 다른 사이클을 프로파일링 중 (cProfile 은 동시에 1개만)"""
+
+
+_active = False
+
+
+class CycleProfiler:
+    def __init__(self):
+        self.stats: pstats.Stats | None = None
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.wall = 0.0
+        self.peak = 0
+        self.error: BaseException | None = None
+
+    async def run(self, func) -> None:
+        """
+        func(): 코루틴 함수. 예외는 기록 후 그대로 다시 발생
+        - HTML 파싱은 스레드/프로세스 풀 대신 이 스레드에서 실행 (cProfile 은 현재 스레드만 봄)
+        - 실행 중 같은 이벤트 루프의 다른 작업도 같이 잡힘
+        """
+        global _active
+        if _active:
+            raise ProfilerBusy("already profiling")
+        _active = True
+
+        token = PARSE_INLINE.set(True)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            await func()
+        except BaseException as e:
+            self.error = e
+            raise
+        finally:
+            profile.disable()
+            self.wall = time.perf_counter() - start
+            self.peak = tracemalloc.get_traced_memory()[1]
+            self.snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, f) for f in _IGNORE_FILES]
+            )
+            if started_tracing:
+                tracemalloc.stop()
+            PARSE_INLINE.reset(token)
+            self.stats = pstats.Stats(profile)
+            _active = False
+
+    def report(self, title: str) -> str:
+        out = io.StringIO()
+        out.write(f"# {title}\n")
+        out.write(f"wall {self.wall * 1000:.0f} ms, tracemalloc peak {self.peak / 1e6:.1f} MB\n")
+        out.write("(네트워크 대기는 asyncio base_events _run_once 의 select 시간으로 잡힘)\n")
+        if self.error is not None:
+            out.write(f"cycle failed: {self.error!r}\n")
+
+        if self.stats is not None:
+            self.stats.stream = out
+            for key in ("cumulative", "tottime"):
+                out.write(f"\n## top {TOP_FUNCTIONS} by {key}\n")
+                self.stats.sort_stats(key).print_stats(TOP_FUNCTIONS)
+
+        if self.snapshot is not None:
+            out.write(f"\n## top {TOP_ALLOCATIONS} allocation sites (live at end of cycle)\n")
+            for stat in self.snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                out.write(f"{stat}\n")
+            out.write(f"\n## top {TOP_TRACEBACKS} allocation tracebacks\n")
+            for stat in self.snapshot.statistics("traceback")[:TOP_TRACEBACKS]:
+                out.write(f"{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+                for line in stat.traceback.format():
+                    out.write(f"  {line}\n")
+        return out.getvalue()
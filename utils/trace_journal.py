@@ -0,0 +1,265 @@
+# utils/trace_journal.py
+"""
+크롤링 사이클 추적 기록 (JSONL, 1줄 = HTTP 요청 1번 또는 처리 단계 1번).
+
+    {"ts": ..., "stage": "http", "board": "school", "cycle": "1234-7", "url": ...,
+     "status": 200, "bytes": 51234, "ms": 83.2, "outcome": "ok"}
+
+- 기록은 큐에 넣기만 하고(막히지 않음) 파일 쓰기는 백그라운드 스레드가 모아서 함
+- 파일이 TRACE_JOURNAL_MAX_BYTES 를 넘으면 trace.jsonl.1, .2 ... 로 돌려씀
+- 요약: python -m utils.trace_journal [파일...] [--by board]  → 단계별 p50/p95/p99
+"""
+import argparse
+import atexit
+import contextvars
+import glob
+import itertools
+import json
+import math
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from config import (
+    TRACE_JOURNAL_FILE,
+    TRACE_JOURNAL_MAX_BYTES,
+    TRACE_JOURNAL_BACKUPS,
+    TRACE_JOURNAL_FLUSH_SECONDS,
+)
+
+QUEUE_MAX = 10000  # 쓰기가 밀려서 이보다 쌓이면 새 기록은 버림
+
+# 사이클 안에서 만든 task 에 그대로 이어지는 게시판/사이클 ID
+_board: contextvars.ContextVar[str | None] = contextvars.ContextVar("trace_board", default=None)
+_cycle: contextvars.ContextVar[str | None] = contextvars.ContextVar("trace_cycle", default=None)
+_cycle_seq = itertools.count(1)
+
+
+class TraceJournal:
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int = TRACE_JOURNAL_MAX_BYTES,
+        backups: int = TRACE_JOURNAL_BACKUPS,
+        flush_seconds: float = TRACE_JOURNAL_FLUSH_SECONDS,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_seconds = flush_seconds
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(QUEUE_MAX)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._writer, name="trace-journal", daemon=True)
+        self._thread.start()
+
+    def record(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._closed.set()
+        self._thread.join(timeout=5)
+
+    # ── 쓰기 스레드 ──
+    def _drain(self) -> list[dict]:
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _writer(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        while True:
+            closing = self._closed.wait(self.flush_seconds)
+            events = self._drain()
+            if events:
+                try:
+                    self._write(events)
+                except OSError as e:
+                    print(f"[trace] write failed: {e!r}")
+            if closing:
+                return
+
+    def _write(self, events: list[dict]) -> None:
+        data = "".join(
+            json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n" for e in events
+        ).encode("utf-8")
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+    def _rotate(self) -> None:
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+_journal: TraceJournal | None = None
+_journal_lock = threading.Lock()
+
+
+def get_journal() -> TraceJournal | None:
+    """TRACE_JOURNAL_FILE 이 비어 있으면 None (기록 안 함)"""
+    global _journal
+    if _journal is None and TRACE_JOURNAL_FILE:
+        with _journal_lock:
+            if _journal is None:
+                _journal = TraceJournal(TRACE_JOURNAL_FILE)
+                atexit.register(_journal.close)
+    return _journal
+
+
+def trace(stage: str, **fields) -> None:
+    """
+    기록 1건. board/cycle 은 현재 사이클 값이 기본 (fields 로 덮어쓸 수 있음)
+    """
+    journal = get_journal()
+    if journal is None:
+        return
+    event = {"ts": round(time.time(), 3), "stage": stage, "board": _board.get(), "cycle": _cycle.get()}
+    event.update(fields)
+    journal.record(event)
+
+
+@contextmanager
+def _span(stage: str, fields: dict):
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield fields  # 안에서 status/bytes 등을 채울 수 있음
+    except BaseException as e:
+        outcome = f"error:{type(e).__name__}"
+        raise
+    finally:
+        ms = round((time.perf_counter() - start) * 1000, 3)
+        trace(stage, **fields, ms=ms, outcome=outcome)
+
+
+def span(stage: str, **fields):
+    """
+    with span("parse", kind="detail", url=url) as f: ...  → 걸린 시간(ms)/결과(ok, error:종류) 기록
+    기록이 꺼져 있으면 아무것도 안 하는 컨텍스트
+    """
+    if get_journal() is None:
+        return nullcontext(fields)
+    return _span(stage, fields)
+
+
+def start_cycle(board: str) -> str:
+    """
+    현재 task(및 거기서 만든 task)의 기록에 board/cycle 을 붙임. NoticeScheduler 가 사이클마다 호출
+    """
+    cycle = f"{os.getpid()}-{next(_cycle_seq)}"
+    _board.set(board)
+    _cycle.set(cycle)
+    return cycle
+
+
+# ─────────────────────────────────────────────────────────
+# 요약 CLI
+# ─────────────────────────────────────────────────────────
+def _percentile(values: list[float], p: float) -> float:
+    # nearest-rank (values 는 정렬된 상태)
+    k = math.ceil(p / 100 * len(values)) - 1
+    return values[max(0, min(len(values) - 1, k))]
+
+
+def _read(paths: list[str]):
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 강제 종료로 잘린 마지막 줄
+
+
+def summarize(paths: list[str], by: list[str]) -> list[tuple]:
+    groups: dict[tuple, list[float]] = {}
+    errors: dict[tuple, int] = {}
+    for e in _read(paths):
+        if "ms" not in e:
+            continue
+        key = (e.get("stage"), *(e.get(k) for k in by))
+        groups.setdefault(key, []).append(e["ms"])
+        if str(e.get("outcome", "ok")) != "ok":
+            errors[key] = errors.get(key, 0) + 1
+
+    rows = []
+    for key, values in sorted(groups.items(), key=lambda kv: tuple(map(str, kv[0]))):
+        values.sort()
+        rows.append(
+            (
+                *key,
+                len(values),
+                errors.get(key, 0),
+                _percentile(values, 50),
+                _percentile(values, 95),
+                _percentile(values, 99),
+                values[-1],
+            )
+        )
+    return rows
+
+
+def worker_journal_path(path: str) -> str:
+    """RUN_MODE=split 워커 프로세스용 파일 (logs/trace.jsonl → logs/trace.worker.jsonl)"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.worker{ext}"
+
+
+def _journal_files(path: str) -> list[str]:
+    # 오래된 것부터 (trace.jsonl.3 → ... → trace.jsonl), 워커 파일도 같이
+    files: list[str] = []
+    for base in (path, worker_journal_path(path)):
+        rotated = []
+        for p in glob.glob(glob.escape(base) + ".*"):
+            suffix = p.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                rotated.append((int(suffix), p))
+        files.extend(p for _, p in sorted(rotated, reverse=True))
+        if os.path.exists(base):
+            files.append(base)
+    return files
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="추적 기록 요약 (단계별 지연 p50/p95/p99, ms)")
+    parser.add_argument("files", nargs="*", help=f"기록 파일 (기본: {TRACE_JOURNAL_FILE} 와 돌려쓴 파일)")
+    parser.add_argument("--by", action="append", default=[], help="추가로 나눌 필드 (board, kind, host ...)")
+    args = parser.parse_args(argv)
+
+    paths = args.files or _journal_files(TRACE_JOURNAL_FILE)
+    if not paths:
+        raise SystemExit("기록 파일이 없습니다.")
+
+    header = ("stage", *args.by, "count", "errors", "p50", "p95", "p99", "max")
+    rows = [
+        tuple(f"{v:.1f}" if isinstance(v, float) else str(v) for v in row)
+        for row in summarize(paths, args.by)
+    ]
+    widths = [max(len(h), *(len(r[i]) for r in rows)) if rows else len(h) for i, h in enumerate(header)]
+    for row in (header, *rows):
+        print("  ".join(v.ljust(w) if i <= len(args.by) else v.rjust(w) for i, (v, w) in enumerate(zip(row, widths))))
+
+
+if __name__ == "__main__":
+    main()